@@ -0,0 +1,263 @@
+# サンプルプログラムのベンチマーク
+# 生成(bf_core/bf_stack) → シミュレータ → bf2c.py での変換 → gcc → 実行 の
+# 各段階の時間とサイズを計測して JSON に出力し、基準の結果と比較する.
+# ../bf2c がビルド済みなら、C 版での変換の時間も計測する
+
+import argparse
+import importlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+import bf2c
+import bf_core
+import bf_ir
+import bf_stack
+from bf_sim import BfSim
+
+# 結果の形式のバージョン
+FORMAT_VERSION = 2
+
+# プログラム名 -> (モジュール名, 関数名)
+PROGRAMS = {
+    "mandelbrot": ("mandelbrot", "mandelbrot"),
+    "mandelbrot_color": ("mandelbrot_color", "mandelbrot"),
+    "julia": ("julia", "julia"),
+    "julia_color": ("julia_color", "julia"),
+}
+
+# 解像度 (columns, rows)
+RESOLUTIONS = [(16, 6), (64, 20), (128, 40)]
+
+# C 版の変換器(Makefile でビルドする)
+BF2C = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bf2c")
+
+# シミュレータで実行するステップ数(中間表現の命令数)
+SIM_STEPS = 200000
+
+# 指標ごとの良い方向. 1 は大きいほど良い, -1 は小さいほど良い
+METRICS = {
+    "generate_time": -1,
+    "generate_peak_kb": -1,
+    "program_chars": -1,
+    "commands": -1,
+    "sim_ir_ips": 1,
+    "translate_time": -1,
+    "bf2c_time": -1,
+    "bf2c_maxrss_kb": -1,
+    "c_chars": -1,
+    "compile_time": -1,
+    "compile_maxrss_kb": -1,
+    "run_time": -1,
+    "run_maxrss_kb": -1,
+}
+
+# 悪化とみなす変化率のデフォルト
+THRESHOLD = 0.10
+
+
+def parse_resolution(text: str) -> Tuple[int, int]:
+    """
+    "COLUMNSxROWS" を (columns, rows) にする
+
+    >>> parse_resolution("128x40")
+    (128, 40)
+    """
+    (columns, rows) = text.lower().split("x")
+    return (int(columns), int(rows))
+
+
+def _measure(command: List[str]) -> Tuple[float, int]:
+    """run command. returns (time, max RSS(KB))"""
+    start = time.perf_counter()
+    with open(os.devnull, "wb") as devnull:
+        proc = subprocess.Popen(command, stdin=subprocess.DEVNULL,
+                                stdout=devnull)
+        (_, status, usage) = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    # Popen に終了を知らせる(wait4 で回収済み)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+    return (elapsed, usage.ru_maxrss)
+
+
+def _clear_caches():
+    """clear macro caches so that every generation starts cold"""
+    bf_stack.macro_cache.clear()
+    bf_stack._rebuild_value.cache_clear()
+    bf_core._init_value_sub.cache_clear()
+
+
+def bench_program(name: str,
+                  columns: int,
+                  rows: int,
+                  sim_steps: int = SIM_STEPS,
+                  native: bool = True) -> Dict[str, Any]:
+    """measure all stages of 1 program"""
+    (module_name, function_name) = PROGRAMS[name]
+    generate = getattr(importlib.import_module(module_name), function_name)
+    result: Dict[str, Any] = {"program": name, "columns": columns,
+                              "rows": rows}
+
+    # 前のプログラムや解像度で温まったキャッシュを使わないようにする
+    _clear_caches()
+    tracemalloc.start()
+    start = time.perf_counter()
+    program = generate(columns, rows)
+    result["generate_time"] = time.perf_counter() - start
+    result["generate_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+    tracemalloc.stop()
+    result["program_chars"] = len(program)
+    result["commands"] = sum(program.count(ch) for ch in bf_ir.COMMANDS)
+
+    sim = BfSim(program, stdout=io.BytesIO(), engine="ir")
+    sim._compile_ir()
+    start = time.perf_counter()
+    steps = sim.run(sim_steps)
+    elapsed = time.perf_counter() - start
+    # ステップ数はまとめた後の中間表現の命令数で、ソースの命令数ではない
+    result["sim_ir_steps"] = steps
+    result["sim_ir_ips"] = steps / elapsed if 0 < elapsed else 0.0
+
+    start = time.perf_counter()
+    c_source = bf2c.translate(program, f"{name} {columns}x{rows}")
+    result["translate_time"] = time.perf_counter() - start
+    result["c_chars"] = len(c_source)
+
+    if not native:
+        return result
+    with tempfile.TemporaryDirectory() as work:
+        if os.access(BF2C, os.X_OK):
+            bf_path = os.path.join(work, f"{name}.bf")
+            with open(bf_path, "w") as bf_file:
+                bf_file.write(program)
+            (result["bf2c_time"], result["bf2c_maxrss_kb"]) = _measure(
+                [BF2C, "-o", os.path.join(work, f"{name}_bf2c.c"), bf_path])
+        if shutil.which("gcc") is not None:
+            c_path = os.path.join(work, f"{name}.c")
+            exe_path = os.path.join(work, name)
+            with open(c_path, "w") as c_file:
+                c_file.write(c_source)
+            (result["compile_time"], result["compile_maxrss_kb"]) = \
+                _measure(["gcc", "-O2", "-o", exe_path, c_path])
+            (result["run_time"], result["run_maxrss_kb"]) = \
+                _measure([exe_path])
+    return result
+
+
+def run_bench(names: List[str],
+              resolutions: List[Tuple[int, int]],
+              sim_steps: int = SIM_STEPS,
+              native: bool = True) -> Dict[str, Any]:
+    """measure all programs and resolutions"""
+    results = [bench_program(name, columns, rows, sim_steps, native)
+               for name in names for (columns, rows) in resolutions]
+    return {
+        "version": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any],
+            current: Dict[str, Any],
+            threshold: float = THRESHOLD,
+            thresholds: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    基準の結果と比較して、しきい値より悪化した指標を返す
+
+    >>> base = {"results": [{"program": "a", "columns": 2, "rows": 1,
+    ...                      "run_time": 1.0, "sim_ir_ips": 100.0}]}
+    >>> cur = {"results": [{"program": "a", "columns": 2, "rows": 1,
+    ...                     "run_time": 1.5, "sim_ir_ips": 95.0}]}
+    >>> compare(base, cur)
+    ['a 2x1 run_time: 1 -> 1.5 (+50.0%)']
+    >>> compare(base, cur, thresholds={"run_time": 0.6})
+    []
+    """
+    thresholds = thresholds or {}
+    base_results = {(r["program"], r["columns"], r["rows"]): r
+                    for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["program"], result["columns"], result["rows"])
+        base = base_results.get(key)
+        if base is None:
+            continue
+        for (metric, direction) in METRICS.items():
+            (old, new) = (base.get(metric), result.get(metric))
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if thresholds.get(metric, threshold) < -direction * change:
+                regressions.append(
+                    f"{key[0]} {key[1]}x{key[2]} {metric}:"
+                    f" {old:g} -> {new:g} ({change:+.1%})")
+    return regressions
+
+
+def _parse_threshold(text: str) -> Tuple[str, float]:
+    (metric, ratio) = text.split("=")
+    if metric not in METRICS:
+        raise argparse.ArgumentTypeError(f"unknown metric: {metric}")
+    return (metric, float(ratio))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="benchmark sample programs")
+    parser.add_argument("-p", "--program", action="append",
+                        choices=list(PROGRAMS),
+                        help="program (default: all)")
+    parser.add_argument("-r", "--resolution", action="append",
+                        type=parse_resolution, metavar="COLUMNSxROWS",
+                        help="resolution (default: 16x6, 64x20, 128x40)")
+    parser.add_argument("--sim-steps", type=int, default=SIM_STEPS,
+                        metavar="N", help="steps to run by BfSim")
+    parser.add_argument("--no-native", dest="native", action="store_false",
+                        help="skip gcc compile and native run")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="write results to FILE (default: stdout)")
+    parser.add_argument("-b", "--baseline", metavar="FILE",
+                        help="compare results with baseline FILE")
+    parser.add_argument("-t", "--threshold", type=float, default=THRESHOLD,
+                        metavar="RATIO",
+                        help="regression threshold (default: 0.10)")
+    parser.add_argument("-T", "--metric-threshold", action="append",
+                        type=_parse_threshold, default=[],
+                        metavar="METRIC=RATIO",
+                        help="regression threshold of 1 metric")
+    args = parser.parse_args(argv)
+
+    current = run_bench(args.program or list(PROGRAMS),
+                        args.resolution or RESOLUTIONS,
+                        args.sim_steps, args.native)
+    text = json.dumps(current, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w") as out_file:
+            out_file.write(text)
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, "r") as base_file:
+        baseline = json.load(base_file)
+    regressions = compare(baseline, current, args.threshold,
+                          dict(args.metric_threshold))
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,489 @@
+# Brainf*ck を C のソースコードに変換する(bf2c.c の Python 版)
+# bf2c.c は1文字を1文に変換して最適化を C コンパイラに任せるが、こちらは
+# 加減算をまとめ、直線的な部分のポインタの移動はオフセットに置き換え、
+# クリアや掛け算のループは1文にしてから出力する
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+import bf_io
+import bf_ir
+from bf_ir import (OP_ADD, OP_MOVE, OP_CLEAR, OP_MULTI, OP_OPEN, OP_CLOSE,
+                   OP_IN, OP_OUT, OP_SCAN)
+
+VERSION = "@(#) $Id: bf2c.py 0.2.0 2026-10-18 yoshi Exp $"
+
+# セルのサイズごとの C の型.
+# bf2c.c は char/short/int だが、オーバーフローが未定義動作にならないよう
+# 符号なしにする(0 判定とラップアラウンドの結果は同じ)
+CELL_TYPES = {1: "unsigned char", 2: "unsigned short", 4: "unsigned int"}
+
+# 実行コマンドのオプションなしの引数の意味
+DEF_NONE = None
+DEF_OUTPUT = "output"
+DEF_INPUT = "input"
+DEF_MESSAGE = "message"
+
+# 連続するクリアをこの数以上まとめて memset にする
+MEMSET_MIN = 3
+
+
+def _cell(offset: int) -> str:
+    """
+    C の式. ポインタからのオフセットのセル
+
+    >>> _cell(0), _cell(3), _cell(-2)
+    ('*ptr', 'ptr[3]', 'ptr[-2]')
+    """
+    return "*ptr" if offset == 0 else f"ptr[{offset}]"
+
+
+class _Emitter:
+    """translate intermediate representation to lines of C"""
+
+    def __init__(self, cell_size: int, eof: str, force_flush: bool):
+        self.mask = (1 << (8 * cell_size)) - 1
+        self.eof = eof
+        self.force_flush = force_flush
+        # 出力した行
+        self.lines: List[str] = []
+        # ブロックのネスト
+        self.depth = 1
+        # まだ ptr に反映していない移動量
+        self.offset = 0
+        # まだ出力していないセルの変更. オフセット -> (代入か, 値)
+        self.pending: Dict[int, Tuple[bool, int]] = {}
+        # ',' / '.' を使っているか
+        self.enable_input = False
+        self.enable_output = False
+
+    def emit(self, line: str):
+        self.lines.append("  " * self.depth + line)
+
+    def translate(self, program: bf_ir.IrProgram) -> List[str]:
+        for (op, arg) in program.code:
+            if op == OP_ADD:
+                (assign, value) = self.pending.get(self.offset, (False, 0))
+                self.pending[self.offset] = (assign, value + arg)
+            elif op == OP_MOVE:
+                self.offset += arg
+            elif op == OP_CLEAR:
+                self.pending[self.offset] = (True, 0)
+            elif op == OP_MULTI:
+                self._multi(arg)
+            elif op == OP_OPEN:
+                self._move_ptr()
+                self.emit("while (*ptr) {")
+                self.depth += 1
+            elif op == OP_CLOSE:
+                self._move_ptr()
+                self.depth -= 1
+                self.emit("}")
+            elif op == OP_SCAN:
+                self._move_ptr()
+                step = f"ptr += {arg}" if 0 < arg else f"ptr -= {-arg}"
+                self.emit(f"while (*ptr) {step};")
+            elif op == OP_IN:
+                self._get_char()
+            elif op == OP_OUT:
+                self._flush_cell(self.offset)
+                self.emit(f"putchar({_cell(self.offset)});")
+                if self.force_flush:
+                    self.emit("fflush(stdout);")
+                self.enable_output = True
+            else:
+                raise ValueError(f"unsupported op={op}")
+        # 最後のポインタの移動は結果に影響しないので出力しない
+        self._flush_all()
+        return self.lines
+
+    def _multi(self, arg: Tuple):
+        """[->+>++<<] などを、掛け算の1文ずつにする"""
+        (pairs, delta, _, _) = arg
+        base = self.offset
+        self._flush_cell(base)
+        source = _cell(base)
+        for (offset, factor) in pairs:
+            target = base + offset
+            self._flush_cell(target)
+            # [+>+<] の形式は (mask + 1 - value) 回なので符号が逆になる
+            factor = factor if delta < 0 else -factor
+            operator = "+=" if 0 < factor else "-="
+            term = source if abs(factor) == 1 else f"{source} * {abs(factor)}"
+            self.emit(f"{_cell(target)} {operator} {term};")
+        self.pending[base] = (True, 0)
+
+    def _get_char(self):
+        offset = self.offset
+        if self.eof == bf_io.EOF_NO_EFFECT:
+            self._flush_cell(offset)
+        else:
+            # 必ず上書きされるので、それまでの変更は不要
+            self.pending.pop(offset, None)
+        self.emit("ch = getchar2();")
+        if self.eof == bf_io.EOF_ZERO:
+            self.emit("if (ch == EOF) ch = 0;")
+        if self.eof == bf_io.EOF_NO_EFFECT:
+            self.emit("if (ch != EOF)")
+        self.emit(f"{_cell(offset)} = ch;")
+        self.enable_input = True
+
+    def _move_ptr(self):
+        """output pending changes and pointer move"""
+        self._flush_all()
+        if self.offset != 0:
+            if 0 < self.offset:
+                self.emit(f"ptr += {self.offset};")
+            else:
+                self.emit(f"ptr -= {-self.offset};")
+            self.offset = 0
+
+    def _flush_cell(self, offset: int):
+        """output pending change of 1 cell"""
+        if offset not in self.pending:
+            return
+        (assign, value) = self.pending.pop(offset)
+        value &= self.mask
+        if assign:
+            self.emit(f"{_cell(offset)} = {value};")
+        elif value <= self.mask // 2:
+            if value != 0:
+                self.emit(f"{_cell(offset)} += {value};")
+        else:
+            self.emit(f"{_cell(offset)} -= {self.mask + 1 - value};")
+
+    def _flush_all(self):
+        """output all pending changes. 連続するクリアは memset にする"""
+        offsets = sorted(self.pending)
+        i = 0
+        while i < len(offsets):
+            j = i
+            while j < len(offsets) \
+                    and self.pending[offsets[j]] == (True, 0) \
+                    and offsets[j] == offsets[i] + (j - i):
+                j += 1
+            if MEMSET_MIN <= j - i:
+                for offset in offsets[i:j]:
+                    del self.pending[offset]
+                self.emit(f"memset(&ptr[{offsets[i]}], 0,"
+                          f" {j - i} * sizeof(*ptr));")
+                i = j
+            else:
+                self._flush_cell(offsets[i])
+                i += 1
+
+
+def translate_body(source: str,
+                   cell_size: int = 1,
+                   eof: str = bf_io.EOF_MINUS,
+                   force_flush: bool = False) -> List[str]:
+    """
+    Brainf*ck のソースコードを、main() の本体の C の文に変換する
+
+    >>> print("\\n".join(translate_body("+++>++<[->+++<]>>[-]>[-]>[-]<<<.")))
+      *ptr += 3;
+      ptr[1] += 2;
+      ptr[1] += *ptr * 3;
+      putchar(ptr[1]);
+      *ptr = 0;
+      memset(&ptr[2], 0, 3 * sizeof(*ptr));
+    >>> print("\\n".join(translate_body(">[-]+++[>]<,")))
+      ptr[1] = 3;
+      ptr += 1;
+      while (*ptr) ptr += 1;
+      ch = getchar2();
+      ptr[-1] = ch;
+    """
+    return _Emitter(cell_size, eof, force_flush).translate(
+        bf_ir.compile_ir(source))
+
+
+def escape_string(message: str) -> str:
+    r"""
+    C の文字列リテラル用のエスケープ
+
+    >>> print(escape_string('a"b\\c\n\t'))
+    a\"b\\c\n\t
+    """
+    return message.replace("\\", "\\\\").replace('"', '\\"') \
+        .replace("\n", "\\n").replace("\t", "\\t")
+
+
+def translate(source: str,
+              version: str,
+              copyright: Optional[str] = None,
+              size: int = 30000,
+              cell_size: int = 1,
+              eof: str = bf_io.EOF_MINUS,
+              force_flush: bool = False,
+              def_param: Optional[str] = DEF_NONE) -> str:
+    """translate to C source code (bf2c.c の transrate と同じ形式のプログラム)"""
+    emitter = _Emitter(cell_size, eof, force_flush)
+    body = emitter.translate(bf_ir.compile_ir(source))
+    enable_input = emitter.enable_input
+    enable_output = emitter.enable_output
+    cell_type = CELL_TYPES[cell_size]
+
+    out: List[str] = []
+    out.append("#include <stdio.h>\n")
+    out.append("#include <stdlib.h>\n")
+    out.append("#include <getopt.h>\n")
+    out.append("#include <string.h>\n")
+    out.append("#include <unistd.h>\n")
+
+    out.append(f"static char* VERSION = \"{escape_string(version)}\";\n")
+    if copyright is not None:
+        out.append(
+            f"static char* COPYRIGHT = \"{escape_string(copyright)}\";\n")
+
+    out.append("int getchar2();\n")
+    out.append("int options(int argc, char**argv);\n")
+    out.append(f"static int array_size = {size};\n")
+    out.append("int main(int argc, char**argv) {\n")
+    out.append("  int idx = options(argc, argv);\n")
+    out.append("  int ch;\n")
+    out.append(f"  {cell_type}* buff = calloc(array_size, "
+               f"sizeof({cell_type}));\n")
+    out.append(f"  {cell_type}* ptr = buff;\n")
+    out.extend(line + "\n" for line in body)
+    out.append("  free(buff);\n")
+    out.append("  return 0;\n")
+    out.append("}\n")
+
+    # read character from stdin or message-string
+    out.append("static char* message=NULL;\n"
+               "int getchar2() {\n"
+               " if (message == NULL) {\n"
+               "   return getchar();\n"
+               " } else if (*message == '\\0') {\n"
+               "   return EOF;\n"
+               " } else {\n"
+               "   return *(message++);\n"
+               " }\n"
+               "}\n")
+
+    if not enable_input and def_param in (DEF_INPUT, DEF_MESSAGE):
+        def_param = DEF_NONE
+    if not enable_output and def_param == DEF_OUTPUT:
+        def_param = DEF_NONE
+    if not enable_input and enable_output:
+        def_param = DEF_OUTPUT
+
+    # options, usage message
+    out.append("struct option longopts[] = {\n"
+               "  { \"help\", no_argument, NULL, 'h' },\n"
+               "  { \"version\", no_argument, NULL, 'v' },\n"
+               "  { \"size\", required_argument, NULL, 's' },\n")
+    if enable_input:
+        out.append("  { \"file\", required_argument, NULL, 'f' },\n"
+                   "  { \"message\", required_argument, NULL, 'm' },\n")
+    if enable_output:
+        out.append("  { \"output\", required_argument, NULL, 'o' },\n")
+    out.append("  { NULL, 0, NULL, '\\0' },\n"
+               "};\n")
+
+    out.append("int options(int argc, char**argv) {\n"
+               "  char* input_path=NULL;\n"
+               "  char* output_path=NULL;\n"
+               "  int opt,longindex,show_help=0;\n"
+               "  while((opt=getopt_long(argc, argv,\"hvs:\"")
+    if enable_input:
+        out.append(" \"f:m:\"")
+    if enable_output:
+        out.append(" \"o:\"")
+    out.append(" , longopts, &longindex)) != -1) {\n"
+               "    switch(opt) {\n"
+               "    case 'h':\n"
+               "    case 'v': show_help|=1; break;\n"
+               "    case 's':\n"
+               "      array_size = atoi(optarg);\n"
+               "       if (array_size < 1) {\n"
+               "         fprintf(stderr, \"%s: invalid argument."
+               " -s or --size\\n\", argv[0]);\n"
+               "         show_help |= 2;\n"
+               "       }\n"
+               "       break;\n"
+               "    case 'f': input_path=optarg; message=NULL; break;\n"
+               "    case 'm': input_path=NULL; message=optarg; break;\n"
+               "    case 'o': output_path=optarg; break;\n"
+               "    default: show_help |= 2; break;\n"
+               "    }\n"
+               "  }\n")
+
+    if def_param == DEF_INPUT:
+        out.append("  if (optind < argc) {\n"
+                   "    input_path = argv[optind++];\n"
+                   "    message = NULL;\n"
+                   "  }\n")
+    if def_param == DEF_OUTPUT:
+        out.append("  if (optind < argc)\n"
+                   "    output_path = argv[optind++];\n")
+    if def_param == DEF_MESSAGE:
+        out.append("  if (optind < argc) {\n"
+                   "    input_path = NULL;\n"
+                   "    message = argv[optind++];\n"
+                   "  }\n")
+    out.append("  if (optind < argc) {\n"
+               "    show_help = 2;\n"
+               "  }\n")
+
+    out.append("  if (show_help) {\n")
+    out.append("    puts(VERSION);\n")
+    if copyright is not None:
+        out.append("    puts(COPYRIGHT);\n")
+    # usage
+    out.append("    printf(\"Usage:\\n  %s [options]\"")
+    if def_param == DEF_INPUT:
+        out.append("\" [ <input-file> ]\"")
+    elif def_param == DEF_OUTPUT:
+        out.append("\" [ <output-file> ]\"")
+    elif def_param == DEF_MESSAGE:
+        out.append("\" [ <input-message> ]\"")
+    out.append("\"\\n\", argv[0]);\n"
+               "    puts(\"Options:\");\n")
+    if enable_input:
+        out.append(
+            "    puts(\"  -f, --file <file>   : input file path.\");\n"
+            "    puts(\"  -m, --message <str> : input message.\");\n")
+    if enable_output:
+        out.append(
+            "    puts(\"  -o, --output <file> : output file path.\");\n")
+    out.append(
+        "    puts(\"  -v, --version       :"
+        " display version information.\");\n"
+        "    puts(\"  -h, --help          : display help message.\");\n")
+    out.append(
+        "    puts(\"  -s, --size <number> :"
+        f" array size (default:{size})\");\n")
+    out.append("    exit(show_help==1 ? 0 : 1);\n"
+               "  }\n")
+
+    out.append("  if (input_path != NULL\n"
+               "      && strcmp(input_path, \"-\") != 0) {\n"
+               "    FILE* in = fopen(input_path, \"r\");\n"
+               "    if(in==NULL){\n"
+               "      perror(\"fopen()\");\n"
+               "      exit(1);\n"
+               "    }\n"
+               "    int rc = dup2(fileno(in), 0);\n"
+               "    if(rc==-1){\n"
+               "      perror(\"dup2(in)\");\n"
+               "      exit(1);\n"
+               "    }\n"
+               "  }\n")
+
+    out.append("  if (output_path != NULL\n"
+               "      && strcmp(output_path, \"-\") != 0) {\n"
+               "    FILE* out = fopen(output_path, \"w\");\n"
+               "    int rc = dup2(fileno(out), 1);\n"
+               "    if(rc==-1){\n"
+               "      perror(\"dup2(out)\");\n"
+               "      exit(1);\n"
+               "    }\n"
+               "  }\n")
+
+    out.append("  return optind;\n"
+               "}\n")
+    return "".join(out)
+
+
+def create_version_info(input_path: str) -> str:
+    """default version information (bf2c.c の create_version_info と同じ)"""
+    base_name = os.path.basename(input_path)
+    time_stamp = time.strftime("%Y-%m-%d %H:%M:%S%z")
+    user_name = "noname"
+    for name in ("LOGNAME", "USER", "LNAME", "USERNAME"):
+        if os.environ.get(name):
+            user_name = os.environ[name]
+            break
+    return f"@(#) $Id: {base_name} 0.1.0 {time_stamp} {user_name} Exp $"
+
+
+def create_output_path(input_path: str) -> str:
+    """
+    create output path(*.c) from input path(*.bf)
+
+    >>> create_output_path("dir/mycat.bf")
+    'dir/mycat.c'
+    >>> create_output_path("mycat")
+    './mycat.c'
+    """
+    dir_path = os.path.dirname(input_path) or "."
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(dir_path, base_name + ".c")
+
+
+def _positive(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("invalid argument. -s or --size")
+    return value
+
+
+def main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog="bf2c", description="brainf*ck to c-lang translator")
+    parser.add_argument("source", help="Brainf*ck source file")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="output file(c-source)")
+    parser.add_argument("-F", "--force-flush", action="store_true",
+                        help="force flush")
+    param = parser.add_mutually_exclusive_group()
+    param.add_argument("-O", "--output-default", dest="def_param",
+                       action="store_const", const=DEF_OUTPUT,
+                       default=DEF_NONE,
+                       help="default param is output-file")
+    param.add_argument("-I", "--input-default", dest="def_param",
+                       action="store_const", const=DEF_INPUT,
+                       help="default param is input-file")
+    param.add_argument("-M", "--message-default", dest="def_param",
+                       action="store_const", const=DEF_MESSAGE,
+                       help="default param is message-string")
+    parser.add_argument("-s", "--size", type=_positive, default=30000,
+                        metavar="NUMBER", help="array size (default:30000)")
+    cell = parser.add_mutually_exclusive_group()
+    cell.add_argument("-1", "--cell-char", dest="cell_size",
+                      action="store_const", const=1, default=1,
+                      help="cell size is char (default)")
+    cell.add_argument("-2", "--cell-short", dest="cell_size",
+                      action="store_const", const=2,
+                      help="cell size is short")
+    cell.add_argument("-4", "--cell-int", dest="cell_size",
+                      action="store_const", const=4,
+                      help="cell size is int")
+    eof = parser.add_mutually_exclusive_group()
+    eof.add_argument("-z", "--eof-zero", dest="eof", action="store_const",
+                     const=bf_io.EOF_ZERO, default=bf_io.EOF_MINUS,
+                     help="EOF is zero by getchar")
+    eof.add_argument("-m", "--eof-minus", dest="eof", action="store_const",
+                     const=bf_io.EOF_MINUS,
+                     help="EOF is -1 by getchar (default)")
+    eof.add_argument("-n", "--eof-no-effect", dest="eof",
+                     action="store_const", const=bf_io.EOF_NO_EFFECT,
+                     help="EOF is no effect by getchar")
+    parser.add_argument("-C", "--copyright", metavar="STR",
+                        help="copyright / license message")
+    parser.add_argument("-V", "--version-string", metavar="STR",
+                        help="version information message")
+    parser.add_argument("-v", "--version", action="version", version=VERSION)
+    args = parser.parse_args(argv)
+
+    with open(args.source, "r") as src_file:
+        src = src_file.read()
+    version = args.version_string
+    if version is None:
+        version = create_version_info(args.source)
+    output_path = args.output
+    if output_path is None:
+        output_path = create_output_path(args.source)
+    c_source = translate(src, version, args.copyright, args.size,
+                         args.cell_size, args.eof, args.force_flush,
+                         args.def_param)
+    with open(output_path, "w") as out_file:
+        out_file.write(c_source)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,180 @@
+# Brainf*ck プログラムのバッチ実行
+# 複数のソース × 複数の入力をプロセスプールで並列に実行し、結果を JSON Lines で出力する
+
+import argparse
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import bf_io
+from bf_sim import BfSim
+
+# 1ジョブ. (ソースのパス, 入力の名前, 入力のバイト列)
+Job = Tuple[str, Optional[str], bytes]
+
+# 1回の run() で実行するステップ数. タイムアウトの確認間隔
+CHUNK_STEPS = 100000
+
+# 実行結果の状態
+STATE_OK = "ok"
+STATE_STEP_LIMIT = "step-limit"
+STATE_TIMEOUT = "timeout"
+STATE_ERROR = "error"
+
+
+# 読み込み済みのソース. 同じプロセス内では1回だけ読む
+_sources: Dict[str, str] = {}
+
+
+def _read_source(path: str) -> str:
+    if path not in _sources:
+        with open(path, "r") as src_file:
+            _sources[path] = src_file.read()
+    return _sources[path]
+
+
+def run_job(job: Job,
+            steps: int = 0,
+            timeout: float = 0.0,
+            engine: str = "ir",
+            cell_size: int = 1,
+            eof: str = bf_io.EOF_MINUS) -> Dict[str, Any]:
+    """
+    execute 1 job and return result.
+    steps / timeout が 0 の場合は無制限
+    """
+    (path, input_name, data) = job
+    out = io.BytesIO()
+    result: Dict[str, Any] = {"source": path, "input": input_name}
+    executed = 0
+    state = STATE_OK
+    start = time.monotonic()
+    try:
+        sim = BfSim(_read_source(path), stdin=io.BytesIO(data), stdout=out,
+                    engine=engine, cell_size=cell_size, eof=eof)
+        while not sim.is_stopped():
+            if 0 < steps <= executed:
+                state = STATE_STEP_LIMIT
+                break
+            if 0 < timeout <= time.monotonic() - start:
+                state = STATE_TIMEOUT
+                break
+            chunk = CHUNK_STEPS if steps <= 0 \
+                else min(CHUNK_STEPS, steps - executed)
+            executed += sim.run(chunk)
+    except Exception as e:
+        state = STATE_ERROR
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["state"] = state
+    result["steps"] = executed
+    result["time"] = round(time.monotonic() - start, 6)
+    # JSON に出力するため 1byte = 1文字 の文字列にする
+    result["output"] = out.getvalue().decode("latin-1")
+    return result
+
+
+def _run_job_args(args: Tuple[Job, int, float, str, int, str]) \
+        -> Dict[str, Any]:
+    return run_job(*args)
+
+
+def make_jobs(sources: List[str],
+              inputs: List[Tuple[Optional[str], bytes]]) -> List[Job]:
+    """
+    全てのソースと入力の組み合わせのジョブを作る
+
+    >>> make_jobs(["a.bf", "b.bf"], [("x", b"1"), ("y", b"2")])[1:3]
+    [('a.bf', 'y', b'2'), ('b.bf', 'x', b'1')]
+    >>> make_jobs(["a.bf"], [])
+    [('a.bf', None, b'')]
+    """
+    if not inputs:
+        inputs = [(None, b"")]
+    return [(path, name, data)
+            for path in sources for (name, data) in inputs]
+
+
+def run_batch(jobs: List[Job],
+              workers: int = 0,
+              steps: int = 0,
+              timeout: float = 0.0,
+              engine: str = "ir",
+              cell_size: int = 1,
+              eof: str = bf_io.EOF_MINUS) -> Iterator[Dict[str, Any]]:
+    """
+    execute jobs and yield results in order of jobs.
+    workers が 1 の場合はこのプロセスで順に実行する(0 は CPU 数)
+    """
+    args = [(job, steps, timeout, engine, cell_size, eof) for job in jobs]
+    if workers == 1:
+        yield from map(_run_job_args, args)
+        return
+    with ProcessPoolExecutor(max_workers=workers or None) as executor:
+        yield from executor.map(_run_job_args, args, chunksize=4)
+
+
+def _read_inputs(args: argparse.Namespace) \
+        -> List[Tuple[Optional[str], bytes]]:
+    inputs: List[Tuple[Optional[str], bytes]] = []
+    for path in args.input:
+        with open(path, "rb") as input_file:
+            inputs.append((path, input_file.read()))
+    for path in args.lines:
+        with open(path, "rb") as lines_file:
+            for line in lines_file.read().splitlines():
+                inputs.append((line.decode("latin-1"), line))
+    return inputs
+
+
+def main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        description="run Brainf*ck programs in parallel")
+    parser.add_argument("sources", nargs="+", metavar="source",
+                        help="Brainf*ck source file")
+    parser.add_argument("-i", "--input", action="append", default=[],
+                        metavar="FILE", help="input file (1 file = 1 job)")
+    parser.add_argument("-l", "--lines", action="append", default=[],
+                        metavar="FILE", help="input file (1 line = 1 job)")
+    parser.add_argument("-o", "--report", metavar="FILE",
+                        help="JSON Lines report (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=0, metavar="N",
+                        help="number of worker processes (default: CPUs)")
+    parser.add_argument("--steps", type=int, default=0, metavar="N",
+                        help="step budget per job (default: unlimited)")
+    parser.add_argument("--timeout", type=float, default=0.0, metavar="SEC",
+                        help="timeout per job (default: unlimited)")
+    parser.add_argument("--engine", default="ir", choices=("step", "ir"),
+                        help="execution engine (default: ir)")
+    cell = parser.add_mutually_exclusive_group()
+    cell.add_argument("-1", "--cell-char", dest="cell_size",
+                      action="store_const", const=1, default=1)
+    cell.add_argument("-2", "--cell-short", dest="cell_size",
+                      action="store_const", const=2)
+    cell.add_argument("-4", "--cell-int", dest="cell_size",
+                      action="store_const", const=4)
+    eof = parser.add_mutually_exclusive_group()
+    eof.add_argument("-z", "--eof-zero", dest="eof", action="store_const",
+                     const=bf_io.EOF_ZERO, default=bf_io.EOF_MINUS)
+    eof.add_argument("-m", "--eof-minus", dest="eof", action="store_const",
+                     const=bf_io.EOF_MINUS)
+    eof.add_argument("-n", "--eof-no-effect", dest="eof",
+                     action="store_const", const=bf_io.EOF_NO_EFFECT)
+    args = parser.parse_args(argv)
+
+    jobs = make_jobs(args.sources, _read_inputs(args))
+    report = sys.stdout if args.report is None \
+        else open(args.report, "w", encoding="utf-8")
+    try:
+        for result in run_batch(jobs, args.jobs, args.steps, args.timeout,
+                                args.engine, args.cell_size, args.eof):
+            report.write(json.dumps(result, ensure_ascii=False) + "\n")
+            report.flush()
+    finally:
+        if report is not sys.stdout:
+            report.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
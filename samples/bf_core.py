@@ -1,7 +1,22 @@
 # bfコマンドマクロの基本命令
 
+import functools
 import math
 import re
+from typing import List, Optional, Tuple, Union, overload
+
+
+# delete_useless() で読み込む単位. 同じ移動/加減算の連続, "]", それ以外の連続
+_TOKEN = re.compile(r">+|<+|\++|-+|\]|[^-+<>\]]+")
+
+# 相殺する移動/加減算
+_OPPOSITE = {">": "<", "<": ">", "+": "-", "-": "+"}
+
+# init_value(wrap=True) で回り込みを考える値の範囲. セルは1byte
+CELL_VALUES = 256
+
+# 文字列の置換を繰り返す回数の上限. 超えたら1回で読む方法に切り替える
+_REPLACE_PASSES = 16
 
 
 def delete_useless(statement: str) -> str:
@@ -16,34 +31,78 @@ def delete_useless(statement: str) -> str:
     '>[-]'
     >>> delete_useless(">--[-]++[-]")
     '>[-]'
+    >>> delete_useless("<+->[+--]")
+    '[-]'
     """
-    while True:
+    if isinstance(statement, Fragment):
+        # 展開時に整理済み
+        return str(statement)
+    # 削除箇所が少ない場合は、文字列の置換を数回行えば終わる
+    for _ in range(_REPLACE_PASSES):
         if "<>" in statement:
             # 無駄な移動の相殺・その１
             statement = statement.replace("<>", "")
-            continue
-        if "><" in statement:
+        elif "><" in statement:
             # 無駄な移動の相殺・その２
             statement = statement.replace("><", "")
-            continue
-        if "+-" in statement:
+        elif "+-" in statement:
             # 無駄な加減算の相殺・その１
             statement = statement.replace("+-", "")
-            continue
-        if "-+" in statement:
+        elif "-+" in statement:
             # 無駄な加減算の相殺・その２
             statement = statement.replace("-+", "")
-            continue
-        if "+[-]" in statement or "-[-]" in statement:
+        elif "+[-]" in statement or "-[-]" in statement:
             # ゼロクリアの前の加減算の削除
             statement = re.sub(r'[-+]+\[-\]', "[-]", statement)
-            continue
-        if "[-][-]" in statement:
+        elif "[-][-]" in statement:
             # 複数回のゼロクリアを１回に
             statement = statement.replace("[-][-]", "[-]")
-            continue
-        break
-    return statement
+        else:
+            return statement
+    # 置換を繰り返すと2乗の時間がかかるので、残りは1回で読んで削除する
+    return _delete_useless_stack(statement)
+
+
+def _delete_useless_stack(statement: str) -> str:
+    """
+    スタックを使って、先頭から1回だけ読んで無駄な移動/計算を削除する
+
+    >>> _delete_useless_stack("<<<+++--->>>[-+-]>-[-]<<[-]")
+    '[-]>[-]<<[-]'
+    """
+    # 先頭から1回だけ読み、相殺済みの断片をスタックに積む.
+    # 断片は同じ移動/加減算の連続, "[-]", それ以外の文字の連続のいずれか
+    result: List[str] = []
+    for token in _TOKEN.findall(statement):
+        ch = token[0]
+        top = result[-1][0] if result else ""
+        if ch in _OPPOSITE and top == _OPPOSITE[ch]:
+            # 直前の移動/加減算と相殺
+            rest = len(result[-1]) - len(token)
+            if 0 < rest:
+                result[-1] = top * rest
+            elif rest < 0:
+                result[-1] = ch * -rest
+            else:
+                result.pop()
+        elif ch == top and ch in _OPPOSITE:
+            result[-1] += token
+        elif ch == "]" and top == "-" and len(result[-1]) == 1 \
+                and 2 <= len(result) and result[-2][-1] == "[":
+            # ゼロクリア
+            result.pop()
+            result[-1] = result[-1][:-1]
+            if not result[-1]:
+                result.pop()
+            if result and result[-1][0] in "+-":
+                # ゼロクリアの前の加減算の削除
+                result.pop()
+            if not result or result[-1] != "[-]":
+                # 複数回のゼロクリアは１回に
+                result.append("[-]")
+        else:
+            result.append(token)
+    return "".join(result)
 
 
 def delete_useless_all(statement: str) -> str:
@@ -58,31 +117,110 @@ def delete_useless_all(statement: str) -> str:
     '[-<+>]'
     """
     statement = delete_useless(statement)
-    while statement:
-        if statement[-1] in "-+><":
+    end = len(statement)
+    while end:
+        if statement[end - 1] in "-+><":
             # 末尾の "+" "-" ">" "<" は削除
-            statement = re.sub(r'[-+><]+$', "", statement)
-            continue
-        if statement.endswith("[-]"):
+            end -= 1
+        elif statement.endswith("[-]", 0, end):
             # 末尾の "[-]" は削除
-            statement = re.sub(r'\[-\]$', "", statement)
-            continue
-        break
-    return statement
+            end -= 3
+        else:
+            break
+    return statement[:end]
+
+
+class Fragment:
+    """
+    命令の断片. 部分木を共有する変更不可の木で、str() で1回だけ展開する.
+    展開時に delete_useless() で整理し、結果を保持する
+
+    >>> loop = fragment_of("[", "-", "]")
+    >>> str(block_of(">", loop, "<"))
+    '>[-]<'
+    >>> str(fragment_of(loop, "+", loop)) == "[-]"
+    True
+    """
+    __slots__ = ("_parts", "_text")
+
+    def __init__(self, *parts: "Statement"):
+        self._parts: Tuple["Statement", ...] = parts
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            # 深い入れ子でも再帰しないよう、スタックで展開する
+            texts: List[str] = []
+            stack = list(reversed(self._parts))
+            while stack:
+                part = stack.pop()
+                if isinstance(part, str):
+                    texts.append(part)
+                elif part._text is not None:
+                    texts.append(part._text)
+                else:
+                    stack.extend(reversed(part._parts))
+            self._text = delete_useless("".join(texts))
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"Fragment({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, Fragment)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __add__(self, other: "Statement") -> "Fragment":
+        return Fragment(self, other)
+
+    def __radd__(self, other: "Statement") -> "Fragment":
+        return Fragment(other, self)
+
+
+# 命令. 文字列または断片
+Statement = Union[str, Fragment]
+
 
+def fragment_of(*statements: Statement) -> Fragment:
+    """
+    複数の命令を、展開せずに断片にまとめる
 
-def block_of(*statements: str) -> str:
+    >>> fragment_of(">>", "<+", ">")
+    Fragment('>+>')
     """
-    複数の命令をまとめる
+    return Fragment(*statements)
+
+
+# 断片を受け取るマクロは、文字列だけを渡した場合は文字列を返す
+@overload
+def block_of(*statements: str) -> str: ...
+
+
+@overload
+def block_of(*statements: Statement) -> Statement: ...
+
+
+def block_of(*statements: Statement) -> Statement:
+    """
+    複数の命令をまとめる. 断片が含まれる場合は断片を返す
 
     >>> block_of("[", "-", "]")
     '[-]'
+    >>> block_of(">", fragment_of("+"), "<")
+    Fragment('>+<')
     """
-    return delete_useless("".join(statements))
+    for statement in statements:
+        if isinstance(statement, Fragment):
+            return Fragment(*statements)
+    return delete_useless("".join(map(str, statements)))
 
 
-def program_of(*statements: str) -> str:
-    source = delete_useless_all("".join(statements))
+def program_of(*statements: Statement) -> str:
+    source = delete_useless_all("".join(map(str, statements)))
     source = re.sub(r'(.{1,72})', "\\1\n", source)
     return source
 
@@ -101,7 +239,15 @@ def move_ptr(pos: int) -> str:
     return ">" * pos if 0 <= pos else "<" * (-pos)
 
 
-def exec_pos(pos: int, statement: str) -> str:
+@overload
+def exec_pos(pos: int, statement: str) -> str: ...
+
+
+@overload
+def exec_pos(pos: int, statement: Statement) -> Statement: ...
+
+
+def exec_pos(pos: int, statement: Statement) -> Statement:
     """
     指定位置で処理を実行
 
@@ -163,7 +309,15 @@ def set_value(pos: int, value: int) -> str:
     )
 
 
-def while_loop(pos: int, *statements: str) -> str:
+@overload
+def while_loop(pos: int, *statements: str) -> str: ...
+
+
+@overload
+def while_loop(pos: int, *statements: Statement) -> Statement: ...
+
+
+def while_loop(pos: int, *statements: Statement) -> Statement:
     """
     whileループ.
 
@@ -177,7 +331,15 @@ def while_loop(pos: int, *statements: str) -> str:
     )
 
 
-def for_loop(pos: int, *statements: str) -> str:
+@overload
+def for_loop(pos: int, *statements: str) -> str: ...
+
+
+@overload
+def for_loop(pos: int, *statements: Statement) -> Statement: ...
+
+
+def for_loop(pos: int, *statements: Statement) -> Statement:
     """
     繰り返し. 破壊版
 
@@ -191,7 +353,15 @@ def for_loop(pos: int, *statements: str) -> str:
     )
 
 
-def for_safe(pos: int, work1: int, statement: str) -> str:
+@overload
+def for_safe(pos: int, work1: int, statement: str) -> str: ...
+
+
+@overload
+def for_safe(pos: int, work1: int, statement: Statement) -> Statement: ...
+
+
+def for_safe(pos: int, work1: int, statement: Statement) -> Statement:
     """
     繰り返し. 非破壊版(ただしループ中にposを参照更新してはダメ)
 
@@ -234,8 +404,9 @@ def swap_data(target1: int, target2: int, work1: int) -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def _init_value_sub(value: int) -> str:
-    "初回の値設定. 隣以降はワークに使ってよい前提"
+    "初回の値設定. 隣以降はワークに使ってよい前提. 一度求めた値は再利用する"
     (op1, op2) = ("+", "-")
     if value < 0:
         value = -value
@@ -267,16 +438,38 @@ def _init_value_sub(value: int) -> str:
     return str0
 
 
-def init_value(pos: int, value: int) -> str:
+def _init_value_wrap(value: int) -> str:
+    "初回の値設定. セルの回り込みを使い、短い方を選ぶ"
+    value %= CELL_VALUES
+    return min(_init_value_sub(value), _init_value_sub(value - CELL_VALUES),
+               key=len)
+
+
+def init_value(pos: int, value: int, wrap: bool = False) -> str:
     """
     初回の値設定.
 
-    隣以降はワークに使ってよい前提. 初期化順に注意
+    隣以降はワークに使ってよい前提. 初期化順に注意.
+    wrap=True の場合は 1byte のセルの回り込みを使う
+
+    >>> init_value(1, 255)
+    '>>>++++++++[<++++>-]<[<++++++++>-]<-<'
+    >>> init_value(1, 255, wrap=True)
+    '>-<'
     """
-    return delete_useless(exec_pos(pos, _init_value_sub(value)))
+    code = _init_value_wrap(value) if wrap else _init_value_sub(value)
+    return delete_useless(exec_pos(pos, code))
 
 
-def if_nz_then(pos: int, then_statement: str) -> str:
+@overload
+def if_nz_then(pos: int, then_statement: str) -> str: ...
+
+
+@overload
+def if_nz_then(pos: int, then_statement: Statement) -> Statement: ...
+
+
+def if_nz_then(pos: int, then_statement: Statement) -> Statement:
     "if_nz の破壊版. thenのみの簡易版"
     return while_loop(
         pos,
@@ -285,7 +478,15 @@ def if_nz_then(pos: int, then_statement: str) -> str:
     )
 
 
-def if_one_then(pos: int, then_statement: str) -> str:
+@overload
+def if_one_then(pos: int, then_statement: str) -> str: ...
+
+
+@overload
+def if_one_then(pos: int, then_statement: Statement) -> Statement: ...
+
+
+def if_one_then(pos: int, then_statement: Statement) -> Statement:
     "posの位置が 1 か 0 のどちらが前提. 1 の場合に処理する (破壊版)."
     return while_loop(
         pos,
@@ -294,12 +495,22 @@ def if_one_then(pos: int, then_statement: str) -> str:
     )
 
 
+@overload
+def if_nz_tricky(pos: int, n: int, m: int, then_statement: str,
+                 else_statement: str = "") -> str: ...
+
+
+@overload
+def if_nz_tricky(pos: int, n: int, m: int, then_statement: Statement,
+                 else_statement: Statement = "") -> Statement: ...
+
+
 def if_nz_tricky(
         pos: int,
         n: int,
         m: int,
-        then_statement: str,
-        else_statement: str = "") -> str:
+        then_statement: Statement,
+        else_statement: Statement = "") -> Statement:
     """
     if_nz の非破壊版. ちょっとトリッキー
 
@@ -326,12 +537,22 @@ def if_nz_tricky(
     )
 
 
+@overload
+def if_z_tricky(pos: int, n: int, m: int, then_statement: str,
+                else_statement: str = "") -> str: ...
+
+
+@overload
+def if_z_tricky(pos: int, n: int, m: int, then_statement: Statement,
+                else_statement: Statement = "") -> Statement: ...
+
+
 def if_z_tricky(
         pos: int,
         n: int,
         m: int,
-        then_statement: str,
-        else_statement: str = "") -> str:
+        then_statement: Statement,
+        else_statement: Statement = "") -> Statement:
     """
     if_z の非破壊版. ちょっとトリッキー
 
@@ -413,3 +634,70 @@ def multi_data_tricky(
         pos + 3,
         add_data_tricky(source2, pos, pos + 4, digit)
     )
+
+
+def divmod_data(pos: int, divisor: int) -> str:
+    """
+    1byte除算. pos の値を divisor で割り、pos+2 に余りを設定し、pos+3 に商を加算する.
+    pos は 0 になる(破壊版). pos が 0 の場合は何もしない. ちょっとトリッキー
+
+    前提条件
+      *(ptr + pos + 1) == 0
+      *(ptr + pos + 2) == 0
+      *(ptr + pos + 4) == 0
+      *(ptr + pos + 5) == 0
+    """
+    # pos は 0 になるので、外側のループは1回だけ実行する
+    return while_loop(
+        pos,
+        init_value(pos + 1, divisor),
+        # pos+1 を divisor から減らし、0 になったら余りを戻して商を増やす
+        exec_pos(pos, "[->-[>+>>]>[+[-<+>]>+>>]<<<<<]"),
+        # pos+1 には divisor - 余り が残る
+        clear_pos(pos + 1)
+    )
+
+
+def divmod_large(pos: int, divisor: int) -> str:
+    """
+    大きな値の除算. pos の値を divisor で割り、pos+2 に余りを、pos+3 に商を設定する.
+    pos は 0 になる(破壊版). ちょっとトリッキー
+
+    divisor 個ずつまとめて数えるので、divmod_data() より1あたりの命令数が少ない.
+    2byte以上のセルで、1byteを超える値を割る場合に使う
+
+    前提条件
+      *(ptr + pos + 1) ～ *(ptr + pos + 7) == 0
+    """
+    marker = pos
+    value = pos + 2  # 前後の pos+1, pos+4 は 0 のまま
+    count = pos + 3
+    quotient = pos + 5
+    remainder = pos + 6
+    running = pos + 7
+    return block_of(
+        move_data(pos, value),
+        inc_pos(running),
+        while_loop(
+            running,
+            exec_pos(count, "+" * divisor),
+            inc_pos(marker),
+            # value と count を片方が0になるまで両方をデクリメント.
+            # count が先(同時を含む)に0になると value の1つ前、value が先なら
+            # value で止まる. count が先の場合だけ marker を消して位置を揃える
+            exec_pos(value, "[->-[>]<<]<[->c]>"),
+            inc_pos(quotient),
+            # value が先に0になった場合は、数えた分が余り
+            if_one_then(
+                marker,
+                block_of(
+                    dec_pos(quotient),
+                    exec_pos(remainder, "+" * divisor),
+                    for_loop(count, dec_pos(remainder)),
+                    dec_pos(running)
+                )
+            )
+        ),
+        move_data(remainder, value),
+        move_data(quotient, count)
+    )
@@ -0,0 +1,462 @@
+# マクロが生成したコードの静的なコスト見積もり
+# 実行せずに、命令数と実行ステップ数(最良/最悪/期待値)を求める.
+# 実行ステップ数は入力セルの値を変数にした多項式で表す
+
+import itertools
+from fractions import Fraction
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, \
+    Union
+
+# セルの値の範囲. セルは1byte
+CELL_VALUES = 256
+
+# 変数の値の範囲のデフォルト
+DEFAULT_RANGE = (0, CELL_VALUES - 1)
+
+# 展開して調べるループの回数の上限. 超えたら回数を変数にする
+MAX_UNROLL = CELL_VALUES
+
+# 分岐して調べる経路の数の上限
+MAX_PATHS = 256
+
+# 最良/最悪を全ての頂点で求める変数の数の上限. 超えたら下限/上限だけで求める
+MAX_CORNERS = 10
+
+Number = Union[int, Fraction]
+Monomial = Tuple[str, ...]
+
+
+class Expr:
+    """
+    セルの値やステップ数を表す多項式. 変更不可
+
+    >>> a = Expr.var("a")
+    >>> b = Expr.var("b")
+    >>> (a + 1) * (b - 2)
+    Expr('a*b - 2*a + b - 2')
+    >>> ((a + 1) * b).evaluate({"a": 2, "b": 3})
+    9
+    """
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Optional[Dict[Monomial, Number]] = None):
+        self.terms: Dict[Monomial, Number] = \
+            {m: v for (m, v) in (terms or {}).items() if v != 0}
+
+    @staticmethod
+    def const(value: Number) -> "Expr":
+        return Expr({(): value})
+
+    @staticmethod
+    def var(name: str) -> "Expr":
+        return Expr({(name,): 1})
+
+    def is_const(self) -> bool:
+        return all(not m for m in self.terms)
+
+    def value(self) -> Number:
+        "定数項"
+        return self.terms.get((), 0)
+
+    def symbol(self) -> Optional[str]:
+        "変数1つだけの場合はその名前"
+        if len(self.terms) == 1:
+            ((monomial, coefficient),) = self.terms.items()
+            if len(monomial) == 1 and coefficient == 1:
+                return monomial[0]
+        return None
+
+    def symbols(self) -> Set[str]:
+        return {name for monomial in self.terms for name in monomial}
+
+    def substitute(self, name: str, value: Number) -> "Expr":
+        result: Dict[Monomial, Number] = {}
+        for (monomial, coefficient) in self.terms.items():
+            rest = tuple(n for n in monomial if n != name)
+            coefficient *= value ** (len(monomial) - len(rest))
+            result[rest] = result.get(rest, 0) + coefficient
+        return Expr(result)
+
+    def evaluate(self, values: Dict[str, Number]) -> Number:
+        total: Number = 0
+        for (monomial, coefficient) in self.terms.items():
+            for name in monomial:
+                coefficient *= values[name]
+            total += coefficient
+        return total
+
+    def __add__(self, other: Union["Expr", Number]) -> "Expr":
+        other = _expr(other)
+        result = dict(self.terms)
+        for (monomial, coefficient) in other.terms.items():
+            result[monomial] = result.get(monomial, 0) + coefficient
+        return Expr(result)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Expr":
+        return Expr({m: -v for (m, v) in self.terms.items()})
+
+    def __sub__(self, other: Union["Expr", Number]) -> "Expr":
+        return self + -_expr(other)
+
+    def __mul__(self, other: Union["Expr", Number]) -> "Expr":
+        other = _expr(other)
+        result: Dict[Monomial, Number] = {}
+        for (m1, v1) in self.terms.items():
+            for (m2, v2) in other.terms.items():
+                monomial = tuple(sorted(m1 + m2))
+                result[monomial] = result.get(monomial, 0) + v1 * v2
+        return Expr(result)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (int, Fraction)):
+            other = Expr.const(other)
+        if not isinstance(other, Expr):
+            return NotImplemented
+        return self.terms == other.terms
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.terms.items()))
+
+    def __str__(self) -> str:
+        text = ""
+        for monomial in sorted(self.terms, key=lambda m: (-len(m), m)):
+            coefficient = self.terms[monomial]
+            sign = "-" if coefficient < 0 else "+"
+            magnitude = abs(coefficient)
+            factors = list(monomial)
+            if magnitude != 1 or not factors:
+                factors.insert(0, str(magnitude))
+            term = "*".join(factors)
+            text += f" {sign} {term}" if text else \
+                ("-" if sign == "-" else "") + term
+        return text or "0"
+
+    def __repr__(self) -> str:
+        return f"Expr({str(self)!r})"
+
+
+def _expr(value: Union[Expr, Number]) -> Expr:
+    return value if isinstance(value, Expr) else Expr.const(value)
+
+
+class Cost(NamedTuple):
+    # 命令数
+    size: int
+    # 最良/最悪の実行ステップ数
+    best: int
+    worst: int
+    # 実行ステップ数の期待値. 値の決まらない分岐は 1/2 ずつとする
+    expected: Expr
+
+
+class _Path:
+    "実行経路ごとの状態"
+    __slots__ = ("pointer", "cells", "steps", "weight", "ranges")
+
+    def __init__(self):
+        self.pointer = 0
+        self.cells: Dict[int, Expr] = {}
+        self.steps = Expr()
+        self.weight = Fraction(1)
+        self.ranges: Dict[str, Tuple[int, int]] = {}
+
+    def copy(self) -> "_Path":
+        path = _Path()
+        path.pointer = self.pointer
+        path.cells = dict(self.cells)
+        path.steps = self.steps
+        path.weight = self.weight
+        path.ranges = dict(self.ranges)
+        return path
+
+    def cell(self, pos: int) -> Expr:
+        return self.cells.get(pos, Expr())
+
+    def substitute(self, name: str, value: int):
+        self.cells = {pos: v.substitute(name, value)
+                      for (pos, v) in self.cells.items()}
+        self.steps = self.steps.substitute(name, value)
+        self.ranges[name] = (value, value)
+
+
+class _GiveUp(Exception):
+    "ループを展開して調べられない"
+
+
+Block = List[Union[str, list]]
+
+
+def _parse(code: str) -> Block:
+    "ループを入れ子のリストにする. コマンド以外の文字は読み飛ばす"
+    stack: List[Block] = [[]]
+    for ch in code:
+        if ch == "[":
+            stack.append([])
+        elif ch == "]":
+            if len(stack) == 1:
+                raise ValueError("unmatched ']'")
+            body = stack.pop()
+            stack[-1].append(body)
+        elif ch in "+-<>.,":
+            stack[-1].append(ch)
+    if len(stack) != 1:
+        raise ValueError("unmatched '['")
+    return stack[0]
+
+
+class _Analyzer:
+
+    def __init__(self):
+        self._names = itertools.count(1)
+
+    def _fresh(self, path: _Path, prefix: str,
+               value_range: Tuple[int, int] = DEFAULT_RANGE) -> Expr:
+        "値の分からないセル/回数を新しい変数にする"
+        name = f"{prefix}{next(self._names)}"
+        path.ranges[name] = value_range
+        return Expr.var(name)
+
+    def run(self, block: Block, paths: List[_Path]) -> List[_Path]:
+        for item in block:
+            if isinstance(item, list):
+                paths = [result for path in paths
+                         for result in self._loop(item, path)]
+                if MAX_PATHS < len(paths):
+                    raise _GiveUp()
+                continue
+            for path in paths:
+                path.steps += 1
+                if item == ">":
+                    path.pointer += 1
+                elif item == "<":
+                    path.pointer -= 1
+                elif item == "+":
+                    path.cells[path.pointer] = path.cell(path.pointer) + 1
+                elif item == "-":
+                    path.cells[path.pointer] = path.cell(path.pointer) - 1
+                elif item == ",":
+                    path.cells[path.pointer] = self._fresh(path, "in")
+        return paths
+
+    def _fork(self, path: _Path) -> Tuple[_Path, _Path]:
+        "現在のセルが 0 の経路と 0 以外の経路に分ける"
+        (zero, nonzero) = (path.copy(), path.copy())
+        zero.weight /= 2
+        nonzero.weight /= 2
+        name = path.cell(path.pointer).symbol()
+        if name is not None:
+            zero.substitute(name, 0)
+            (low, high) = path.ranges.get(name, DEFAULT_RANGE)
+            nonzero.ranges[name] = (max(low, 1), high)
+        return (zero, nonzero)
+
+    def _loop(self, body: Block, path: _Path) -> List[_Path]:
+        path.steps += 1  # "["
+        regular = self._regular(body, path)
+        if regular is not None:
+            return [regular]
+        try:
+            return self._unroll(body, path.copy())
+        except _GiveUp:
+            return self._opaque(body, path)
+
+    def _once(self, body: Block, path: _Path) -> Optional[_Path]:
+        "ポインタが戻る分岐のない1回分の実行"
+        try:
+            results = self.run(body, [path.copy()])
+        except _GiveUp:
+            return None
+        if len(results) != 1 or results[0].pointer != path.pointer:
+            return None
+        return results[0]
+
+    def _regular(self, body: Block, path: _Path) -> Optional[_Path]:
+        """
+        ループ変数を1ずつ減らし、毎回同じだけ他のセルを変更するループなら、
+        回数をループ変数の値にして一度に求める
+        """
+        counter = path.pointer
+        first = self._once(body, path)
+        if first is None:
+            return None
+        second = self._once(body, first)
+        if second is None:
+            return None
+        positions = set(path.cells) | set(first.cells) | set(second.cells)
+        deltas = {pos: first.cell(pos) - path.cell(pos) for pos in positions}
+        if deltas[counter] != -1 or \
+                second.steps - first.steps != first.steps - path.steps:
+            return None
+        for pos in positions:
+            if second.cell(pos) - first.cell(pos) != deltas[pos]:
+                return None
+        count = path.cell(counter)
+        if count.is_const():
+            count = Expr.const(count.value() % CELL_VALUES)
+        result = first.copy()
+        result.ranges = path.ranges
+        for pos in positions:
+            result.cells[pos] = path.cell(pos) + count * deltas[pos]
+        result.cells[counter] = Expr()
+        result.steps = path.steps + count * (first.steps - path.steps + 1)
+        return result
+
+    def _unroll(self, body: Block, path: _Path) -> List[_Path]:
+        "ループを1回ずつ展開する"
+        done: List[_Path] = []
+        work = [path]
+        for count in range(MAX_UNROLL):
+            entered = []
+            for p in work:
+                value = p.cell(p.pointer)
+                if value.is_const():
+                    if value.value() % CELL_VALUES == 0:
+                        done.append(p)
+                    else:
+                        entered.append(p)
+                elif 0 < count:
+                    # 2回目以降も値が決まらないのは if ではなくループ
+                    raise _GiveUp()
+                else:
+                    (zero, nonzero) = self._fork(p)
+                    done.append(zero)
+                    entered.append(nonzero)
+            work = self.run(body, entered)
+            for p in work:
+                p.steps += 1  # "]"
+            if MAX_PATHS < len(done) + len(work):
+                raise _GiveUp()
+            if not work:
+                return done
+        raise _GiveUp()
+
+    def _opaque(self, body: Block, path: _Path) -> List[_Path]:
+        """
+        回数の分からないループ. 変更されるセルの値を新しい変数にする.
+        ループ変数を毎回1ずつ減らす場合は回数をその値、それ以外は新しい変数にする.
+        1回分の実行の最良/最悪から、経路を2つ作る
+        """
+        counter = path.pointer
+        value = path.cell(counter)
+        if value.is_const() and value.value() % CELL_VALUES == 0:
+            return [path]
+        # ループ内で変更されるセル
+        trials = self.run(body, [path.copy()])
+        modified = {counter}
+        for trial in trials:
+            if trial.pointer != counter:
+                raise _GiveUp()
+            for pos in set(trial.cells) | set(path.cells):
+                if trial.cell(pos) != path.cell(pos):
+                    modified.add(pos)
+        # 何回目かわからない1回分の実行
+        state = path.copy()
+        for pos in sorted(modified):
+            low = 1 if pos == counter else 0
+            state.cells[pos] = self._fresh(state, "v", (low, CELL_VALUES - 1))
+        unknowns = {name for pos in modified
+                    for name in state.cell(pos).symbols()}
+        bodies = self.run(body, [state.copy()])
+        results: List[_Path] = []
+        if all(b.cell(counter) == state.cell(counter) - 1 for b in bodies):
+            count = Expr.const(value.value() % CELL_VALUES) \
+                if value.is_const() else value
+        else:
+            count = self._fresh(state, "n", (1, CELL_VALUES - 1))
+            if not value.is_const():
+                (zero, path) = self._fork(path)
+                results.append(zero)
+        after = path.copy()
+        for pos in sorted(modified):
+            deltas = {b.cell(pos) - state.cell(pos) for b in bodies}
+            delta = deltas.pop()
+            if not deltas and not delta.symbols() & unknowns:
+                # 毎回同じだけ変わるセル
+                after.cells[pos] = path.cell(pos) + count * delta
+            else:
+                after.cells[pos] = self._fresh(state, "v")
+        after.cells[counter] = Expr()
+        middles = [b.steps.evaluate(_middle(b)) for b in bodies]
+        indexes = {middles.index(min(middles)), middles.index(max(middles))}
+        for index in sorted(indexes):
+            result = after.copy()
+            result.ranges.update(state.ranges)
+            result.ranges.update(bodies[index].ranges)
+            steps = bodies[index].steps - state.steps + 1  # "]"
+            result.steps = path.steps + count * steps
+            result.weight = path.weight / len(indexes)
+            results.append(result)
+        return results
+
+
+def _middle(path: _Path) -> Dict[str, Fraction]:
+    return {name: Fraction(path.ranges.get(name, DEFAULT_RANGE)[0] +
+                           path.ranges.get(name, DEFAULT_RANGE)[1], 2)
+            for name in path.steps.symbols()}
+
+
+def _extremes(path: _Path) -> Tuple[Number, Number]:
+    "実行ステップ数の最小/最大. 変数の範囲の頂点で求める"
+    names = sorted(path.steps.symbols())
+    bounds = [path.ranges.get(name, DEFAULT_RANGE) for name in names]
+    if MAX_CORNERS < len(names):
+        corners: Iterable[Tuple[int, ...]] = [
+            tuple(low for (low, _) in bounds),
+            tuple(high for (_, high) in bounds)]
+    else:
+        corners = itertools.product(*bounds)
+    values = [path.steps.evaluate(dict(zip(names, corner)))
+              for corner in corners]
+    return (min(values), max(values))
+
+
+def estimate(code: str,
+             inputs: Optional[Dict[int, str]] = None,
+             ranges: Optional[Dict[str, Tuple[int, int]]] = None) -> Cost:
+    """
+    コードのコストを見積もる. inputs は位置 -> 変数名, ranges は変数の範囲.
+    inputs 以外のセルは 0 とする(マクロの前提条件)
+
+    >>> estimate("[->+<]", {0: "a"})
+    Cost(size=6, best=1, worst=1276, expected=Expr('5*a + 1'))
+    >>> estimate("[->[->+<]>[-<+>]<<]", {0: "a", 1: "b"}, {"b": (1, 3)})
+    Cost(size=19, best=1, worst=9691, expected=Expr('10*a*b + 8*a + 1'))
+    >>> estimate("[[-]>+<]>", {0: "a"}).expected
+    Expr('a + 9/2')
+    """
+    path = _Path()
+    for (pos, name) in (inputs or {}).items():
+        path.cells[pos] = Expr.var(name)
+    path.ranges.update(ranges or {})
+    try:
+        paths = _Analyzer().run(_parse(code), [path])
+    except _GiveUp:
+        raise ValueError("too many paths to estimate") from None
+    extremes = [_extremes(p) for p in paths]
+    expected = Expr()
+    for p in paths:
+        expected += p.steps * p.weight
+    return Cost(
+        size=sum(code.count(ch) for ch in "+-<>[].,"),
+        best=int(min(best for (best, _) in extremes)),
+        worst=int(max(worst for (_, worst) in extremes)),
+        expected=expected)
+
+
+def cheapest(codes: Iterable[str],
+             inputs: Optional[Dict[int, str]] = None,
+             ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+             key: str = "worst") -> str:
+    """
+    同じ処理のコードから、コストの一番小さいものを選ぶ.
+    key は Cost の項目名(size/best/worst)
+
+    >>> cheapest(["[-]" + "+" * 200, "[-]" + "-" * 56])
+    '[-]--------------------------------------------------------'
+    """
+    return min(codes, key=lambda code: getattr(
+        estimate(code, inputs, ranges), key))
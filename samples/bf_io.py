@@ -0,0 +1,216 @@
+# Brainf*ck シミュレータ用の入出力
+# バイト単位でバッファリングして、1文字ごとのシステムコールを避ける
+
+import io
+import os
+from typing import IO, Any
+
+# EOF の扱い (bf2c の -z/-m/-n に対応)
+EOF_ZERO = "zero"  # EOF は 0
+EOF_MINUS = "minus"  # EOF は -1 (デフォルト)
+EOF_NO_EFFECT = "no-effect"  # EOF はセルを変更しない
+EOF_KINDS = (EOF_ZERO, EOF_MINUS, EOF_NO_EFFECT)
+
+# フラッシュの方針. 正の数は N バイトごとにフラッシュ (1 が bf2c の -F に対応)
+FLUSH_NEVER = 0  # バッファが一杯になった時と、run() の終了時のみ
+FLUSH_NEWLINE = -1  # 改行ごと
+
+# バッファのサイズ
+BUFFER_SIZE = 8192
+
+
+class InputPending(Exception):
+    """no input available yet (BfAsyncInput). retry after fill()"""
+
+
+def _binary_stream(stream: IO[Any]) -> Any:
+    """binary stream of stream. None if text only stream (e.g. StringIO)"""
+    if isinstance(stream, io.TextIOBase):
+        return getattr(stream, "buffer", None)
+    return stream
+
+
+class BfOutput:
+    """buffered output"""
+
+    def __init__(self, stream: IO[Any], flush: int = FLUSH_NEVER):
+        # 出力先
+        self.stream = stream
+        # フラッシュの方針
+        self.flush_policy = flush
+        # 出力バッファ
+        self.buffer = bytearray()
+        # 出力したバイト数(バッファ内を含む)
+        self.position = 0
+        self._binary = _binary_stream(stream)
+
+    def put(self, value: int):
+        """put 1 byte"""
+        self.buffer.append(value & 0xff)
+        self.position += 1
+        policy = self.flush_policy
+        if len(self.buffer) >= BUFFER_SIZE \
+                or (policy == FLUSH_NEWLINE and value == 0x0a) \
+                or (0 < policy <= len(self.buffer)):
+            self.flush()
+
+    def flush(self):
+        """write buffer to stream"""
+        if not self.buffer:
+            return
+        if self._binary is None:
+            # テキストのみのストリームは 1byte = 1文字 として書き込む
+            self.stream.write(self.buffer.decode("latin-1"))
+        else:
+            if self._binary is not self.stream:
+                # テキスト層に残っている出力を先に書き出す
+                self.stream.flush()
+            self._binary.write(self.buffer)
+        self.buffer.clear()
+        self.stream.flush()
+
+    def rewind(self, position: int):
+        """
+        set output position. truncate stream if seekable
+        (チェックポイントから再開する時に、その後の出力を取り消す)
+        """
+        self.flush()
+        self.stream.flush()
+        stream = self.stream if self._binary is None else self._binary
+        if stream.seekable():
+            stream.seek(position)
+            stream.truncate()
+        self.position = position
+
+
+class BfInput:
+    """buffered input"""
+
+    def __init__(self, stream: IO[Any], chunk_size: int = BUFFER_SIZE):
+        # 入力元
+        self.stream = stream
+        # 一度に読み込むサイズ
+        self.chunk_size = chunk_size
+        # 入力バッファと、次に読む位置
+        self.buffer = b""
+        self.offset = 0
+        # 読み込んだバイト数(EOFは含まない)
+        self.position = 0
+        self._binary = _binary_stream(stream)
+
+    def get(self) -> int:
+        """get 1 byte. -1 if EOF"""
+        if len(self.buffer) <= self.offset:
+            self.buffer = self._read()
+            self.offset = 0
+            if not self.buffer:
+                return -1
+        value = self.buffer[self.offset]
+        self.offset += 1
+        self.position += 1
+        return value
+
+    def skip(self, position: int):
+        """skip input until position (チェックポイントから再開する時に使う)"""
+        self.buffer = b""
+        self.offset = 0
+        stream = self.stream if self._binary is None else self._binary
+        if stream.seekable():
+            stream.seek(position)
+            self.position = position
+            return
+        while self.position < position:
+            if self.get() < 0:
+                break
+
+    def _read(self) -> bytes:
+        if self._binary is None:
+            # テキストのみのストリームは UTF-8 のバイト列として読む
+            return self.stream.read(self.chunk_size).encode("utf-8")
+        read1 = getattr(self._binary, "read1", None)
+        if read1 is not None:
+            # 読み込める分だけ読む(対話的な入力でブロックしないように)
+            return read1(self.chunk_size)
+        return self._binary.read(self.chunk_size)
+
+
+class BfAsyncInput(BfInput):
+    """
+    input from asyncio.StreamReader.
+
+    バッファが空の時は読み込みを待たずに InputPending を投げる.
+    呼び出し側が await fill() で読み込んでから、同じ命令をやり直す
+    """
+
+    def __init__(self, reader: Any, chunk_size: int = BUFFER_SIZE):
+        super().__init__(reader, chunk_size)
+        # EOF を読んだか
+        self.eof = False
+        # スキップする残りのバイト数
+        self._skip = 0
+
+    def get(self) -> int:
+        """get 1 byte. -1 if EOF. raise InputPending if no data"""
+        if len(self.buffer) <= self.offset:
+            if self.eof:
+                return -1
+            raise InputPending()
+        value = self.buffer[self.offset]
+        self.offset += 1
+        self.position += 1
+        return value
+
+    def skip(self, position: int):
+        """skip input until position. skipped while fill()"""
+        self.buffer = b""
+        self.offset = 0
+        self._skip = position - self.position
+        self.position = position
+
+    async def fill(self):
+        """read from reader until some data or EOF"""
+        while len(self.buffer) <= self.offset and not self.eof:
+            data = await self.stream.read(self.chunk_size)
+            if not data:
+                self.eof = True
+            elif self._skip:
+                skipped = min(self._skip, len(data))
+                self._skip -= skipped
+                (self.buffer, self.offset) = (data, skipped)
+            else:
+                (self.buffer, self.offset) = (data, 0)
+
+
+class BfAsyncOutput(BfOutput):
+    """
+    output to asyncio.StreamWriter.
+
+    flush() は writer.write() するだけでブロックしない.
+    書き込みの完了は呼び出し側が await writer.drain() で待つ
+    """
+
+    def __init__(self, writer: Any, flush: int = FLUSH_NEVER):
+        super().__init__(writer, flush)
+
+    def flush(self):
+        """write buffer to writer"""
+        if not self.buffer:
+            return
+        self.stream.write(bytes(self.buffer))
+        self.buffer.clear()
+
+    def rewind(self, position: int):
+        """set output position (ソケットには取り消しできない)"""
+        self.flush()
+        self.position = position
+
+
+def make_private_dir(path: str):
+    """
+    自分だけが書き込めるディレクトリを作る. コンパイル結果のキャッシュ用.
+    他のユーザーのもの、または他から書き込める場合は PermissionError
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    status = os.stat(path)
+    if status.st_uid != os.getuid() or status.st_mode & 0o022:
+        raise PermissionError(f"insecure cache directory: {path}")
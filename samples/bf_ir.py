@@ -0,0 +1,172 @@
+# Brainf*ck の中間表現(IR)
+# 連続する命令や定型のループを1命令にまとめて、シミュレータで高速に実行する
+
+import functools
+from typing import Any, Dict, List, Tuple
+
+# 命令の種類
+OP_ADD = 0  # arg: 加算値
+OP_MOVE = 1  # arg: 移動量
+OP_CLEAR = 2  # arg: なし. [-] / [+]
+OP_MULTI = 3  # arg: (((offset, 係数), ...), 1回あたりの増減, 最小offset, 最大offset)
+OP_OPEN = 4  # arg: 対応する OP_CLOSE の位置
+OP_CLOSE = 5  # arg: 対応する OP_OPEN の位置
+OP_IN = 6  # arg: なし
+OP_OUT = 7  # arg: なし
+OP_CALL = 8  # arg: 独自拡張の命令(1文字)
+OP_SCAN = 9  # arg: 移動量. [>] / [<<] など 0 のセルを探すループ
+
+# 1命令. (命令の種類, 引数)
+Op = Tuple[int, Any]
+
+COMMANDS = "+-<>[],."
+
+
+class IrProgram:
+    """compiled Brainf*ck program"""
+
+    def __init__(self, code: List[Op], sources: List[int]):
+        # 命令の列
+        self.code = code
+        # 命令に対応するソースコードのindex. 末尾にソースコードの長さを追加
+        self.sources = sources
+        # ソースコードのindex から命令の位置への逆引き
+        self.pc_of: Dict[int, int] = {
+            index: pc for (pc, index) in enumerate(sources)}
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+
+def _fold_loop(body: List[Op]) -> Op:
+    """
+    ループ本体が加減算と移動だけなら、クリア/乗算の1命令にまとめる.
+    まとめられない場合は (OP_OPEN, None) を返す
+
+    >>> _fold_loop([(OP_ADD, -1)])
+    (2, None)
+    >>> _fold_loop([(OP_ADD, -1), (OP_MOVE, 1), (OP_ADD, 2), (OP_MOVE, -1)])
+    (3, (((1, 2),), -1, 1, 1))
+    >>> _fold_loop([(OP_MOVE, 1)])
+    (9, 1)
+    >>> _fold_loop([(OP_MOVE, 1), (OP_ADD, 1)])
+    (4, None)
+    """
+    if len(body) == 1 and body[0][0] == OP_MOVE:
+        return (OP_SCAN, body[0][1])
+    offset = 0
+    deltas: Dict[int, int] = {}
+    for (op, arg) in body:
+        if op == OP_ADD:
+            deltas[offset] = deltas.get(offset, 0) + arg
+        elif op == OP_MOVE:
+            offset += arg
+        else:
+            return (OP_OPEN, None)
+    step = deltas.pop(0, 0)
+    if offset != 0 or step not in (-1, 1):
+        return (OP_OPEN, None)
+    pairs = tuple((k, v) for (k, v) in sorted(deltas.items()) if v != 0)
+    if not pairs:
+        return (OP_CLEAR, None)
+    offsets = [k for (k, _) in pairs]
+    return (OP_MULTI, (pairs, step, min(offsets), max(offsets)))
+
+
+def scan(mem: Any, p: int, stride: int, limit: int = 0) -> int:
+    """
+    0 のセルまで stride ずつポインタを移動する. 移動後のポインタを返す.
+    mem の長さ以降は(未確保の) 0 のセルとみなす. limit はメモリサイズの上限
+
+    >>> scan(bytearray([1, 0, 1, 1, 0]), 0, 2)
+    4
+    >>> scan(bytearray([0, 1, 1, 0]), 3, -1)
+    3
+    >>> scan(bytearray([1, 1, 1]), 1, 1, 10)
+    3
+    """
+    length = len(mem)
+    if isinstance(mem, bytearray) and stride == 1:
+        # 1セルずつの移動は bytearray の検索でまとめて行う
+        q = mem.find(0, p)
+        if q < 0:
+            q = length
+    elif isinstance(mem, bytearray) and stride == -1:
+        q = mem.rfind(0, 0, p + 1)
+    else:
+        q = p
+        while 0 <= q < length and mem[q]:
+            q += stride
+    if q < 0 or max(limit, length) <= q:
+        raise ValueError(f"pointer={q}")
+    return q
+
+
+@functools.lru_cache(maxsize=32)
+def compile_ir(source: str, extensions: str = "") -> IrProgram:
+    """
+    ソースコードを中間表現に変換する.
+    extensions は独自拡張の命令(OP_CALL で呼び出す).
+    同じソースを何度も実行する場合のため、変換結果はキャッシュする
+
+    >>> compile_ir("+++>>-<[-]").code
+    [(0, 3), (1, 2), (0, -1), (1, -1), (2, None)]
+    >>> compile_ir("+[->+<]").code
+    [(0, 1), (3, (((1, 1),), -1, 1, 1))]
+    """
+    code: List[Op] = []
+    sources: List[int] = []
+    stack: List[int] = []
+    length = len(source)
+    i = 0
+    while i < length:
+        ch = source[i]
+        if ch in "+-<>":
+            # 連続する加減算/移動をまとめる (命令以外の文字は読み飛ばす)
+            (kind, signs) = (OP_ADD, "+-") if ch in "+-" else (OP_MOVE, "><")
+            start = i
+            value = 0
+            while i < length:
+                ch = source[i]
+                if ch == signs[0]:
+                    value += 1
+                elif ch == signs[1]:
+                    value -= 1
+                elif ch in COMMANDS or ch in extensions:
+                    break
+                i += 1
+            if value != 0:
+                code.append((kind, value))
+                sources.append(start)
+            continue
+        if ch == '[':
+            stack.append(len(code))
+            code.append((OP_OPEN, None))
+            sources.append(i)
+        elif ch == ']':
+            if not stack:
+                raise ValueError(f"unmatched ']' at index={i}")
+            start = stack.pop()
+            folded = _fold_loop(code[start + 1:])
+            if folded[0] != OP_OPEN:
+                del code[start:]
+                del sources[start + 1:]
+                code.append(folded)
+            else:
+                code[start] = (OP_OPEN, len(code))
+                code.append((OP_CLOSE, start))
+                sources.append(i)
+        elif ch == ',':
+            code.append((OP_IN, None))
+            sources.append(i)
+        elif ch == '.':
+            code.append((OP_OUT, None))
+            sources.append(i)
+        elif ch in extensions:
+            code.append((OP_CALL, ch))
+            sources.append(i)
+        i += 1
+    if stack:
+        raise ValueError(f"unmatched '[' at index={sources[stack[-1]]}")
+    sources.append(length)
+    return IrProgram(code, sources)
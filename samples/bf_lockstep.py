@@ -0,0 +1,175 @@
+# Brainf*ck の同じプログラムを、複数のメモリの状態で同時に実行する
+# メモリは NumPy の2次元配列(1行が1レーン)で、同じ命令を実行するレーンをまとめて処理する
+
+from typing import Any, List, Optional, Sequence
+import bf_io
+import bf_ir
+from bf_ir import (OP_ADD, OP_MOVE, OP_CLEAR, OP_MULTI, OP_OPEN, OP_CLOSE,
+                   OP_IN, OP_OUT, OP_SCAN)
+from bf_sim import CELL_SIZES, new_tape
+
+try:
+    import numpy as np
+except ImportError:  # numpy はオプション
+    np = None  # type: ignore
+
+# セルのサイズごとの NumPy の型
+_DTYPES = {1: "uint8", 2: "uint16", 4: "uint32"}
+
+
+class BfLockstep:
+    """
+    run same program over many tapes in lockstep.
+
+    pc が最も小さいレーンの命令を、同じ pc の全レーンでまとめて実行する.
+    ループの回数が違って分岐したレーンは、遅れたレーンが追いついた所で合流する
+    """
+
+    def __init__(self,
+                 source: str,
+                 lanes: int,
+                 size: int = 30000,
+                 inputs: Optional[Sequence[bytes]] = None,
+                 cell_size: int = 1,
+                 eof: str = bf_io.EOF_MINUS):
+        if np is None:
+            raise ImportError("numpy is required for BfLockstep")
+        if cell_size not in CELL_SIZES:
+            raise ValueError(f"cell_size={cell_size}")
+        if eof not in bf_io.EOF_KINDS:
+            raise ValueError(f"eof={eof}")
+        if inputs is not None and len(inputs) != lanes:
+            raise ValueError(f"inputs={len(inputs)}")
+
+        # 中間表現
+        self.program = bf_ir.compile_ir(source)
+        # レーン数とメモリサイズ
+        self.lanes = lanes
+        self.size = size
+        # セルのサイズ(byte)と、値のマスク
+        self.cell_size = cell_size
+        self.mask = (1 << (8 * cell_size)) - 1
+        # メモリ. memory[lane, pos] がレーン lane のセル pos
+        self.memory = np.zeros((lanes, size), dtype=_DTYPES[cell_size])
+        # レーンごとのポインタと、次に実行する命令(中間表現の位置)
+        self.pointers = np.zeros(lanes, dtype=np.int64)
+        self.pcs = np.zeros(lanes, dtype=np.int64)
+        # EOF の扱い. bf_io.EOF_ZERO / EOF_MINUS / EOF_NO_EFFECT
+        self.eof = eof
+        # レーンごとの入力と、次に読む位置
+        self.inputs = [b""] * lanes if inputs is None else list(inputs)
+        self._positions = [0] * lanes
+        # レーンごとの出力
+        self.outputs = [bytearray() for _ in range(lanes)]
+
+    def is_stopped(self) -> bool:
+        return len(self.program) <= int(self.pcs.min())
+
+    def run(self, steps: int) -> int:
+        """execute steps. 1 step = 1 op for a group of lanes"""
+        code = self.program.code
+        end = len(code)
+        pcs = self.pcs
+        for n in range(steps):
+            pc = int(pcs.min())
+            if end <= pc:
+                return n
+            lanes = np.flatnonzero(pcs == pc)
+            self._execute(code[pc], pc, lanes)
+        return steps
+
+    def memory_of(self, lane: int) -> Any:
+        """memory of lane. same type as BfSim.memory"""
+        tape = new_tape(self.size, self.cell_size)
+        with memoryview(tape) as view:
+            view.cast("B")[:] = self.memory[lane].tobytes()
+        return tape
+
+    def _execute(self, instruction: bf_ir.Op, pc: int, lanes: Any):
+        """execute 1 op for lanes"""
+        (op, arg) = instruction
+        mem = self.memory
+        mask = self.mask
+        p = self.pointers[lanes]
+        if op == OP_ADD:
+            mem[lanes, p] = (mem[lanes, p].astype(np.int64) + arg) & mask
+        elif op == OP_MOVE:
+            p += arg
+            self._check(lanes, p)
+            self.pointers[lanes] = p
+        elif op == OP_CLEAR:
+            mem[lanes, p] = 0
+        elif op == OP_OPEN:
+            self.pcs[lanes] = np.where(mem[lanes, p] == 0, arg + 1, pc + 1)
+            return
+        elif op == OP_CLOSE:
+            self.pcs[lanes] = np.where(mem[lanes, p] != 0, arg + 1, pc + 1)
+            return
+        elif op == OP_MULTI:
+            value = mem[lanes, p].astype(np.int64)
+            # 値が 0 のレーンはループに入らない
+            nonzero = value != 0
+            (loops, p, value) = (lanes[nonzero], p[nonzero], value[nonzero])
+            (pairs, delta, low, high) = arg
+            self._check(loops, p + low)
+            self._check(loops, p + high)
+            if 0 < delta:
+                # [+>+<] の形式は (mask + 1 - value) 回ループする
+                value = -value & mask
+            for (offset, factor) in pairs:
+                q = p + offset
+                mem[loops, q] = \
+                    (mem[loops, q].astype(np.int64) + value * factor) & mask
+            mem[loops, p] = 0
+        elif op == OP_SCAN:
+            live = mem[lanes, p] != 0
+            while live.any():
+                p[live] += arg
+                self._check(lanes[live], p[live])
+                live[live] = mem[lanes[live], p[live]] != 0
+            self.pointers[lanes] = p
+        elif op == OP_IN:
+            for (lane, pos) in zip(lanes.tolist(), p.tolist()):
+                self._get_char(lane, pos)
+        elif op == OP_OUT:
+            for (lane, value) in zip(lanes.tolist(), mem[lanes, p].tolist()):
+                self.outputs[lane].append(value & 0xff)
+        else:
+            raise ValueError(f"unsupported op={op}")
+        self.pcs[lanes] = pc + 1
+
+    def _check(self, lanes: Any, p: Any):
+        """raise ValueError if pointer is out of memory"""
+        outside = (p < 0) | (self.size <= p)
+        if outside.any():
+            i = int(np.flatnonzero(outside)[0])
+            raise ValueError(f"lane={int(lanes[i])}, pointer={int(p[i])}")
+
+    def _get_char(self, lane: int, pos: int):
+        data = self.inputs[lane]
+        position = self._positions[lane]
+        if position < len(data):
+            value = data[position]
+            self._positions[lane] = position + 1
+        elif self.eof == bf_io.EOF_NO_EFFECT:
+            return
+        else:
+            value = 0 if self.eof == bf_io.EOF_ZERO else self.mask
+        self.memory[lane, pos] = value
+
+
+def run_lockstep(source: str,
+                 memories: Sequence[dict],
+                 size: int = 30000,
+                 steps: int = 10000000,
+                 cell_size: int = 1) -> List[Any]:
+    """
+    run source over memories (1 dict = initial memory of 1 lane).
+    returns memory of each lane (same type as BfSim.memory)
+    """
+    sim = BfLockstep(source, len(memories), size, cell_size=cell_size)
+    for (lane, memory) in enumerate(memories):
+        for (pos, value) in memory.items():
+            sim.memory[lane, pos] = value
+    sim.run(steps)
+    return [sim.memory_of(lane) for lane in range(sim.lanes)]
@@ -0,0 +1,228 @@
+# Brainf*ck を C に変換し、gcc で共有ライブラリにして ctypes で実行する
+# 変換結果は bf2c.c の transrate と同じ動作(セルのラップアラウンド, EOF の扱い)にする.
+# ただしメモリは呼び出し側のバッファを使い、ポインタの範囲外は実行を中断する
+
+import ctypes
+import hashlib
+import os
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
+import bf_io
+import bf_ir
+from bf_ir import (OP_ADD, OP_MOVE, OP_CLEAR, OP_MULTI, OP_OPEN, OP_CLOSE,
+                   OP_IN, OP_OUT, OP_SCAN)
+
+# コンパイラとオプション
+CC = "gcc"
+CFLAGS = ["-O2", "-shared", "-fPIC"]
+
+# 生成するコードの形式のバージョン. 形式を変えたらディスクのキャッシュを無効にする
+CODE_VERSION = 1
+
+# セルのサイズごとの C の型
+_CELL_TYPES = {1: "uint8_t", 2: "uint16_t", 4: "uint32_t"}
+
+# 入出力のコールバック
+GETFUNC = ctypes.CFUNCTYPE(ctypes.c_int)
+PUTFUNC = ctypes.CFUNCTYPE(None, ctypes.c_int)
+
+# ロード済みの関数. キーはソースのハッシュ値
+_cache: Dict[str, Callable[..., int]] = {}
+
+
+def _body(program: bf_ir.IrProgram, eof: str) -> List[str]:
+    """translate intermediate representation to lines of C"""
+    lines: List[str] = []
+    indent = "  "
+    for (op, arg) in program.code:
+        if op == OP_ADD:
+            lines.append(f"{indent}buff[p] += {arg};")
+        elif op == OP_MOVE:
+            lines.append(f"{indent}p += {arg};")
+            if arg < 0:
+                lines.append(f"{indent}if (p < 0) goto oob;")
+            else:
+                lines.append(f"{indent}if (size <= p) goto oob;")
+        elif op == OP_CLEAR:
+            lines.append(f"{indent}buff[p] = 0;")
+        elif op == OP_SCAN:
+            lines.append(f"{indent}while (buff[p]) {{")
+            lines.append(f"{indent}  p += {arg};")
+            lines.append(f"{indent}  if (p < 0 || size <= p) goto oob;")
+            lines.append(f"{indent}}}")
+        elif op == OP_MULTI:
+            (pairs, delta, low, high) = arg
+            lines.append(f"{indent}if (buff[p]) {{")
+            sign = "-" if 0 < delta else ""
+            lines.append(f"{indent}  v = {sign}buff[p];")
+            lines.append(
+                f"{indent}  if (p + {low} < 0) {{ p += {low}; goto oob; }}")
+            lines.append(
+                f"{indent}  if (size <= p + {high})"
+                f" {{ p += {high}; goto oob; }}")
+            for (offset, factor) in pairs:
+                lines.append(f"{indent}  buff[p + {offset}] += v * {factor};")
+            lines.append(f"{indent}  buff[p] = 0;")
+            lines.append(f"{indent}}}")
+        elif op == OP_OPEN:
+            lines.append(f"{indent}while (buff[p]) {{")
+            indent += "  "
+        elif op == OP_CLOSE:
+            indent = indent[:-2]
+            lines.append(f"{indent}}}")
+        elif op == OP_IN:
+            lines.append(f"{indent}ch = get();")
+            if eof == bf_io.EOF_ZERO:
+                lines.append(f"{indent}if (ch == EOF) ch = 0;")
+            if eof == bf_io.EOF_NO_EFFECT:
+                lines.append(f"{indent}if (ch != EOF)")
+            lines.append(f"{indent}buff[p] = ch;")
+        elif op == OP_OUT:
+            lines.append(f"{indent}put(buff[p]);")
+        else:
+            raise ValueError(f"unsupported op={op}")
+    return lines
+
+
+def translate(source: str,
+              cell_size: int = 1,
+              eof: str = bf_io.EOF_MINUS) -> str:
+    """
+    Brainf*ck のソースコードを、共有ライブラリ用の C のソースコードに変換する.
+    bf_main() はポインタの範囲外で 1 を返す(*pointer は範囲外の位置)
+
+    >>> print(translate("+[->++<]>."), end="")
+    #include <stdio.h>
+    #include <stdint.h>
+    typedef uint8_t cell;
+    int bf_main(cell* buff, long size, long* pointer,
+                int (*get)(void), void (*put)(int)) {
+      long p = *pointer;
+      cell v;
+      int ch;
+      buff[p] += 1;
+      if (buff[p]) {
+        v = buff[p];
+        if (p + 1 < 0) { p += 1; goto oob; }
+        if (size <= p + 1) { p += 1; goto oob; }
+        buff[p + 1] += v * 2;
+        buff[p] = 0;
+      }
+      p += 1;
+      if (size <= p) goto oob;
+      put(buff[p]);
+      *pointer = p;
+      return 0;
+    oob:
+      *pointer = p;
+      return 1;
+    }
+    """
+    program = bf_ir.compile_ir(source)
+    lines = [
+        "#include <stdio.h>",
+        "#include <stdint.h>",
+        f"typedef {_CELL_TYPES[cell_size]} cell;",
+        "int bf_main(cell* buff, long size, long* pointer,",
+        "            int (*get)(void), void (*put)(int)) {",
+        "  long p = *pointer;",
+        "  cell v;",
+        "  int ch;",
+    ]
+    lines.extend(_body(program, eof))
+    lines.extend([
+        "  *pointer = p;",
+        "  return 0;",
+        "oob:",
+        "  *pointer = p;",
+        "  return 1;",
+        "}",
+    ])
+    return "\n".join(lines) + "\n"
+
+
+def cache_key(source: str,
+              cell_size: int = 1,
+              eof: str = bf_io.EOF_MINUS) -> str:
+    "キャッシュのキー(ソースのハッシュ値)"
+    text = f"{CODE_VERSION}:{cell_size}:{eof}:{source}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def default_cache_dir() -> str:
+    """directory of compiled shared objects (if BfSim.cache_dir is None)"""
+    # 共有の /tmp では他のユーザーが .so を置けるので、ユーザーごとに分ける
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bf_native")
+
+
+def load_function(source: str,
+                  cell_size: int = 1,
+                  eof: str = bf_io.EOF_MINUS,
+                  cache_dir: Optional[str] = None) -> Callable[..., int]:
+    """
+    変換・コンパイル済みの bf_main() を返す.
+    共有ライブラリは cache_dir にソースのハッシュ値をファイル名にして保存する
+    """
+    key = cache_key(source, cell_size, eof)
+    if key in _cache:
+        return _cache[key]
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    bf_io.make_private_dir(cache_dir)
+    path = os.path.join(cache_dir, f"{key}.so")
+    if not os.path.exists(path):
+        work_path = f"{path}.{os.getpid()}"
+        with open(f"{work_path}.c", "w") as c_file:
+            c_file.write(translate(source, cell_size, eof))
+        try:
+            subprocess.run(
+                [CC, *CFLAGS, "-o", f"{work_path}.so", f"{work_path}.c"],
+                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            os.replace(f"{work_path}.so", path)
+        finally:
+            os.remove(f"{work_path}.c")
+    function = ctypes.CDLL(path).bf_main
+    function.restype = ctypes.c_int
+    function.argtypes = [ctypes.c_void_p, ctypes.c_long,
+                         ctypes.POINTER(ctypes.c_long), GETFUNC, PUTFUNC]
+    _cache[key] = function
+    return function
+
+
+def run(sim: Any, function: Callable[..., int]) -> int:
+    """execute compiled function with BfSim. returns pointer"""
+    # 関数はメモリ全体を使うので、先に全ページを確保する
+    sim._grow(sim.size - 1)
+    # コールバック内の例外は C 側に伝わらないので、保存して後で投げる
+    errors: List[BaseException] = []
+
+    def get_char() -> int:
+        try:
+            return sim._input.get()
+        except BaseException as e:
+            errors.append(e)
+            return -1
+
+    def put_char(value: int):
+        try:
+            sim._output.put(value)
+        except BaseException as e:
+            errors.append(e)
+
+    pointer = ctypes.c_long(sim.pointer)
+    buffer = (ctypes.c_char * (sim.size * sim.cell_size)).from_buffer(
+        sim.memory)
+    try:
+        result = function(ctypes.addressof(buffer), sim.size,
+                          ctypes.byref(pointer),
+                          GETFUNC(get_char), PUTFUNC(put_char))
+    finally:
+        # バッファを解放しないとメモリの長さを変更できない
+        del buffer
+    if errors:
+        raise errors[0]
+    if result != 0:
+        raise ValueError(f"pointer={pointer.value}")
+    return pointer.value
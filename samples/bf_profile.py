@@ -0,0 +1,75 @@
+# Brainf*ck シミュレータ用のループ単位のプロファイラ
+
+from typing import Any, Dict, List, Tuple
+
+
+class LoopStat:
+    """statistics of 1 loop ('[' ... ']')"""
+
+    def __init__(self, index: int):
+        # '[' のindex
+        self.index = index
+        # ループに入った回数('[' を実行した回数)
+        self.entries = 0
+        # ループ本体を実行した回数
+        self.iterations = 0
+        # ループ内で実行した命令数(ネストしたループを含む. '[' ']' も含む)
+        self.steps = 0
+
+
+class BfProfiler:
+    """
+    loop profiler for BfSim.
+
+    BfSim.profiler に設定すると、1文字ずつ実行しながらループごとの統計を取る
+    (engine の指定に関係なく1文字ずつ実行する)
+    """
+
+    def __init__(self):
+        # ループの統計. キーは '[' のindex
+        self.loops: Dict[int, LoopStat] = {}
+        # 実行した命令数(命令以外の文字は数えない)
+        self.steps = 0
+        # 実行中のループ. ('[' のindex, ループに入った時の命令数)
+        self._stack: List[Tuple[int, int]] = []
+
+    def count(self, sim: Any):
+        """count 1 step. call before execute"""
+        ch = sim.source[sim.index]
+        if ch not in sim.instructions:
+            return
+        self.steps += 1
+        if ch == '[':
+            stat = self.loops.get(sim.index)
+            if stat is None:
+                stat = self.loops[sim.index] = LoopStat(sim.index)
+            stat.entries += 1
+            if sim.memory[sim.pointer] != 0:
+                stat.iterations += 1
+                self._stack.append((sim.index, self.steps))
+            else:
+                stat.steps += 1
+        elif ch == ']' and self._stack:
+            (start, steps) = self._stack[-1]
+            if sim.memory[sim.pointer] != 0:
+                self.loops[start].iterations += 1
+            else:
+                self._stack.pop()
+                self.loops[start].steps += self.steps - steps + 1
+
+    def hot_loops(self) -> List[LoopStat]:
+        """loops sorted by steps (descending)"""
+        return sorted(self.loops.values(),
+                      key=lambda stat: (-stat.steps, stat.index))
+
+    def report(self, sim: Any, limit: int = 20) -> str:
+        """hot loop report"""
+        lines = [f"total steps: {self.steps}",
+                 "     steps  ratio   entries  iterations  line:column"]
+        for stat in self.hot_loops()[:limit]:
+            (line, column) = sim.position_of(stat.index)
+            ratio = stat.steps / self.steps if self.steps else 0.0
+            lines.append(
+                f"{stat.steps:10d} {ratio:6.1%} {stat.entries:9d}"
+                f" {stat.iterations:11d}  {line}:{column}")
+        return "\n".join(lines) + "\n"
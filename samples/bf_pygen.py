@@ -0,0 +1,202 @@
+# Brainf*ck を Python のソースコードに変換して実行する
+# 変換結果のコードオブジェクトはソースのハッシュ値をキーにキャッシュする
+
+import hashlib
+import marshal
+import os
+import sys
+from types import CodeType
+from typing import Dict, List, Optional
+import bf_io
+import bf_ir
+from bf_ir import (OP_ADD, OP_MOVE, OP_CLEAR, OP_MULTI, OP_OPEN, OP_CLOSE,
+                   OP_IN, OP_OUT, OP_SCAN)
+
+# ブロックのネストの上限(CPython は 20). これより深いループは関数に分ける
+MAX_DEPTH = 16
+
+# 生成するコードの形式のバージョン. 形式を変えたらディスクのキャッシュを無効にする
+CODE_VERSION = 2
+
+# コンパイル済みのコードオブジェクト. キーはソースのハッシュ値
+_cache: Dict[str, CodeType] = {}
+
+
+class _Translator:
+    """translate intermediate representation to python source code"""
+
+    def __init__(self, program: bf_ir.IrProgram, mask: int):
+        self.code = program.code
+        self.mask = mask
+        # 生成した関数(1要素が1関数分の行)
+        self.functions: List[List[str]] = []
+
+    def translate(self) -> str:
+        lines = ["def bf_main(mem, p, limit):"]
+        self.functions.append(lines)
+        self._block(lines, 0, len(self.code), 1)
+        lines.append("    return p")
+        return "\n".join(
+            "\n".join(function) for function in reversed(self.functions)
+        ) + "\n"
+
+    def _block(self, lines: List[str], begin: int, end: int, depth: int):
+        """translate code[begin:end] to lines"""
+        indent = "    " * depth
+        mask = self.mask
+        pc = begin
+        if begin == end:
+            lines.append(indent + "pass")
+        while pc < end:
+            (op, arg) = self.code[pc]
+            if op == OP_ADD:
+                lines.append(f"{indent}mem[p] = (mem[p] + {arg}) & {mask}")
+            elif op == OP_MOVE:
+                lines.append(f"{indent}p += {arg}")
+                if arg < 0:
+                    lines.append(f"{indent}if p < 0: _oob(p)")
+                else:
+                    lines.append(f"{indent}if limit <= p: limit = _grow(p)")
+            elif op == OP_CLEAR:
+                lines.append(f"{indent}mem[p] = 0")
+            elif op == OP_SCAN:
+                lines.append(f"{indent}if mem[p]:")
+                lines.append(f"{indent}    p = _scan(mem, p, {arg})")
+                lines.append(f"{indent}    if limit <= p: limit = _grow(p)")
+            elif op == OP_MULTI:
+                (pairs, delta, low, high) = arg
+                lines.append(f"{indent}v = mem[p]")
+                lines.append(f"{indent}if v:")
+                if 0 < delta:
+                    lines.append(f"{indent}    v = -v & {mask}")
+                lines.append(f"{indent}    if p + {low} < 0: _oob(p + {low})")
+                lines.append(
+                    f"{indent}    if limit <= p + {high}:"
+                    f" limit = _grow(p + {high})")
+                for (offset, factor) in pairs:
+                    lines.append(
+                        f"{indent}    mem[p + {offset}] = "
+                        f"(mem[p + {offset}] + v * {factor}) & {mask}")
+                lines.append(f"{indent}    mem[p] = 0")
+            elif op == OP_OPEN:
+                if MAX_DEPTH <= depth:
+                    # ネストが深すぎるので別の関数にする
+                    name = f"_loop{len(self.functions)}"
+                    function = [f"def {name}(mem, p, limit):"]
+                    self.functions.append(function)
+                    function.append("    while mem[p]:")
+                    self._block(function, pc + 1, arg, 2)
+                    function.append("    return (p, limit)")
+                    lines.append(
+                        f"{indent}(p, limit) = {name}(mem, p, limit)")
+                else:
+                    lines.append(f"{indent}while mem[p]:")
+                    self._block(lines, pc + 1, arg, depth + 1)
+                pc = arg
+            elif op == OP_CLOSE:
+                raise ValueError(f"unexpected close at {pc}")
+            elif op == OP_IN:
+                lines.append(f"{indent}_in(p)")
+            elif op == OP_OUT:
+                lines.append(f"{indent}_out(p)")
+            else:
+                lines.append(f"{indent}p = _call({arg!r}, p)")
+                lines.append(f"{indent}limit = len(mem)")
+            pc += 1
+
+
+def translate(source: str, extensions: str = "", mask: int = 0xff) -> str:
+    """
+    Brainf*ck のソースコードを Python のソースコードに変換する
+
+    >>> print(translate("+[->++<]>."), end="")
+    def bf_main(mem, p, limit):
+        mem[p] = (mem[p] + 1) & 255
+        v = mem[p]
+        if v:
+            if p + 1 < 0: _oob(p + 1)
+            if limit <= p + 1: limit = _grow(p + 1)
+            mem[p + 1] = (mem[p + 1] + v * 2) & 255
+            mem[p] = 0
+        p += 1
+        if limit <= p: limit = _grow(p)
+        _out(p)
+        return p
+    """
+    program = bf_ir.compile_ir(source, extensions)
+    return _Translator(program, mask).translate()
+
+
+def cache_key(source: str, extensions: str = "", mask: int = 0xff) -> str:
+    "キャッシュのキー(ソースのハッシュ値)"
+    text = f"{CODE_VERSION}:{mask}:{extensions}:{source}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_code(source: str,
+              extensions: str = "",
+              mask: int = 0xff,
+              cache_dir: Optional[str] = None) -> CodeType:
+    """
+    変換・コンパイル済みのコードオブジェクトを返す.
+    cache_dir を指定した場合は marshal 形式でディスクにもキャッシュする
+    """
+    key = cache_key(source, extensions, mask)
+    if key in _cache:
+        return _cache[key]
+    path = None
+    if cache_dir is not None:
+        # 他のユーザーが置いたコードを読み込まないよう、自分だけのディレクトリに限る
+        bf_io.make_private_dir(cache_dir)
+        # marshal の形式は Python のバージョンごとに異なる
+        tag = sys.implementation.cache_tag
+        path = os.path.join(cache_dir, f"{key}.{tag}.marshal")
+        if os.path.exists(path):
+            with open(path, "rb") as cache_file:
+                code = marshal.load(cache_file)
+            _cache[key] = code
+            return code
+    code = compile(translate(source, extensions, mask), f"<bf:{key}>", "exec")
+    if path is not None:
+        work_path = f"{path}.{os.getpid()}.tmp"
+        with open(work_path, "wb") as cache_file:
+            marshal.dump(code, cache_file)
+        os.replace(work_path, path)
+    _cache[key] = code
+    return code
+
+
+def _oob(pointer: int):
+    raise ValueError(f"pointer={pointer}")
+
+
+def run(sim, code: CodeType):
+    """execute code object with BfSim. returns pointer"""
+
+    def put_char(pointer: int):
+        sim.pointer = pointer
+        sim._put_char()
+
+    def get_char(pointer: int):
+        sim.pointer = pointer
+        sim._get_char()
+
+    def call(ch: str, pointer: int) -> int:
+        sim.pointer = pointer
+        sim.instructions[ch](sim)
+        return sim.pointer
+
+    def scan(mem, pointer: int, stride: int) -> int:
+        return bf_ir.scan(mem, pointer, stride, sim.size)
+
+    namespace = {
+        "_oob": _oob,
+        "_grow": sim._grow,
+        "_scan": scan,
+        "_in": get_char,
+        "_out": put_char,
+        "_call": call,
+    }
+    exec(code, namespace)
+    # limit は確保済みのメモリの長さ. 超えたら sim._grow() で伸ばす
+    return namespace["bf_main"](sim.memory, sim.pointer, len(sim.memory))
@@ -1,8 +1,61 @@
 # Brainf*ck 用のシミュレータ(インタプリタ 兼 単体テスト用)
 
 import sys
-import io
-from typing import List
+import argparse
+import asyncio
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+import bf_io
+import bf_ir
+import bf_native
+import bf_profile
+import bf_pygen
+from bf_ir import (OP_ADD, OP_MOVE, OP_CLEAR, OP_MULTI, OP_OPEN, OP_CLOSE,
+                   OP_IN, OP_OUT, OP_SCAN)
+
+# 実行エンジン
+#   step : 1文字ずつ実行する(デバッグ向け)
+#   ir   : 中間表現にコンパイルしてから実行する(高速)
+#   py   : Python のコードに変換して、最初から最後まで一度に実行する(さらに高速)
+#   native : C に変換して gcc でコンパイルし、最初から最後まで一度に実行する
+ENGINES = ("step", "ir", "py", "native")
+
+# セルのサイズ(byte). bf2c の -1/-2/-4 に対応
+CELL_SIZES = (1, 2, 4)
+
+# メモリはこのセル数単位で、使われた時に確保する
+PAGE_SIZE = 1024
+
+# run_async() でイベントループに制御を返す間隔(ステップ数)
+ASYNC_STEPS = 10000
+
+
+def new_tape(size: int, cell_size: int = 1) -> Any:
+    """
+    create zero-filled tape. bytearray / array('H') / array('I')
+
+    C の char/short/int は符号付きだが、0 判定とラップアラウンドの結果は
+    符号なしで扱っても同じになる
+    """
+    if cell_size == 1:
+        return bytearray(size)
+    if cell_size == 2:
+        return array('H', bytes(2 * size))
+    typecode = 'I' if array('I').itemsize == 4 else 'L'
+    return array(typecode, bytes(4 * size))
+
+
+# チェックポイントのファイル形式
+#   ヘッダ(マジック, 版数, セルのサイズ, 予備, セル数, ポインタ, index,
+#          入力位置, 出力位置, ソースの SHA-256) + メモリ(リトルエンディアン)
+CHECKPOINT_MAGIC = b"BFCP"
+CHECKPOINT_VERSION = 1
+_CHECKPOINT_HEADER = struct.Struct("<4sBBHQQQQQ32s")
 
 
 class BfSim:
@@ -11,26 +64,56 @@ class BfSim:
     def __init__(self,
                  source: str = "",
                  size: int = 30000,
-                 stdin: io.TextIOBase = None,
-                 stdout: io.TextIOBase = None):
+                 stdin: IO[Any] = None,
+                 stdout: IO[Any] = None,
+                 engine: str = "step",
+                 cell_size: int = 1,
+                 eof: str = bf_io.EOF_MINUS,
+                 flush: int = bf_io.FLUSH_NEVER):
         """create instance BfSim"""
 
-        # メモリサイズ
+        if engine not in ENGINES:
+            raise ValueError(f"engine={engine}")
+        if eof not in bf_io.EOF_KINDS:
+            raise ValueError(f"eof={eof}")
+        if cell_size not in CELL_SIZES:
+            raise ValueError(f"cell_size={cell_size}")
+
+        # メモリサイズ(上限)
         self.size = size
-        # メモリ
-        self.memory = [0] * size
+        # セルのサイズ(byte)と、値のマスク
+        self.cell_size = cell_size
+        self.mask = (1 << (8 * cell_size)) - 1
+        # メモリ. cell_size に応じて bytearray / array('H') / array('I')
+        # 最初は1ページ分だけ確保し、ポインタが進んだら size まで伸ばす.
+        # len(memory) が使用したメモリの上限(ページ単位)になる
+        self.memory = new_tape(min(size, PAGE_SIZE), cell_size)
         # ソースコード
         self.source = source
+        # 改行のindex. 行番号/列番号を求めるのに使う
+        self._newlines: List[int] = []
+        # 対応する括弧のindex. 括弧以外は -1
+        self._jumps: List[int] = []
+        self._build_jumps()
         # 次に実行する個所. ソースコードのindex(0～)
+        # 行番号/列番号は linenumber/columnnumber で必要な時に求める
         self.index = 0
-        # 次に実行する個所. ソースコードの行番号(1～)
-        self.linenumber = 1
-        # 次に実行する個所. ソースコードの列番号(1～)
-        self.columnnumber = 1
         # ポインタ
         self.pointer = 0
-        # ブレークポインタ. 止まるべきindexを格納
-        self.breakpoints: List[int] = []
+        # ブレークポインタ. 止まるべきindexを格納.
+        # 設定するとエンジンによらず1文字ずつ実行するので、ir の数十倍遅くなる
+        self.breakpoints: Set[int] = set()
+        # ウォッチポイント. 値が変わったら止まるべきセルの位置を格納.
+        # step 以外のエンジンは中間表現の1命令ごとに調べる(まとめたループは1命令).
+        # py / native も ir で実行するので遅くなる
+        self.watchpoints: Set[int] = set()
+        # ポインタの範囲 (low, high). ポインタが low <= pointer < high を外れたら止まる.
+        # ウォッチポイントと同じく、中間表現の1命令ごとに調べる
+        self.pointer_range: Optional[Tuple[int, int]] = None
+        # ループ単位のプロファイラ. 設定すると1文字ずつ実行しながら統計を取る
+        self.profiler: Optional[bf_profile.BfProfiler] = None
+        # 直前の run() が止まった理由. "breakpoint" / "watchpoint" / "pointer"
+        self.stop_reason: Optional[str] = None
         # 命令. 独自拡張の命令を追加可能
         self.instructions = {
             '+': lambda sim: sim._plus(),
@@ -42,29 +125,180 @@ class BfSim:
             ',': lambda sim: sim._get_char(),
             '.': lambda sim: sim._put_char(),
         }
-        # 標準入力. 必要なら代わりのTextIOBaseのインスタンスを設定する
-        # 例 -> io.StringIO("xxxx")
-        self.stdin = sys.stdin if stdin is None else stdin
-        # 標準出力. 必要なら代わりのTextIOBaseのインスタンスを設定する
-        # 例 -> io.StringIO()
-        self.stdout = sys.stdout if stdout is None else stdout
+        # EOF の扱い. bf_io.EOF_ZERO / EOF_MINUS / EOF_NO_EFFECT
+        self.eof = eof
+        # 入出力. バイト単位でバッファリングする
+        self._input = bf_io.BfInput(sys.stdin if stdin is None else stdin)
+        self._output = bf_io.BfOutput(
+            sys.stdout if stdout is None else stdout, flush)
+        # 実行エンジン
+        self.engine = engine
+        # コンパイル済みの中間表現. 最初の run() で作成する
+        self._ir: Optional[bf_ir.IrProgram] = None
+        # engine="py" / "native" のコンパイル結果をディスクにキャッシュするディレクトリ
+        self.cache_dir: Optional[str] = None
+
+    @property
+    def stdin(self) -> IO[Any]:
+        """standard input. e.g. io.StringIO("xxxx"), io.BytesIO(b"xxxx")"""
+        return self._input.stream
+
+    @stdin.setter
+    def stdin(self, stream: IO[Any]):
+        self._input = bf_io.BfInput(stream)
+
+    @property
+    def stdout(self) -> IO[Any]:
+        """standard output. e.g. io.StringIO(), io.BytesIO()"""
+        return self._output.stream
+
+    @stdout.setter
+    def stdout(self, stream: IO[Any]):
+        self._output.flush()
+        self._output = bf_io.BfOutput(stream, self._output.flush_policy)
+
+    def flush(self):
+        """write buffered output"""
+        self._output.flush()
+
+    def save_checkpoint(self, path: str):
+        """save memory, pointer, index and I/O positions to file"""
+        self._output.flush()
+        header = _CHECKPOINT_HEADER.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, self.cell_size, 0,
+            len(self.memory), self.pointer, self.index,
+            self._input.position, self._output.position,
+            self._source_digest())
+        tape = self.memory
+        if sys.byteorder != "little" and self.cell_size != 1:
+            tape = array(tape.typecode, tape)
+            tape.byteswap()
+        work_path = f"{path}.tmp"
+        with open(work_path, "w+b") as work_file, memoryview(tape) as view:
+            data = view.cast("B")
+            work_file.truncate(len(header) + len(data))
+            with mmap.mmap(work_file.fileno(), 0) as mapped:
+                mapped[:len(header)] = header
+                mapped[len(header):] = data
+                mapped.flush()
+        os.replace(work_path, path)
+
+    def load_checkpoint(self, path: str):
+        """restore memory, pointer, index and I/O positions from file"""
+        with open(path, "rb") as checkpoint_file, \
+                mmap.mmap(checkpoint_file.fileno(), 0,
+                          access=mmap.ACCESS_READ) as mapped:
+            (magic, version, cell_size, _, length, pointer, index,
+             input_position, output_position, digest) = \
+                _CHECKPOINT_HEADER.unpack_from(mapped)
+            if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+                raise ValueError(f"invalid checkpoint: {path}")
+            if digest != self._source_digest():
+                raise ValueError(f"source code does not match: {path}")
+            if cell_size != self.cell_size:
+                raise ValueError(f"cell_size={cell_size}")
+            if self.size < length:
+                raise ValueError(f"size={length}")
+            tape = new_tape(length, cell_size)
+            begin = _CHECKPOINT_HEADER.size
+            with memoryview(tape) as view:
+                view.cast("B")[:length * cell_size] = \
+                    mapped[begin:begin + length * cell_size]
+        if sys.byteorder != "little" and cell_size != 1:
+            tape.byteswap()
+        self.memory = tape
+        self.pointer = pointer
+        self.index = index
+        self._input.skip(input_position)
+        self._output.rewind(output_position)
+
+    def _source_digest(self) -> bytes:
+        return hashlib.sha256(self.source.encode("utf-8")).digest()
 
     def set_source(self, source: str):
         """set source code and reset index"""
         self.source = source
+        self._build_jumps()
+        self._ir = None
         self.index = 0
-        self.linenumber = 1
-        self.columnnumber = 1
 
     def reset(self):
         """reset index and memory"""
         self.index = 0
-        self.linenumber = 1
-        self.columnnumber = 1
-        self.memory = [0] * self.size
+        # 使用したページのみをクリアし、1ページ目だけを残す
+        del self.memory[PAGE_SIZE:]
+        self.memory[:] = new_tape(len(self.memory), self.cell_size)
+        # ポインタは変えないので、ポインタのあるページまで確保し直す
+        self._grow(self.pointer)
+
+    def peek(self, pos: int) -> int:
+        """value of memory. 0 if not allocated"""
+        return self.memory[pos] if pos < len(self.memory) else 0
+
+    def poke(self, pos: int, value: int):
+        """set value of memory. allocate pages if needed"""
+        self._grow(pos)
+        self.memory[pos] = value & self.mask
+
+    def _grow(self, pointer: int) -> int:
+        """allocate pages until pointer. returns length of memory"""
+        if self.size <= pointer:
+            raise ValueError(f"pointer={pointer}")
+        length = min(self.size, (pointer // PAGE_SIZE + 1) * PAGE_SIZE)
+        if len(self.memory) < length:
+            self.memory.extend(
+                new_tape(length - len(self.memory), self.cell_size))
+        return len(self.memory)
+
+    @property
+    def linenumber(self) -> int:
+        """line number of next instruction (1～)"""
+        return self.position_of(self.index)[0]
+
+    @property
+    def columnnumber(self) -> int:
+        """column number of next instruction (1～)"""
+        return self.position_of(self.index)[1]
+
+    def position_of(self, index: int) -> Tuple[int, int]:
+        """(line number, column number) of source index"""
+        line = bisect.bisect_left(self._newlines, index)
+        start = self._newlines[line - 1] + 1 if 0 < line else 0
+        return (line + 1, index - start + 1)
+
+    def _build_jumps(self):
+        """build bracket-match table. raise ValueError if unbalanced"""
+        source = self.source
+        self._newlines = [i for (i, ch) in enumerate(source) if ch == '\n']
+        jumps = [-1] * len(source)
+        stack: List[int] = []
+        for (i, ch) in enumerate(source):
+            if ch == '[':
+                stack.append(i)
+            elif ch == ']':
+                if not stack:
+                    (line, column) = self.position_of(i)
+                    raise ValueError(
+                        f"unmatched ']' at line={line}, column={column}")
+                start = stack.pop()
+                jumps[start] = i
+                jumps[i] = start
+        if stack:
+            (line, column) = self.position_of(stack[-1])
+            raise ValueError(
+                f"unmatched '[' at line={line}, column={column}")
+        self._jumps = jumps
+
+    def _jump(self):
+        """jump to the matching bracket"""
+        self.index = self._jumps[self.index]
 
     def step(self):
         """execute 1 step"""
+        self._step()
+        self._output.flush()
+
+    def _step(self):
         if not self.is_stopped():
             ch = self.source[self.index]
             if ch in self.instructions:
@@ -73,25 +307,252 @@ class BfSim:
             self._pc_forward()
 
     def run(self, steps: int) -> int:
-        """execute steps"""
+        """execute steps. buffered output is written at the end"""
+        try:
+            return self._run(steps)
+        finally:
+            self._output.flush()
+
+    async def run_async(self,
+                        reader: Any = None,
+                        writer: Any = None,
+                        yield_steps: int = ASYNC_STEPS) -> Optional[str]:
+        """
+        execute until stopped, yielding to event loop every yield_steps.
+        reader / writer は asyncio の StreamReader / StreamWriter.
+        None の場合は stdin / stdout をそのまま使う.
+        yield_steps ごとに中断するので、engine="py" / "native" でも ir で実行する.
+        breakpoint などで止まった場合は stop_reason を返す
+        """
+        if reader is not None:
+            self._input = bf_io.BfAsyncInput(reader)
+        if writer is not None:
+            self._output.flush()
+            self._output = bf_io.BfAsyncOutput(
+                writer, self._output.flush_policy)
+        while not self.is_stopped():
+            pending = False
+            try:
+                self._run(yield_steps, whole=False)
+            except bf_io.InputPending:
+                pending = True
+            finally:
+                self._output.flush()
+            if writer is not None:
+                await writer.drain()
+            if pending and isinstance(self._input, bf_io.BfAsyncInput):
+                # ',' の位置で止まっているので、読み込んでからやり直す
+                # (InputPending を送出するのは BfAsyncInput だけ)
+                await self._input.fill()
+            elif self.stop_reason is not None:
+                break
+            else:
+                await asyncio.sleep(0)
+        return self.stop_reason
+
+    def _run(self, steps: int, whole: bool = True) -> int:
+        """whole=False の場合は、全体を1ステップで実行するエンジンを使わない"""
+        self.stop_reason = None
+        if self.profiler is not None or self._debugging():
+            return self._run_debug(steps)
+        # ブレークポイントなどが無い場合は、1ステップごとのチェックをしない
+        # 入力待ちで中断できないので、非同期の入力の時は py を使わない
+        whole = whole and self.index == 0 \
+            and not isinstance(self._input, bf_io.BfAsyncInput)
+        if self.engine == "py" and whole:
+            return self._run_py(steps)
+        # 独自拡張の命令は C から呼び出せないので ir で実行する
+        if self.engine == "native" and whole and not self._extensions():
+            return self._run_native(steps)
+        if self.engine != "step":
+            return self._run_ir(steps)
         for n in range(steps):
             if self.is_stopped():
                 return n
-            self.step()
-            if self.index in self.breakpoints:
-                return n + 1
+            self._step()
         return steps
 
+    def _debugging(self) -> bool:
+        return bool(self.breakpoints or self.watchpoints
+                    or self.pointer_range is not None)
+
+    def _run_debug(self, steps: int) -> int:
+        """execute steps with profiling and breakpoint/watchpoint checks"""
+        profiler = self.profiler
+        debugging = self._debugging()
+        # 中間表現はループなどを1命令にまとめるので、ブレークポイントがあれば
+        # エンジンによらず1文字ずつ実行する(まとめた命令の途中でも止まる).
+        # ウォッチポイントとポインタの範囲だけなら、中間表現の1命令ずつ実行する
+        values: Dict[int, int] = {
+            pos: self.peek(pos) for pos in self.watchpoints}
+        if (profiler is None and not self.breakpoints
+                and self.engine != "step"):
+            return self._run_ir(steps, values)
+        for n in range(steps):
+            if self.is_stopped():
+                return n
+            if profiler is not None:
+                profiler.count(self)
+            self._step()
+            if debugging:
+                self.stop_reason = self._check_stop(values)
+                if self.stop_reason is not None:
+                    return n + 1
+        return steps
+
+    def _check_stop(self, values: Dict[int, int]) -> Optional[str]:
+        """check breakpoints and watchpoints. returns stop reason"""
+        if self.index in self.breakpoints:
+            return "breakpoint"
+        for (pos, value) in values.items():
+            if self.peek(pos) != value:
+                values[pos] = self.peek(pos)
+                return "watchpoint"
+        if self.pointer_range is not None:
+            (low, high) = self.pointer_range
+            if not low <= self.pointer < high:
+                return "pointer"
+        return None
+
+    def _extensions(self) -> str:
+        """custom instructions"""
+        return "".join(
+            ch for ch in self.instructions if ch not in bf_ir.COMMANDS)
+
+    def _compile_ir(self) -> bf_ir.IrProgram:
+        """compile source code to intermediate representation"""
+        if self._ir is None:
+            self._ir = bf_ir.compile_ir(self.source, self._extensions())
+        return self._ir
+
+    def _run_py(self, steps: int) -> int:
+        """execute whole program by python code. 1 step = whole program"""
+        if steps <= 0 or self.is_stopped():
+            return 0
+        code = bf_pygen.load_code(
+            self.source, self._extensions(), self.mask, self.cache_dir)
+        self.pointer = bf_pygen.run(self, code)
+        self.index = len(self.source)
+        return 1
+
+    def _run_native(self, steps: int) -> int:
+        """execute whole program by native code. 1 step = whole program"""
+        if steps <= 0 or self.is_stopped():
+            return 0
+        function = bf_native.load_function(
+            self.source, self.cell_size, self.eof, self.cache_dir)
+        self.pointer = bf_native.run(self, function)
+        self.index = len(self.source)
+        return 1
+
+    def _run_ir(self, steps: int,
+                values: Optional[Dict[int, int]] = None) -> int:
+        """
+        execute steps by intermediate representation. 1 step = 1 op.
+        values を指定した場合は、1命令ごとにウォッチポイントとポインタの範囲を調べる
+        """
+        program = self._compile_ir()
+        n = 0
+        # 命令の途中で止まっている場合は、命令の先頭まで1文字ずつ実行する
+        while n < steps and self.index not in program.pc_of:
+            if self.is_stopped():
+                return n
+            self._step()
+            n += 1
+            if values is not None:
+                self.stop_reason = self._check_stop(values)
+                if self.stop_reason is not None:
+                    return n
+        if n == steps:
+            return n
+        code = program.code
+        sources = program.sources
+        end = len(code)
+        size = self.size
+        mask = self.mask
+        pc = program.pc_of[self.index]
+        mem = self.memory
+        # 確保済みのメモリの長さ. 超えたらページを追加する
+        limit = len(mem)
+        p = self.pointer
+        try:
+            while n < steps and pc < end:
+                (op, arg) = code[pc]
+                pc += 1
+                n += 1
+                if op == OP_ADD:
+                    mem[p] = (mem[p] + arg) & mask
+                elif op == OP_MOVE:
+                    p += arg
+                    if p < 0 or limit <= p:
+                        if p < 0:
+                            raise ValueError(f"pointer={p}")
+                        limit = self._grow(p)
+                elif op == OP_OPEN:
+                    if mem[p] == 0:
+                        pc = arg + 1
+                elif op == OP_CLOSE:
+                    if mem[p] != 0:
+                        pc = arg + 1
+                elif op == OP_MULTI:
+                    value = mem[p]
+                    if value != 0:
+                        (pairs, delta, low, high) = arg
+                        if p + low < 0:
+                            raise ValueError(f"pointer={p + low}")
+                        if limit <= p + high:
+                            limit = self._grow(p + high)
+                        if 0 < delta:
+                            # [+>+<] の形式は (mask + 1 - value) 回ループする
+                            value = -value & mask
+                        for (offset, factor) in pairs:
+                            mem[p + offset] = \
+                                (mem[p + offset] + value * factor) & mask
+                        mem[p] = 0
+                elif op == OP_CLEAR:
+                    mem[p] = 0
+                elif op == OP_SCAN:
+                    if mem[p] != 0:
+                        p = bf_ir.scan(mem, p, arg, size)
+                        if limit <= p:
+                            limit = self._grow(p)
+                else:
+                    # 入出力と独自拡張の命令は通常の処理を呼び出す
+                    self.pointer = p
+                    self.index = sources[pc - 1]
+                    if op == OP_OUT:
+                        self._put_char()
+                    elif op == OP_IN:
+                        self._get_char()
+                    else:
+                        self.instructions[arg](self)
+                    p = self.pointer
+                    limit = len(mem)
+                if values is not None:
+                    self.pointer = p
+                    self.index = sources[pc]
+                    self.stop_reason = self._check_stop(values)
+                    if self.stop_reason is not None:
+                        break
+        except BaseException:
+            # 失敗した命令を指したままにする
+            pc -= 1
+            raise
+        finally:
+            self.pointer = p
+            self.index = sources[pc]
+        return n
+
     def is_stopped(self) -> bool:
         return self.index < 0 or len(self.source) <= self.index
 
     def _plus(self):
-        self.memory[self.pointer] += 1
-        self.memory[self.pointer] &= 0xff
+        self.memory[self.pointer] = \
+            (self.memory[self.pointer] + 1) & self.mask
 
     def _minus(self):
-        self.memory[self.pointer] -= 1
-        self.memory[self.pointer] &= 0xff
+        self.memory[self.pointer] = \
+            (self.memory[self.pointer] - 1) & self.mask
 
     def _move_backward(self):
         self.pointer -= 1
@@ -100,78 +561,58 @@ class BfSim:
 
     def _move_forward(self):
         self.pointer += 1
-        if (self.size <= self.pointer):
-            raise ValueError(f"pointer={self.pointer}")
+        if (len(self.memory) <= self.pointer):
+            self._grow(self.pointer)
 
     def _loop_start(self):
         if self.memory[self.pointer] == 0:
-            self._pc_forward()
-            nest = 0
-            while nest > 0 or self.source[self.index] != ']':
-                if self.source[self.index] == ']':
-                    nest -= 1
-                if self.source[self.index] == '[':
-                    nest += 1
-                self._pc_forward()
-                if self.is_stopped():
-                    break
+            # 対応する ']' に移動. 次の命令は ']' の直後
+            self._jump()
 
     def _loop_end(self):
-        if self.memory[self.pointer] == 0:
-            return
-        self._pc_backward()
-        nest = 0
-        while nest > 0 or self.source[self.index] != '[':
-            if self.source[self.index] == ']':
-                nest += 1
-            if self.source[self.index] == '[':
-                nest -= 1
-            self._pc_backward()
-        self._pc_backward(False)
+        if self.memory[self.pointer] != 0:
+            # 対応する '[' に移動. 次の命令は '[' の直後
+            self._jump()
 
     def _get_char(self):
-        ch = self.stdin.read(1)
-        self.memory[self.pointer] = ord(ch)
+        value = self._input.get()
+        if value < 0:
+            if self.eof == bf_io.EOF_NO_EFFECT:
+                return
+            value = 0 if self.eof == bf_io.EOF_ZERO else self.mask
+        self.memory[self.pointer] = value
 
     def _put_char(self):
-        ch = chr(self.memory[self.pointer])
-        self.stdout.write(ch)
-        self.stdout.flush()
+        self._output.put(self.memory[self.pointer])
 
     def _pc_forward(self):
         if not self.is_stopped():
-            if self.source[self.index] == '\n':
-                self.linenumber += 1
-                self.columnnumber = 0
             self.index += 1
-            self.columnnumber += 1
-        elif self.index == -1:
-            self.index = 0
-            self.linenumber = 1
-            self.columnnumber = 1
-
-    def _pc_backward(self, check: bool = True):
-        if 0 < self.index:
-            self.index -= 1
-            self.columnnumber -= 1
-            if self.source[self.index] == '\n':
-                self.linenumber -= 1
-                pos = self.source.rfind('\n', 0, self.index)
-                self.columnnumber = self.index - pos
-        elif self.index == 0:
-            if check:
-                raise RuntimeError("invalid address")
-            self.index = -1
-            self.linenumber = 0
-            self.columnnumber = 0
 
 
-if __name__ == "__main__":
-    argc = len(sys.argv)
-    if argc != 2:
-        raise RuntimeError("usage: {0} BF_SOURCE".format(sys.argv[0]))
-    with open(sys.argv[1], "r") as src_file:
+def main(argv: List[str]):
+    parser = argparse.ArgumentParser(description="Brainf*ck simulator")
+    parser.add_argument("source", help="Brainf*ck source file")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                        help="write checkpoint to FILE periodically")
+    parser.add_argument("--checkpoint-steps", type=int, default=10000000,
+                        metavar="N", help="write checkpoint every N steps")
+    parser.add_argument("--resume", action="store_true",
+                        help="resume from checkpoint if exists")
+    args = parser.parse_args(argv)
+
+    with open(args.source, "r") as src_file:
         src = src_file.read()
-    sim = BfSim(source=src)
+    sim = BfSim(source=src, engine="ir", flush=bf_io.FLUSH_NEWLINE)
+    if args.resume and args.checkpoint and os.path.exists(args.checkpoint):
+        sim.load_checkpoint(args.checkpoint)
+    steps = 0
     while not sim.is_stopped():
-        rc = sim.run(10000)
+        steps += sim.run(10000)
+        if args.checkpoint and args.checkpoint_steps <= steps:
+            sim.save_checkpoint(args.checkpoint)
+            steps = 0
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,10 +1,18 @@
 # 簡易的なスタック処理言語風
 
+import collections
+import contextlib
+import functools
+import inspect
+from typing import (Any, Callable, Iterator, List, NamedTuple, Optional, Tuple,
+                    TypeVar)
 import bf_core as c
+import bf_cost
 
 # 数字は以下の2種類
 # ・1byte整数(符号なし) {VALUE, 0, 0, 0}
 # ・3byte固定小数点小数. {0, 整数部, 小数部, 符号0/1} 符号＋絶対値
+#   (PROFILE_WIDE の場合は {0, 絶対値 x 256, 0, 符号0/1})
 
 # スタックの1要素は4byte固定
 ELEMENT_SIZE = 4
@@ -29,28 +37,179 @@ IDX_INT = 1
 IDX_DEC = 2
 IDX_SGN = 3
 
-
+# マクロのプロファイル. 実行するセルのサイズに合わせて選ぶ
+# ・PROFILE_BYTE: 1byteのセル. 固定小数点小数は整数部と小数部を別のセルにして、
+#   繰り上がり/繰り下がりを処理する. 1byte整数はセルの回り込みを使って作る
+# ・PROFILE_WIDE: 2byte以上のセル. 固定小数点小数の絶対値を1セルに入れるので、
+#   同符号の加算は1つのループ、絶対値の減算(比較)も1つのループになる.
+#   回り込みは使わない. 整数部が 256 以上になった場合の結果はセルのサイズによる
+PROFILE_BYTE = "byte"
+PROFILE_WIDE = "wide"
+PROFILES = (PROFILE_BYTE, PROFILE_WIDE)
+
+# multi_decimal() の方式. 1byte単位の繰り返し加算 / 4bit単位の筆算
+# ※テープ上の表(例えば 1/4 二乗表)を引く方式は使わない.
+#   離れた位置 d にある値 v を読むには v*d ステップかかり
+#   (255*255/4 の上位/下位 byte を d>=256 から読むと約5万ステップ)、4bit単位の筆算
+#   (1byte同士の積で平均数千ステップ)より遅い. また、使用中のスタックを越えて
+#   表まで移動する作業領域も必要になる
+MULTI_ADD = "add"
+MULTI_NIBBLE = "nibble"
+MULTI_METHODS = (MULTI_ADD, MULTI_NIBBLE)
+
+# put_str() で文字を作るのに使うセルの最大数
+PUT_STR_CELLS = 4
+
+# キャッシュするコードの合計文字数の上限
+CACHE_CHARS = 1 << 22
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    chars: int
+
+
+class MacroCache:
+    """
+    引数だけで結果が決まるマクロのキャッシュ.
+    生成したコードの合計文字数が上限を超えたら、古いものから捨てる
+    """
+
+    def __init__(self, max_chars: int = CACHE_CHARS):
+        self.max_chars = max_chars
+        # False の場合は毎回生成する(テスト用)
+        self.enabled = True
+        self._codes: "collections.OrderedDict[Tuple[Any, ...], str]" = \
+            collections.OrderedDict()
+        self._chars = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Tuple[Any, ...], generate: Callable[[], str]) -> str:
+        if not self.enabled:
+            return generate()
+        code = self._codes.get(key)
+        if code is not None:
+            self._hits += 1
+            self._codes.move_to_end(key)
+            return code
+        self._misses += 1
+        code = generate()
+        if len(code) <= self.max_chars:
+            self._codes[key] = code
+            self._chars += len(code)
+            while self.max_chars < self._chars:
+                (_, old) = self._codes.popitem(last=False)
+                self._chars -= len(old)
+        return code
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, len(self._codes),
+                         self._chars)
+
+    def clear(self):
+        self._codes.clear()
+        self._chars = 0
+        self._hits = 0
+        self._misses = 0
+
+
+macro_cache = MacroCache()
+
+# 現在のプロファイル
+_profile = PROFILE_BYTE
+
+
+def set_profile(profile: str) -> str:
+    "プロファイルを切り替える. 切り替え前のプロファイルを返す"
+    global _profile
+    if profile not in PROFILES:
+        raise ValueError(f"unknown profile: {profile}")
+    (previous, _profile) = (_profile, profile)
+    return previous
+
+
+def get_profile() -> str:
+    "現在のプロファイル"
+    return _profile
+
+
+@contextlib.contextmanager
+def use_profile(profile: str) -> Iterator[None]:
+    "with の中だけプロファイルを切り替える"
+    previous = set_profile(profile)
+    try:
+        yield
+    finally:
+        set_profile(previous)
+
+
+def _wrap() -> bool:
+    "1byteのセルの回り込みを使えるか"
+    return _profile == PROFILE_BYTE
+
+
+_F = TypeVar("_F", bound=Callable[..., str])
+
+
+def _cached(function: _F) -> _F:
+    "マクロの結果を macro_cache に保存する"
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        # f() と f(既定値) や、キーワード引数で渡した場合も同じキーにする
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return macro_cache.get(
+            (function.__name__, _profile, *bound.arguments.values()),
+            lambda: function(*bound.args, **bound.kwargs))
+    return wrapper  # type: ignore
+
+
+@_cached
 def push_byte(value: int) -> str:
     "1byteの整数をスタックの先頭に積む"
     value = int(value) & 0xff
     return c.block_of(
-        c.init_value(NOW + IDX_BYTE, value & 0xff),
+        c.init_value(NOW + IDX_BYTE, value & 0xff, wrap=_wrap()),
         c.move_ptr(NEXT)
     )
 
 
+def _init_wide(pos: int, value: int) -> str:
+    "初回の値設定. 1byteに収まらない値は、16倍のループで作る"
+    if value < c.CELL_VALUES:
+        return c.init_value(pos, value)
+    return c.block_of(
+        _init_wide(pos + 1, value // 16),
+        c.for_loop(pos + 1, c.exec_pos(pos, "+" * 16)),
+        c.exec_pos(pos, "+" * (value % 16))
+    )
+
+
+@_cached
 def push_decimal(value: float) -> str:
     "3byteの固定小数点をスタックの先頭に積む"
     (sign, value) = (0, value) if 0 <= value else (1, -value)
     value = int(value * 256) & 0xffff
+    if _profile == PROFILE_WIDE:
+        return c.block_of(
+            _init_wide(NOW + IDX_INT, value),
+            c.init_value(NOW + IDX_SGN, sign),
+            c.move_ptr(NEXT)
+        )
     return c.block_of(
-        c.init_value(NOW + IDX_INT, (value >> 8) & 0xff),
-        c.init_value(NOW + IDX_DEC, value & 0xff),
+        c.init_value(NOW + IDX_INT, (value >> 8) & 0xff, wrap=True),
+        c.init_value(NOW + IDX_DEC, value & 0xff, wrap=True),
         c.init_value(NOW + IDX_SGN, sign),
         c.move_ptr(NEXT)
     )
 
 
+@_cached
 def drop() -> str:
     "スタックの先頭を破棄"
     return c.block_of(
@@ -62,6 +221,7 @@ def drop() -> str:
     )
 
 
+@_cached
 def dup(num: int) -> str:
     "スタックの要素をコピーしてスタック先頭に積む. num=0が先頭をコピー"
     pos = -ELEMENT_SIZE * (num + 1)
@@ -74,6 +234,7 @@ def dup(num: int) -> str:
     )
 
 
+@_cached
 def swap(num: int) -> str:
     "スタックの先頭要素と、スタックの該当要素を交換. 1<=numであること"
     pos = -ELEMENT_SIZE * (num + 1)
@@ -86,6 +247,7 @@ def swap(num: int) -> str:
     )
 
 
+@_cached
 def override(num: int) -> str:
     "スタックの先頭要素で、スタックの該当要素を上書き. 1<=numであること."
     pos = -ELEMENT_SIZE * (num + 1)
@@ -98,6 +260,7 @@ def override(num: int) -> str:
     )
 
 
+@_cached
 def put_char() -> str:
     "スタック先頭の1byte(1文字)を出力"
     return c.block_of(
@@ -106,14 +269,81 @@ def put_char() -> str:
     )
 
 
+def _add_value(value: int) -> str:
+    "1byteのセルに value を加算. 回り込みで短い方を使う"
+    if not _wrap():
+        return "+" * value if 0 <= value else "-" * -value
+    value %= c.CELL_VALUES
+    if value <= c.CELL_VALUES // 2:
+        return "+" * value
+    return "-" * (c.CELL_VALUES - value)
+
+
+@functools.lru_cache(maxsize=None)
+def _rebuild_value(value: int, wrap: bool) -> Tuple[str, int]:
+    "セルをクリアして value を作り直すコードと、セルが 0 の場合の実行ステップ数"
+    code = "[-]" + c.init_value(0, value, wrap=wrap)
+    return (code, bf_cost.estimate(code).worst)
+
+
+def _put_str_plan(values: List[int], starts: List[int]) -> str:
+    """
+    NOW から len(starts) 個のセルを starts の値で初期化し、
+    各文字を文字数と実行ステップ数の和が一番小さい方法で出力する.
+    終了後セルはクリアする
+    """
+    result = [c.init_value(NOW + i, value, wrap=_wrap())
+              for (i, value) in enumerate(starts)]
+    cells = list(starts)
+    last = len(cells) - 1
+    pointer = NOW
+    for value in values:
+        best: Optional[Tuple[int, int, int, str]] = None
+        for (i, now) in enumerate(cells):
+            move = c.move_ptr(NOW + i - pointer)
+            # 文字数と実行ステップ数の和で比べる.
+            # 前の値からの差分は、実行ステップ数が文字数と同じ
+            code = move + _add_value(value - now)
+            candidate = (2 * len(code), 0, i, code)
+            if i == last:
+                # 右隣以降は 0 なので、作り直すこともできる.
+                # ループで作るので、文字数が少なくても実行ステップ数は多い
+                (rebuild, steps) = _rebuild_value(value, _wrap())
+                # [-] は now 回ループする
+                steps += len(move) + 2 * now
+                code = move + rebuild
+                # 同じなら、ループのない差分を選ぶ
+                candidate = min(candidate, (len(code) + steps, 1, i, code))
+            if best is None or candidate < best:
+                best = candidate
+        (_, _, i, code) = best  # type: ignore
+        result.append(code + ".")
+        cells[i] = value
+        pointer = NOW + i
+    result.extend(c.exec_pos(NOW + i - pointer, "[-]")
+                  for i in range(len(cells)))
+    result.append(c.move_ptr(NOW - pointer))
+    return c.block_of(*result)
+
+
+@_cached
 def put_str(message: str) -> str:
-    result = c.clear_pos(NOW)
-    for ch in message:
-        result += c.init_value(NOW, ord(ch))
-        # TODO ↑前の値との差分のほうが短いかどうかチェックしたほうが良い
-        result += c.exec_pos(NOW, ".")
-        result += c.clear_pos(NOW)
-    return c.delete_useless(result)
+    """
+    文字列を出力. NOW 以降の PUT_STR_CELLS 個のセルを使う.
+    前の文字との差分と、よく使う値を入れておいたセルから、短い方法を選ぶ
+    """
+    values = [ord(ch) % c.CELL_VALUES for ch in message]
+    if not values:
+        return c.clear_pos(NOW)
+    ordered = sorted(values)
+    # 1セルで先頭の文字から差分で作る方法と、
+    # 値の範囲を分けて、それぞれの中央の値をセルに入れておく方法
+    plans = [_put_str_plan(values, values[:1])]
+    for cells in range(1, PUT_STR_CELLS + 1):
+        starts = [ordered[(2 * i + 1) * len(ordered) // (2 * cells)]
+                  for i in range(cells)]
+        plans.append(_put_str_plan(values, starts))
+    return c.block_of(c.clear_pos(NOW), min(plans, key=len))
 
 
 def loop_of(*statements: str) -> str:
@@ -124,6 +354,7 @@ def loop_of(*statements: str) -> str:
     )
 
 
+@_cached
 def loop_last(num: int) -> str:
     "ループを終了できる状態にする. num はループの制御変数の位置. 処理は続行する"
     pos = -ELEMENT_SIZE * (num + 1)
@@ -207,6 +438,7 @@ def if_negative_decimal(then_statement: str, else_statement: str = "") -> str:
     )
 
 
+@_cached
 def add_byte() -> str:
     "1byteの加算"
     return c.block_of(
@@ -215,6 +447,7 @@ def add_byte() -> str:
     )
 
 
+@_cached
 def sub_byte() -> str:
     "1byteの減算"
     return c.block_of(
@@ -223,6 +456,7 @@ def sub_byte() -> str:
     )
 
 
+@_cached
 def _add_abs() -> str:
     "3byte固定小数点の絶対値の加算"
     # SECOND/TOP の符号は同じであることを想定
@@ -235,6 +469,7 @@ def _add_abs() -> str:
     )
 
 
+@_cached
 def _dec_both_abs_int() -> str:
     "整数部を片方が0になるまで両方をデクリメント"
     count = NOW
@@ -257,6 +492,7 @@ def _dec_both_abs_int() -> str:
     )
 
 
+@_cached
 def _dec_both_abs_decimal() -> str:
     "小数部を片方が0になるまで両方をデクリメント"
     count = NOW
@@ -279,6 +515,7 @@ def _dec_both_abs_decimal() -> str:
     )
 
 
+@_cached
 def _if_nz_int_swap() -> str:
     "SECONDの整数部が0以外なら、TOP/SECONDをひっくり返す"
     work = NOW
@@ -294,6 +531,7 @@ def _if_nz_int_swap() -> str:
     )
 
 
+@_cached
 def _if_top_decimal_is_nz_then_override() -> str:
     "TOPの小数部が0以外なら、TOPをSECONDに移動"
     return c.if_z_tricky(
@@ -308,6 +546,7 @@ def _if_top_decimal_is_nz_then_override() -> str:
     )
 
 
+@_cached
 def _top_minus_second() -> str:
     "SECONDの小数部の分、TOPから減算して、SECONDの位置に移動"
     return c.block_of(
@@ -325,6 +564,7 @@ def _top_minus_second() -> str:
     )
 
 
+@_cached
 def _sub_abs() -> str:
     "3byte固定小数点の絶対値の減算"
     # どちらかが0になるまでdecする. 残ったほうが答え(符号も含め)
@@ -347,6 +587,58 @@ def _sub_abs() -> str:
     )
 
 
+def _toggle_flag(pos: int, work: int) -> str:
+    "0/1 のフラグを反転. 途中でセルが負(回り込み)にならない"
+    return c.block_of(
+        c.inc_pos(work),
+        c.for_loop(pos, c.dec_pos(work)),
+        c.move_data(work, pos)
+    )
+
+
+@_cached
+def _add_abs_wide() -> str:
+    "1セルの固定小数点の絶対値の加算"
+    # SECOND/TOP の符号は同じであることを想定
+    return c.block_of(
+        c.clear_pos(TOP + IDX_SGN),
+        c.for_loop(TOP + IDX_INT, c.inc_pos(SECOND + IDX_INT))
+    )
+
+
+@_cached
+def _sub_abs_wide() -> str:
+    "1セルの固定小数点の絶対値の減算"
+    # 符号は異なることを想定. 結果は SECOND に置く.
+    # TOPの絶対値の方が大きい場合だけ、SECONDの符号を反転する
+    marker = NOW
+    work = NOW + 1
+    idx_b = NOW + 2
+    idx_a = NOW + 3
+    return c.block_of(
+        c.clear_pos(TOP + IDX_SGN),
+        c.move_data(TOP + IDX_INT, idx_b),
+        c.move_data(SECOND + IDX_INT, idx_a),
+        # 両方に1を足しておき、ループに入る前に0にならないようにする(差は同じ)
+        c.inc_pos(idx_b),
+        c.inc_pos(idx_a),
+        c.inc_pos(marker),
+        # 片方が0になるまで両方をデクリメント.
+        # A が先(同時を含む)に0になると B の1つ前、B が先なら B で止まるので、
+        # A が先の場合だけ marker を消しながら1つ前に移動し、位置を揃える
+        c.exec_pos(idx_b, "[->-[>]<<]<[->c]>"),
+        c.clear_pos(marker),
+        # 残った方が答え
+        c.move_data(idx_a, SECOND + IDX_INT),
+        c.while_loop(
+            idx_b,
+            c.move_data(idx_b, SECOND + IDX_INT),
+            _toggle_flag(SECOND + IDX_SGN, work)
+        )
+    )
+
+
+@_cached
 def add_decimal() -> str:
     "固定小数点小数の加算"
     # 符号が同じなら、絶対値の加算
@@ -354,16 +646,24 @@ def add_decimal() -> str:
     work = SECOND + IDX_DMY
     diff_work = TOP + IDX_DMY
     same_flag = SECOND + IDX_DMY
+    if _profile == PROFILE_WIDE:
+        (add_abs, sub_abs) = (_add_abs_wide(), _sub_abs_wide())
+        # 広いセルで -1 にすると、クリアに時間がかかるので、反転で求める
+        diff_sign = _toggle_flag(diff_work, NOW)
+    else:
+        (add_abs, sub_abs) = (_add_abs(), _sub_abs())
+        diff_sign = c.dec_pos(diff_work)
     return c.block_of(
         c.for_safe(SECOND + IDX_SGN, work, c.inc_pos(diff_work)),
-        c.for_safe(TOP + IDX_SGN, work, c.dec_pos(diff_work)),
+        c.for_safe(TOP + IDX_SGN, work, diff_sign),
         c.inc_pos(same_flag),
-        c.if_nz_then(diff_work, c.dec_pos(same_flag) + _sub_abs()),
-        c.if_nz_then(same_flag, _add_abs()),
+        c.if_nz_then(diff_work, c.dec_pos(same_flag) + sub_abs),
+        c.if_nz_then(same_flag, add_abs),
         drop()
     )
 
 
+@_cached
 def sub_decimal() -> str:
     "固定小数点小数の減算"
     # 符号を反転して加算(A-B => A+(-B))
@@ -376,6 +676,7 @@ def sub_decimal() -> str:
     )
 
 
+@_cached
 def _multi_decimal_abs() -> str:
     "3byte固定小数点の絶対値の乗算"
     # 整数部と小数部は筆算と同様に、byte単位で計算する
@@ -406,12 +707,156 @@ def _multi_decimal_abs() -> str:
     )
 
 
+@_cached
+def _multi_decimal_abs_nibble() -> str:
+    """
+    3byte固定小数点の絶対値の乗算. 4bit単位の筆算.
+    A と B の整数部と小数部は 0 になる(破壊版)
+    """
+    # A, B を 4bit に分けて、A[i] x B[j] を 16 進の桁 i+j に足す.
+    # 4bit同士の積は 225 以下なので、1byteの繰り上がり処理が不要になる
+    #   A = A3 A2 . A1 A0,  B = B3 B2 . B1 B0
+    #   R = 桁5 桁4 . 桁3 桁2 (桁1, 桁0 は繰り上げ分のみが必要)
+    # 桁6 以上は捨てるので、桁5 の値は下位4bitだけが意味を持つ(256 で割り切れる)
+    nibble_a = NEXT  # A0, A1, A2, A3
+    nibble_b = nibble_a + 4  # B0, B1, B2, B3
+    work = nibble_b + 4  # 積と除算用. work+5 まで使う
+    column = work + 6  # 桁0 ～ 桁5
+
+    def split(source: int, low: int) -> str:
+        # source を 4bit 2つに分ける
+        return c.block_of(
+            c.move_data(source, work),
+            c.divmod_data(work, 16),
+            c.move_data(work + 2, low),
+            c.move_data(work + 3, low + 1)
+        )
+
+    def add_product(i: int, j: int) -> str:
+        # A[i] x B[j] を 桁i+j と 桁i+j+1 に足す
+        digit = i + j
+        if digit == 5:
+            # 上の桁は捨てる
+            return c.multi_data_tricky(nibble_a + i, nibble_b + j,
+                                       column + digit, 1)
+        return c.block_of(
+            c.multi_data_tricky(nibble_a + i, nibble_b + j, work, 1),
+            c.divmod_data(work, 16),
+            c.move_data(work + 2, column + digit),
+            c.move_data(work + 3, column + digit + 1)
+        )
+
+    def carry(digit: int) -> str:
+        # 桁digit の 16 以上を上の桁に繰り上げる
+        return c.block_of(
+            c.move_data(column + digit, work),
+            c.divmod_data(work, 16),
+            c.move_data(work + 2, column + digit),
+            c.move_data(work + 3, column + digit + 1)
+        )
+
+    def join(high: int, low: int, destination: int) -> str:
+        # 桁high x 16 + 桁low を destination に設定する
+        return c.block_of(
+            c.for_loop(column + high, c.exec_pos(destination, "+" * 16)),
+            c.move_data(column + low, destination)
+        )
+
+    return c.block_of(
+        split(SECOND + IDX_INT, nibble_a + 2),
+        split(SECOND + IDX_DEC, nibble_a),
+        split(TOP + IDX_INT, nibble_b + 2),
+        split(TOP + IDX_DEC, nibble_b),
+        *[add_product(i, j)
+          for i in range(4) for j in range(4) if i + j <= 5],
+        *[carry(digit) for digit in range(5)],
+        c.clear_pos(column + 0),
+        c.clear_pos(column + 1),
+        join(3, 2, NOW + IDX_DEC),
+        join(5, 4, NOW + IDX_INT),
+        *[c.clear_pos(nibble_a + i) for i in range(8)]
+    )
+
+
+@_cached
+def _multi_decimal_abs_wide() -> str:
+    """
+    1セルの固定小数点の絶対値の乗算. 4bit単位の筆算.
+    A と B の絶対値は 0 になる(破壊版)
+    """
+    # _multi_decimal_abs_nibble() と同じ桁の計算. セルが広いので、
+    # 4bit同士の積は桁ごとにそのまま足してから繰り上げる. 桁5 の上の桁を捨てて、
+    # セルの幅によらず 1byte のセルと同じく整数部を 256 で回り込ませる.
+    # 桁2 以上は 16 倍しながら1セルにまとめる
+    nibble_a = NEXT  # A0, A1, A2, A3
+    nibble_b = nibble_a + 4  # B0, B1, B2, B3
+    work = nibble_b + 4  # 除算用. work+7 まで使う
+    column = work + 8  # 桁0 ～ 桁5
+    product = column + 6  # 積のループ用. product+1 まで使う
+
+    def split(source: int, nibble: int) -> str:
+        # source を 4bit 4つに分ける
+        return c.block_of(
+            c.move_data(source, work),
+            *[c.block_of(
+                c.divmod_large(work, 16),
+                c.move_data(work + 2, nibble + i),
+                c.move_data(work + 3, work)
+            ) for i in range(3)],
+            c.move_data(work, nibble + 3)
+        )
+
+    def add_product(i: int, j: int) -> str:
+        # A[i] x B[j] を 桁i+j に足す
+        return c.for_safe(
+            nibble_a + i,
+            product,
+            c.for_safe(nibble_b + j, product + 1, c.inc_pos(column + i + j))
+        )
+
+    def carry(digit: int) -> str:
+        # 桁digit の 16 以上を上の桁に繰り上げる. 桁5 の上の桁は捨てる
+        return c.block_of(
+            c.move_data(column + digit, work),
+            c.divmod_large(work, 16),
+            c.move_data(work + 2, column + digit),
+            c.move_data(work + 3, column + digit + 1) if digit < 5
+            else c.clear_pos(work + 3)
+        )
+
+    def shift(digit: int) -> str:
+        # 桁digit x 16 を 桁digit-1 に足す
+        return c.for_loop(column + digit,
+                          c.exec_pos(column + digit - 1, "+" * 16))
+
+    return c.block_of(
+        split(SECOND + IDX_INT, nibble_a),
+        split(TOP + IDX_INT, nibble_b),
+        *[add_product(i, j)
+          for i in range(4) for j in range(4) if i + j <= 5],
+        *[carry(digit) for digit in range(6)],
+        c.clear_pos(column + 0),
+        c.clear_pos(column + 1),
+        # 桁5 ～ 桁2 を1セルにまとめる
+        *[shift(digit) for digit in range(5, 2, -1)],
+        c.move_data(column + 2, NOW + IDX_INT),
+        *[c.clear_pos(nibble_a + i) for i in range(8)]
+    )
+
+
+@_cached
 def _xor_sign() -> str:
     # 符号は同じなら＋、異なるならマイナス
     idx_as = SECOND + IDX_SGN
     idx_bs = TOP + IDX_SGN
     idx_rs = NOW + IDX_SGN
     sign_work = NEXT
+    if _profile == PROFILE_WIDE:
+        # 広いセルでは負にしないよう、反転で求める
+        return c.block_of(
+            c.for_loop(idx_as, c.inc_pos(idx_rs)),
+            c.for_loop(idx_bs, _toggle_flag(idx_rs, sign_work))
+        )
     return c.block_of(
         c.for_loop(idx_as, c.inc_pos(sign_work)),
         c.for_loop(idx_bs, c.dec_pos(sign_work)),
@@ -419,11 +864,25 @@ def _xor_sign() -> str:
     )
 
 
-def multi_decimal() -> str:
-    "3byte固定小数点の乗算"
+@_cached
+def multi_decimal(method: str = MULTI_ADD) -> str:
+    """
+    3byte固定小数点の乗算.
+    method は MULTI_ADD(1byte単位の繰り返し加算), MULTI_NIBBLE(4bit単位の筆算).
+    PROFILE_WIDE の場合、method によらず4bit単位の筆算
+    """
     # A * B => R
+    if method not in MULTI_METHODS:
+        raise ValueError(f"unknown method: {method}")
+    if _profile == PROFILE_WIDE:
+        multi_abs = _multi_decimal_abs_wide()
+    elif method == MULTI_NIBBLE:
+        multi_abs = _multi_decimal_abs_nibble()
+    else:
+        multi_abs = _multi_decimal_abs()
     return c.block_of(
-        _multi_decimal_abs(),  # R の絶対値を求める
+        # R の絶対値を求める
+        multi_abs,
         _xor_sign(),  # R の符号を求める
         c.move_ptr(NEXT),  # スタックの状態は {A, B, R}
         override(2),  # R を A の位置に上書き
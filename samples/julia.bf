@@ -21,112 +21,351 @@
 <<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>
 >>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
 <+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
-<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>
->>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<
-<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[
->-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>
->>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>
->>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<
-<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+
-<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>
->>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>
->>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-
-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<
-<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>
->[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
->+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<
-<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
->>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
->>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>
->>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
-<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<
-<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>
->>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+
->>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<
-<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+
->+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>
->>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[-
->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<
-<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]
-<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<
-<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>
->>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
-<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
-<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>
->>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<
-<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<
-[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>
->>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+
-<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>
->>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>
-[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>
->-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>
--<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<
-<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+
->]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<
-<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>
->>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>
->-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<
-<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<
-<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<
-]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-
-]>++++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[-
->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[
--<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[
-->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<
-<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>
->[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>
->+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<
-<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>
->>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>
->[-<<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>
->>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-
-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<
-<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<
-<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]
->c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<
-[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>
-[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<
-<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<
-<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>
-[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<
-<[-]<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>
->>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
->>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
-<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>
->>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>
->>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>
->>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
-<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
-<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<
-<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
->>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>
->>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<
+<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<
+<<<<<<[->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]
+>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<
+<<<<]>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->
+>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-
+<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>
+>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<
+<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+
+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>
+>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>
+>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]
+>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<
+[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<
+<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]
+>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<
+<<]>[->>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>
+>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>+
++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->
+>>>>>+<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<
++>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<
+<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<
+<<<<<<[->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+
+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<
+<[->>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>
+]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-
+<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>
+[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>
+>>>>>>>+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<
+<[->>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<
+<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+
+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>
+>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]
+>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>
+>>>>>>+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+
+>>>>>>]<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>+<<<<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->
+-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<
+<<<<<<<+>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<
+<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>
++<<<<<<<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>
+++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<
+]>[->>>>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>
+>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<
+<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[
+-]>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<
++>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
+<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[
+-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
+>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>
+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>
+[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+
+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[-
+>-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<
+<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>
+>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>
+>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<
++>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<
++<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+
+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[
+->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<
+<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>
+>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+
+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>
+>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[
+>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>
+[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<
++>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<+++
++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>
++<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<
+<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++
+[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>
+>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]
+<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<
+]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<
+<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>
+]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<
+<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>
+>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<
+]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]
+>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>
++<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[
+-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]
+>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[
+->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>
+>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+
+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>
+>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[
+->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>
+>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<
+<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[-
+>>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-
+<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>
+>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++
+++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[-
+>>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>
++<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>
+>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<
+<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<
+<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<
+[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
+<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>
+>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<
+<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
+>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
+-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<
+<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>
+>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>
++<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>
+>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<
+<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<
+<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<
+<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
+<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c
+]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[-
+>>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-
+<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<
+<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<
+[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]
+<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-
+]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>++
+++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>
+>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<
+<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[->>>
+>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>>+<+
+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>
+[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<
+<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<
+<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<
+<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]
+>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>
+>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>
+>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[
+-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<
+<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-
+]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<
+<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>
+>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<[-]
+<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
+>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>
+>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>
+>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
+<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>
+>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
+>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<
+<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>
+>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<
+[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>
+>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<
+<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>
+>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[
+->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-
+c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<
+[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<
+<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>
+>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<
+<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>++++++++++
++[<+++++++>-]<->+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>
+]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<
+<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>
+>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<
+<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>
+[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c
+]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>
+>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+
+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>
+>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<
+[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<
+<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<
+<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<]>>>>>>>>>
+>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<
+<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[
++[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<<+>>>>>>>>
+>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>>>>]>[-<<<
+<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<+>>>>>>]>[
+-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<
+]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[
+-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->
+>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<
++>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++
+++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<
+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<
+<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>
+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<
+<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<
+<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<
+<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>
+>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<
+<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<]>>
+>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]
+>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>
+>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<
+<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[
+-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<
+<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<]>>>>>>>>>
+[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<[->
+>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<
++>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-
+>>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[->>>>>>+<<
+<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<
+<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+<<<<<<<[->
+>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<
+<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[
+->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[->>>>>>>+<
+<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
+<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<
+<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
+<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[-<<<<<<<
+<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<<[>>++++[<
+++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]
+>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<
+<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
+<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<
+<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<
+<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-]<<[->-[>+
+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]
+>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>]<[-
+<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<<<<+++++++
++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
+>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<<<<<<<<<<<
+[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-
+]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-
+]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<
+]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>
+>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<
 <<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<
 [->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<
 ->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[
@@ -139,252 +378,184 @@
 >[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[
 -]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[
 -<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>++++++
-+++++[<+++++++>-]<->+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>
-->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>
-+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>
-c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<
-<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>
->]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>
->>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<
-<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>
->>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>
-c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>
->>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[
--]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>
-]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+++++++[<-------->-]<+>+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>
+>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>
+>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>
++<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>
+>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>
+>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[
+-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>
+>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+
+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>
+>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>
+>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>
+>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<
+<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]
+>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>
+>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>
+>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<
+<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<
+<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<
+<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<
+]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]
+>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->
+>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<
+[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<
+<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[
+-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<
+<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]
+>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]
+<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<
+<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[
+-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[
+->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>
+>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>
+>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>
+>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<
+<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>
->>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>
-]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<
-<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<
-+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]
->[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>
->>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[->>>>>>>>
->+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<[-]<<
-<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>
->>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
-<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>
->>]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
-<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
-<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>
->>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<
-<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<
-<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<
-<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
-<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c
-]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[-
->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-
-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<
-<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<
-[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]
-<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-
-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>
->++++[<+++++>-]<[<++++++++>-]<+>+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-
-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<
-<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<
-<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<
-<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>
->>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>
->>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>
->+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]
-<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<
-<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>
->>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<
-[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>
->[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<
-<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+
-<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>
->>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<
-<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>
->>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
+<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<
+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>
++<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-
+<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>
+>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>
+>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>
+>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>
+>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-
+<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[
+-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>
+>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c
+]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c
+]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>
+>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[
+->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>
+>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<+>>>>]<<<[
+-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<
+<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>
+>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<
+<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
 >>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]
->[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>
->]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>
->c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<
-<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>
->-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<
-<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>
-+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[
--]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<
-<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>
->>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->
->>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+
->>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>
->>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>
->>[-<<<<+>>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
-<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
-<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>
->>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-
-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<
-<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]
->>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<
-<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>
-[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>
-]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<
-<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<
-<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<
-<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<
-<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+
->>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>
->>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>
->>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]
->->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<
-<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
-<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<
-]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>
->+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+
->>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<
-+>>>>]<<<[-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+
->>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>
->+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[
--<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-
-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>
-]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<
-<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-
-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]
+[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 [->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
 >>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>
 +<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>
->>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[
--<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>
->]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>
->>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
->]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>
->+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>
-[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>
-]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>
->>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
->>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
-<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<
-<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[
--]<[-]<[-]<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<.>>>[-]<[-]<[-]<[-]<[-]<[
--]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<
-<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>
->>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>
->][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>+++
-+++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>
->>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>
-[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>
->>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>
->>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[-
->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[
->>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>
-[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>
->[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>
->>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>
->c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>
--c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<
-+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
->]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<
-+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]+
-+++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<
-<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<
-+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>
->>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>+
-++++++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<
-<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<
-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<
-<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>
->[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>
->]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<
-<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-
-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<
-<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<
-<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<
-+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->
->>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>
->>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
-<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[
--<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>>]<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>>+<<<<<<<<
+]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>
+>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>
+>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>+<<<<
+<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<
++>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<
+[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<
+<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]
+<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<.>>>[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]
+<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
+>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
+-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<
+<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++++<<<[-<<
+<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<
+]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<
++>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<
+<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<
+<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<
+<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<
+<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>
+>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<
++>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]
+<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<
+<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>
+>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<
+<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
+<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]
+<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]++++++++++.
+>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
+][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<
+<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>+++++++++++
+++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>
+>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[
+-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>
+>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>
+>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->
+>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>
+>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[
+-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>
+[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>
+>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>
+c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-
+c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+
+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>
+]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]
 
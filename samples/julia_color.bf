@@ -21,112 +21,351 @@
 <<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>
 >>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
 <+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
-<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>
->>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<
-<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[
->-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>
->>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>
->>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<
-<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+
-<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>
->>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>
->>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-
-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<
-<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>
->[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
->+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<
-<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
->>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
->>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>
->>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
-<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<
-<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>
->>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+
->>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<
-<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+
->+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>
->>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[-
->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<
-<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]
-<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<
-<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>
->>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
-<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
-<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>
->>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<
-<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<
-[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>
->>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+
-<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>
->>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>
-[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>
->-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>
--<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<
-<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+
->]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<
-<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>
->>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>
->-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<
-<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<
-<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<
-]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-
-]>++++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[-
->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[
--<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[
-->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<
-<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>
->[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>
->+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<
-<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>
->>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>
->[-<<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>
->>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-
-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<
-<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<
-<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]
->c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<
-[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>
-[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<
-<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<
-<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>
-[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<
-<[-]<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>
->>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
->>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
-<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>
->>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>
->>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>
->>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
-<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
-<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<
-<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
->>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>
->>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<
+<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<
+<<<<<<[->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]
+>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<
+<<<<]>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->
+>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-
+<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>
+>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<
+<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+
+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>
+>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>
+>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]
+>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<
+[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<
+<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]
+>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<
+<<]>[->>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>
+>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>+
++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->
+>>>>>+<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<
++>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<
+<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<
+<<<<<<[->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+
+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<
+<[->>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>
+]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-
+<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>
+[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>
+>>>>>>>+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<
+<[->>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<
+<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+
+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>
+>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]
+>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>
+>>>>>>+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+
+>>>>>>]<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>+<<<<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->
+-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<
+<<<<<<<+>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<
+<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>
++<<<<<<<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>
+++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<
+]>[->>>>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>
+>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<
+<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[
+-]>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<
++>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
+<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[
+-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
+>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>
+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>
+[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+
+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[-
+>-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<
+<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>
+>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>
+>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<
++>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<
++<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+
+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[
+->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<
+<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>
+>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+
+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>
+>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[
+>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>
+[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<
++>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<+++
++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>
++<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<
+<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++
+[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>
+>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]
+<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<
+]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<
+<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>
+]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<
+<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>
+>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<
+]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]
+>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>
++<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[
+-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]
+>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[
+->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>
+>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+
+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>
+>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[
+->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>
+>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<
+<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[-
+>>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-
+<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>
+>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++
+++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[-
+>>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>
++<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>
+>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<
+<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<
+<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<
+[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
+<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>
+>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<
+<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
+>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
+-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<
+<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>
+>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>
++<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>
+>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<
+<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<
+<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<
+<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
+<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c
+]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[-
+>>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-
+<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<
+<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<
+[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]
+<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-
+]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>++
+++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>
+>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<
+<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[->>>
+>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>>+<+
+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>
+[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<
+<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<
+<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<
+<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]
+>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>
+>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>
+>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[
+-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<
+<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-
+]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<
+<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>
+>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<[-]
+<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
+>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>
+>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>
+>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
+<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>
+>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
+>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<
+<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>
+>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<
+[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>
+>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<
+<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>
+>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[
+->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-
+c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<
+[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<
+<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>
+>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<
+<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>++++++++++
++[<+++++++>-]<->+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>
+]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<
+<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>
+>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<
+<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>
+[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c
+]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>
+>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+
+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>
+>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<
+[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<
+<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<
+<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<]>>>>>>>>>
+>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<
+<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[
++[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<<+>>>>>>>>
+>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>>>>]>[-<<<
+<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<+>>>>>>]>[
+-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<
+]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[
+-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->
+>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<
++>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++
+++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<
+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<
+<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>
+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<
+<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<
+<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<
+<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>
+>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<
+<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<]>>
+>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]
+>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>
+>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<
+<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[
+-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<
+<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<]>>>>>>>>>
+[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<[->
+>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<
++>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-
+>>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[->>>>>>+<<
+<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<
+<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+<<<<<<<[->
+>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<
+<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[
+->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[->>>>>>>+<
+<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
+<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<
+<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
+<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[-<<<<<<<
+<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<<[>>++++[<
+++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]
+>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<
+<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
+<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<
+<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<
+<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-]<<[->-[>+
+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]
+>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>]<[-
+<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<<<<+++++++
++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
+>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<<<<<<<<<<<
+[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-
+]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-
+]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<
+]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>
+>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<
 <<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<
 [->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<
 ->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[
@@ -139,285 +378,216 @@
 >[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[
 -]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[
 -<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>++++++
-+++++[<+++++++>-]<->+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>
-->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>
-+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>
-c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<
-<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>
->]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>
->>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<
-<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>
->>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>
-c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>
->>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[
--]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>
-]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+++++++[<-------->-]<+>+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>
+>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>
+>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>
++<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>
+>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>
+>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[
+-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>
+>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+
+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>
+>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>
+>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>
+>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<
+<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]
+>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>
+>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>
+>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<
+<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<
+<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<
+<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<
+]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]
+>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->
+>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<
+[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<
+<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[
+-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<
+<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]
+>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]
+<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<
+<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[
+-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[
+->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>
+>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>
+>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>
+>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<
+<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>
->>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>
-]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<
-<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<
-+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]
->[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>
->>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[->>>>>>>>
->+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<[-]<<
-<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>
->>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
-<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>
->>]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+
-<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
-<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>
->>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<
-<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<
-<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<
-<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
-<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c
-]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[-
->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-
-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<
-<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<
-[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]
-<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-
-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>>>
->++++[<+++++>-]<[<++++++++>-]<+>+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-
-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<
-<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<
-<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<
-<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>
->>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>
->>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>
->+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]
-<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<
-<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>
->>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<
-[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>
->[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<
-<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+
-<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>
->>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<
-<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>
->>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
+<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<
+<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>
++<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-
+<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>
+>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>
+>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>
+>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>
+>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-
+<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[
+-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>
+>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c
+]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c
+]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>
+>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[
+->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>
+>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<+>>>>]<<<[
+-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<
+<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>
+>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<
+<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
 >>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]
->[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>
->]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>
->c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<
-<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>
->-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<
-<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>
-+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[
--]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<
-<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>
->>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->
->>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+
->>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>
->>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>
->>[-<<<<+>>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
-<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
-<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>
->>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-
-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<
-<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]
->>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<
-<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>
-[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>
-]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<
-<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<
-<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<
-<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<
-<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+
->>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>
->>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>
->>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]
->->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<
-<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
-<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<
-]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>
->+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+
->>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<
-+>>>>]<<<[-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+
->>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>
->+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[
--<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-
-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>
-]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<
-<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-
-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]
+[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 [->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
 >>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>
 +<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>
->>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[
--<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>
->]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
->>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>
->>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
->]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>
->+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>
-[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>
-]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>
->>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]
->>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
-<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<
-<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[
--]<[-]<[-]<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<
-<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]
->>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++[<+
-+++++++>-]<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]
->+++++++++[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++[<++++
-+++>-]<.[-]>++++++++++[<+++++++++++>-]<-.[-]<<<]<[-]<<<<[->>>>>+<+<<<<]>
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>>]<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>>+<<<<<<<<
+]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>
+>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>
+>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>+<<<<
+<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<
++>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<
+[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<
+<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]
+<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][
+-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<
+<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++[<++++++++>-]
+<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]>+++++++++[<+
++++++++++>-]<+<----------------------.>.<++++++++++++++++++++++++.--.>++
+++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]
+[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<
+<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>+++++++++++[<++++++>
+-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<+>>++++++++
++[<++++++++++>-]<+<-----------------------.>.<++++++++++++++++++++++++.-
+.>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>
+>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>
+[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>+++++++++++[<+++
++++>-]<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<++>>++
++++++++[<++++++++++>-]<+<------------------------.>.<+++++++++++++++++++
++++++..>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<
+<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<
+]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++
+[<+++++++>-]<--[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]
+<++>>+++++++++[<++++++++++>-]<+<------------------------.>.<++++++++++++
+++++++++++++.+.>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>
 >>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>
 >+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++
-+++++++++[<++++++>-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>
--]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>++++
-+++[<+++++++>-]<+.[-]>++++++++++[<+++++++++++>-]<-.[-]<<<]<[-]<<<<[->>>>
->+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]
-<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<
-+>>>>>]>+++++++++++[<++++++>-]<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>++
-+++[<+++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<
-++.[-]>+++++++[<+++++++>-]<++.[-]>++++++++++[<+++++++++++>-]<-.[-]<<<]<[
--]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<
-<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]
->>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-]<--[-<<<<->>>>]<<<[-]+<[[-]>-<
-]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++
-[<+++++++>-]<++.[-]>+++++++[<+++++++>-]<+++.[-]>++++++++++[<+++++++++++>
--]<-.[-]<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<
-<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[
-->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-]<-[-<<<<->>>>]<<
-<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++[<++++++++++>-]<
-+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++++[<++++++>-]<-.[-]>++++++++++[<
-+++++++++++>-]<-.[-]<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<
-<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>
->>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-]<[-<
-<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++[<+++
-+++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++++[<++++++>-]<.[-]>++
-++++++++[<+++++++++++>-]<-.[-]<<<]<<<<<.>>>[-]<[-]<[-]<[-]>+++++[<+++++>
--]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>++++++[<++++++++>-]<.[-]>++++++
-++++[<+++++++++++>-]<-.[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>
->>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[
--<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<
-<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<
-<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<
-<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>
->>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>
->>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>
->>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-
-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<
-<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]
->>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<
-<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>
->>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<
-<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
->]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<
-+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]++++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>
->>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>
-+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<
-<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
->>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>+++++++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<
-]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>
->>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>
->>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>
->>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>
-+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-
-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<
-<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]
->>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>
->>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<
-<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<
-<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<
-<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<
-[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
-<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[
--<<<<<<<<+>>>>>>>>]<<<<]
+++++++++[<+++++++>-]<-[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++
+++++>-]<++>>+++++++++[<++++++++++>-]<+<------------------------.>.<+++++
++++++++++++++++++++.++.>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+
+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
+<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>
+>>>>]>++++++++++[<+++++++>-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++
+++[<+++++++>-]<++>>+++++++++[<++++++++++>-]<+<------------------------.>
+.<++++++++++++++++++++++++.+++.>++++++++++++++++++.<[-]>[-]<<<<]<<<<<.>>
+>[-]<[-]<[-]<[-]>+++++[<+++++>-]<++>>+++++++++[<++++++++++>-]<+>>+++++++
++++[<+++++++++++>-]<-<<.>.<+++++++++++++++++++++.>>.<<[-]>[-]>[-]<<<[-]<
+[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
+<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>
+>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++
+++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>
+>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>
+>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+
+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[
+->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<
+[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>
+>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>
+>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>
+>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>
+>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[
+>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<
+<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>
+>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<
+<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]
+++++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
+<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>
+>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>
++++++++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<
+<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<
+<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
+<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>
+>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+
+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<
+<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<
+-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<
+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
+<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<
+<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[-
+>>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]
+>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<
+<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>
+[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]
 
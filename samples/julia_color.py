@@ -1,5 +1,6 @@
 # ジュリア集合
 
+import argparse
 import bf_core as c
 import bf_stack as s
 
@@ -18,7 +19,13 @@ C_X = -0.3
 C_Y = -0.63
 
 
-def julia(columns: int, rows: int) -> str:
+def julia(columns: int, rows: int, profile: str = s.PROFILE_BYTE) -> str:
+    "profile は bf_stack のプロファイル. 2byte以上のセル用には PROFILE_WIDE"
+    with s.use_profile(profile):
+        return _julia(columns, rows)
+
+
+def _julia(columns: int, rows: int) -> str:
     # X軸の加算値
     x_step = (X_END - X_BEGIN) / (columns - 1)
     # Y軸の加算値
@@ -51,12 +58,12 @@ def julia(columns: int, rows: int) -> str:
                     # #9: zx2 = zx * zx
                     s.dup(4),
                     s.dup(0),
-                    s.multi_decimal(),
+                    s.multi_decimal(s.MULTI_NIBBLE),
 
                     # #10: zy2 = zy * zy
                     s.dup(4),
                     s.dup(0),
-                    s.multi_decimal(),
+                    s.multi_decimal(s.MULTI_NIBBLE),
 
                     # #11: size2 = zx2 + zy2
                     s.dup(1),
@@ -88,7 +95,7 @@ def julia(columns: int, rows: int) -> str:
                             # #14: zy_next = zx * zy * 2 + cy
                             s.dup(9),
                             s.dup(9),
-                            s.multi_decimal(),
+                            s.multi_decimal(s.MULTI_NIBBLE),
                             s.dup(0),
                             s.add_decimal(),
                             s.push_decimal(C_Y),
@@ -184,5 +191,10 @@ def julia(columns: int, rows: int) -> str:
 
 
 if __name__ == '__main__':
-    program = julia(128, 40)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--profile", choices=s.PROFILES,
+                        default=s.PROFILE_BYTE,
+                        help="wide: for bf2c -2/-4 (short/int cells)")
+    args = parser.parse_args()
+    program = julia(128, 40, args.profile)
     print(program)
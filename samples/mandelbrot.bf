@@ -1,424 +1,595 @@
->>>>+++++[<++++++>-]<[<++++++++>-]+>>++++++++[<+++++>-]<[->>>>>++>>+>>>+
-+++[<++++>-]<[<++++++++>-]<[->>>>[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
->>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
-<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
-<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>
->>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<
-<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<
-<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
->>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
->>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]>>>>>>>>>++++++++[<++++
->-]>>>>++++++++[<++++++++>-]>>>>+++++[<+++++>-]<+[->>>>[-]<<<<<<<<<<<<<<
-<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>
->>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>
->>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<
-<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+
->>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<
-<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>
->>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>
->+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<
-<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<
-<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>
->>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>
->>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]
-<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<
-<<<<<<<+>>>>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<
-<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>
->>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
-<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>
+>>>++++[<---->-]+>>++++++++[<+++++>-]<[->>>>>++>>+>>>++++[<++++>-]<[<+++
++++++>-]<[->>>>[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
+][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<
+<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>
 >>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<
 <<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>
 >>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
-<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
-<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<
-+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>
->>>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>
-+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<
-<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>
->>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<
-<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<
-[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>
->>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>
->>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<
-<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>
-+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>
->>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>
->>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[
--]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<
-<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>
->>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>
->>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[
--<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<
-<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>
->>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]
-[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<
-<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->
->>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<
-[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<
-<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[
-->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<
-<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<
-<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<
-+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<
-<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>
->>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[-
->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<
-<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>
-c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<
-[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]
-<[-]<[-]<[-]>++++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>
+<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]>>>>>>>>>++++++++[<++++>-]>>>>++++++++[<+
++++++++>-]>>>>+++++[<+++++>-]<+[->>>>[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>
+>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>
+>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>
+>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]
+>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>
+>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[
+->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<
+<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>
++<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<
+<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<
+<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>
+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<
+]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>
+]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<
+<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-
+<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++
+[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>
+>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->
+>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<
+<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++
+++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>
+]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]
+>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+
+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[
+->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
+<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[
+-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<
+<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<
+<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<
+<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>
+[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
++<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>
+>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>
+>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]
+<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<
+<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<
+<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>
+>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+
+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]
+<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<
+<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<
++>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<
+[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<
+<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<+
++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>
+>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>
+>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<
+<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+
+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<
+<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<
+<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>
+>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<
+<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>
+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
+<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]
+<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<
++>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>
+>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>
+>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>
+]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<<+>>>>>
+>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>
+>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>>>>]>[-
+<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<+>>>>>>
+]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>
+>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>
+>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<
+<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>
+>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>
+[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<
+<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>
+>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]
+<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[
+->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<
+<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>
+-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]
+<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[
+>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<
+<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<
+]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<
++>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->
+>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-
+<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>+<
+<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<]>>>>>>
+>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<
+<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<
+[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<
+<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>
+>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[->>>>>>
++<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
+]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<
+<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+<<<<<<<
+[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<
+<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[->>>>>>
+>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+
+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[-<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<<[>>+++
++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<
+<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>>>>>]<<
+<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<
+<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++++[<+++
++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>
++<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<
+<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>]
+<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<<<<++++
+++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
+>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<<<<<<<<
+<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
+<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]
+<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
+>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
+-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<
+<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>
+>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>
++<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
+>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<
+<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[
+->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<-
+>>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[-
+>>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[
+-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>
+>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<
+[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<
+<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<-
+>>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>
+[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-
+]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-
+<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>++++<<<<<
+[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<
+<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]
+>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[->>>>>>>>+<
+<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<
+<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<
+<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
+<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<
+<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->
+>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>
+>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>
+>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<
+<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>
+[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>
+-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<
+<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>
+>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-
+<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>
+>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<
+<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<[-]<[-]+>>
+[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>
+>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<
+<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<
+<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<
+<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
+<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<
+<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
+>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>
+>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>
+>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>
+>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<
+<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
+>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>-
+>>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+
+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c
+]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<
+<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>
+]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>
+>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<
+->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>
+>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c
+]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>
+>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-
+]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]
+<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+
+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>
+>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<
+<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>
+>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
+>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]
+>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>
+>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>
+>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<
+<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>
+>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<
+<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>
++<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[
+-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+
+<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-
+<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[
+>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>
+>>>>>>]>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<
+<<<<<<<<<<<]>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[-<<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[-<<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<
+<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>
+>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>
++>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<
+<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-
+<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[-
+>>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<
+<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+
+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>
+>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>
++<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<
+<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>
+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>
+>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<
+]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]
+<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<
+<<]>[->>>>>>+<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[
+-<<<<<<+>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>
+>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>
+>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->
+-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<
+<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<
+[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<
+<<<<<<<<[->>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<
+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>
+[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<
+<[->>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>
+>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]
+<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>
+>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<
+<<<<<<<<[->>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>
+>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<
+<[->>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]
+>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>
+]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>
+>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-
+<<<<<<+>>>>>>]<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>+<<<<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>
+-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>
+>>>>]<<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-
+>>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<
+<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<
+<<<<<<<]>[->>>>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++
+++++++>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-
+<<<<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-
+]>[-]>[-]>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>
+>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-
+<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>
+>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<
+<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>
+>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>
+>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>
+>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>
+>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]
+>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>
+>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>
+>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]
+>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[
+-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>
+>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<
+<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-
+]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]
+<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>
+>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<
+<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<
+<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[
+-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<
+<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]
+<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<
+<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[
+-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<
+<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<
+[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[
+-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
+>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>
+[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<
+<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<
+<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>
+>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[
+->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-
+c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<
+[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<
+<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>
+>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<
+<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>
+>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>
+>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<
+<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<
+<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>
 >]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<
 <<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+
->]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->
->>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-
-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<
-<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[-
->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<
-->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->
-+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<
-[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[
-->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>
->>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<
-+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>
-]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>
-+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<
-[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]
-<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[-
->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[
--]<[-]<[-]<<[-]<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>
->>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>
->[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>
->>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>]
-[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
->>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+
-<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<
-<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<
-<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<
-<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[
--<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
->>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>
->>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
-<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]
->>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>
->[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>
->>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>
->-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+
-<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<
-+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<
-<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>
->>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>
->>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<
-<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<
-<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<
-<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[
--]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
-[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<
-<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<
-<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>
-c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>
->[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+
-<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<
-<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<
-+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<
-<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>
->>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>
->[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-
-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]
-<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<
-[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<
-<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>
->+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>
->>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<
-[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>
->>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>
->>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[
->-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>
->>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<
-<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
->]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<
-+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<[-
->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>
-][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<
-<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<
-<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<
-<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
-<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>
->>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+
->>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<
-<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<
--<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<
-<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
-<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<
-<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[-
->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]
->>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+
-<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>
->>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]
-<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<
-<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<
-<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<
-<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>
-c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[
-->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[
--<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<
-<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<
-<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<
-]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[
--]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<
-<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[
-->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>
->>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<
-<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[
-->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<
-<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-
->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<
-<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<
-[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+
->>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<
-<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>
->]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->
->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<
-<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c
-]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[
-->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<
-[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<
-<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<
-<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<
-<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-
-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-
-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<
-<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>
->>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
-<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>
->>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+
-<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<
-<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<
-<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
-[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<
-]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-
-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<
-<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c
-]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+
-<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
-[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-
-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<
-<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<
-[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+
-<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>
->>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+
-<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<
-+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->
->>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-
-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[
--<<<<+>>>>]<<<[-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-
-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[-
->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>
->>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]
+[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<
+<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->
+>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<
++>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]
++>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<
+<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<
+[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>
+]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+
+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<
+<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<
+<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>
+>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<
+]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[
+->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<
+<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>
+>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<
+<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<
+<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<
+<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<+>>>>]<<<[-]+<[[-]>
+-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>
+>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<
++>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<
-+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+
->>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>
->>>[-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
+>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<
+<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
+<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
 >>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>
->>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
->>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<
-<+>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>>]<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
 >>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>
->>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<
+<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>
+[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>
+[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<
+<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<[-]>
+>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<
+[-]<<<<]<[-]<[-]<[-]<[-]<<<<.>>>[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<
+[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
+>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>
+[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<
+<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>]>>++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<
+<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<
+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
+[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<
 ]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-
-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<
-[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<
-<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]
->>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<
-<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<
-[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<.>>>[-]<[-]<[-]<[-]<
-[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[
-->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>
->>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<
-<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<
-]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>
->>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-
-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<
-<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<
-<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]
->c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<
-[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>
-[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-
-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<
-<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<
-<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>
-[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<
-<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>
->>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<
-<<<<<+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]++++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<
-<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++++++++++<<<[-<<<+>>>>+<]<<<[->>>
-+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>
->>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<
-<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>
->>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>
->>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>
-]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>
->>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>
->>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<
-<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>
->>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]
-<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>
->+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<
-[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<
+<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<
+<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c
+]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+
+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
+[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-
+<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<
+<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<
+[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<
 <<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>
->>>[-<<<<<<<<+>>>>>>>>]<<<<]
+>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]<[-]
+<[-]<[-]<[-]++++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]
+>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>
+>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
+<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
+>>>>>>>>>]>>++++++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>
+>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>
+>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>
++<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>
+>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>
+>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[
+-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>
+>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>
+>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+
+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>
+>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>
+>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>
+>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<
+[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
+<<<]
 
@@ -1,5 +1,6 @@
 # マンデルブロ集合
 
+import argparse
 import bf_core as c
 import bf_stack as s
 
@@ -15,7 +16,13 @@ C_MAX = 26
 THRESHOLD2 = 4
 
 
-def mandelbrot(columns: int, rows: int) -> str:
+def mandelbrot(columns: int, rows: int, profile: str = s.PROFILE_BYTE) -> str:
+    "profile は bf_stack のプロファイル. 2byte以上のセル用には PROFILE_WIDE"
+    with s.use_profile(profile):
+        return _mandelbrot(columns, rows)
+
+
+def _mandelbrot(columns: int, rows: int) -> str:
     # X軸の加算値
     x_step = (X_END - X_BEGIN) / (columns - 1)
     # Y軸の加算値
@@ -50,12 +57,12 @@ def mandelbrot(columns: int, rows: int) -> str:
                     # #11: zx2 = zx * zx
                     s.dup(4),
                     s.dup(0),
-                    s.multi_decimal(),
+                    s.multi_decimal(s.MULTI_NIBBLE),
 
                     # #12: zy2 = zy * zy
                     s.dup(4),
                     s.dup(0),
-                    s.multi_decimal(),
+                    s.multi_decimal(s.MULTI_NIBBLE),
 
                     # #13: size2 = zx2 + zy2
                     s.dup(1),
@@ -87,7 +94,7 @@ def mandelbrot(columns: int, rows: int) -> str:
                             # #16: zy_next = zx * zy * 2 + cy
                             s.dup(9),
                             s.dup(9),
-                            s.multi_decimal(),
+                            s.multi_decimal(s.MULTI_NIBBLE),
                             s.dup(0),
                             s.add_decimal(),
                             s.dup(11),
@@ -166,5 +173,10 @@ def mandelbrot(columns: int, rows: int) -> str:
 
 
 if __name__ == '__main__':
-    program = mandelbrot(128, 40)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--profile", choices=s.PROFILES,
+                        default=s.PROFILE_BYTE,
+                        help="wide: for bf2c -2/-4 (short/int cells)")
+    args = parser.parse_args()
+    program = mandelbrot(128, 40, args.profile)
     print(program)
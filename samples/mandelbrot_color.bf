@@ -1,456 +1,627 @@
->>>>+++++[<++++++>-]<[<++++++++>-]+>>++++++++[<+++++>-]<[->>>>>++>>+>>>+
-+++[<++++>-]<[<++++++++>-]<[->>>>[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
->>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
-<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
-<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>
->>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<
-<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-
-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<
-<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
->>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
->>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]>>>>>>>>>++++++++[<++++
->-]>>>>++++++++[<++++++++>-]>>>>+++++[<+++++>-]<+[->>>>[-]<<<<<<<<<<<<<<
-<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>
->>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>
->>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<
-<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+
->>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<
-<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>
->>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>
->+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<
-<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<
-<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>
->>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>
->>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]
-<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<
-<<<<<<<+>>>>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<
-<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>
->>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
-<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>
+>>>++++[<---->-]+>>++++++++[<+++++>-]<[->>>>>++>>+>>>++++[<++++>-]<[<+++
++++++>-]<[->>>>[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
+>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
+][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<
+<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>
 >>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<
 <<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>
 >>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
-<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
-<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<
-+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>
->>>>>>>>>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>
-+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<
-<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>
->>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<
-<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+>+<
-[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>
->>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<<[->>>>
->>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<
-<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>>
-+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[>-c]>[-<<+>>>c]>c]<<<<<<<]>>
->>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>
->>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[
--]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<
-<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>
->>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>
->>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[
--<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<
-<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>
->>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]
-[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<
-<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->
->>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<
-[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<
-<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[
-->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<
-<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<
-<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<
-+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<
-<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>
->>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[-
->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<
-<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>
-c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<
-[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]
-<[-]<[-]<[-]>++++<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>
+<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]>>>>>>>>>++++++++[<++++>-]>>>>++++++++[<+
++++++++>-]>>>>+++++[<+++++>-]<+[->>>>[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>
+>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>
+>>>>+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>
+>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]
+>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>
+>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[
+->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-
+]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<
+<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>
++<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<
+<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<
+<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>
+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->
+>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<
+]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>
+]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<
+<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-
+<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++
+[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>
+>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>
+>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>
+>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->
+>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<
+<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++
+++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<
+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>
+]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]
+>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+
+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[
+->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<
+<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[
+-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>
+>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<
+<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<
+<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<
+<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>
+[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
++<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>
+>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>
+>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]
+<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<
+<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<
+<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>
+>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+
+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]
+<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<
+<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<
++>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<
+[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<
+<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<+
++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>
+>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>
+>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<
+<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+
+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<
+<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<
+<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>
+>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<
+<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+
+<+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>
+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>][-]<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
+<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>][-]
+<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<
++>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>
+>>>[-<<<<<+>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<]>>>>>>
+>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<
+<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>
+>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>
+]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>>>>>>>]>[-<<<<<<<<<<+>>>>>
+>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>
+>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<+>>>>]>[-
+<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<+>>>>>>
+]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>
+>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>
+>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<
+<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>
+>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<
+<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>
+[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<
+<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>
+>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]
+<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[
+->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<
+<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>
+-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<
+<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]
+<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[
+>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<
+<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<
+]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<
++>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->
+>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-
+<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<
+]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>+<
+<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<]>>>>>>
+>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<
+<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<
+[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<
+<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>
+>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<[->>>>>>>>>+<<<<<[->>>>>>
++<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
+]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<
+<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>[-<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<[->>>>>>>>+<<<<<<<
+[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<
+<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<[->>>>>>>>+<<<<<<[->>>>>>
+>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+
+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[-<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-<<<<<<+>>>>>>]<<<<<<[>>+++
++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<
+<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>>>>>[-<<<<<<<<+>>>>>>>>]<<
+<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<
+<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<[>>++++[<+++
++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>
++<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<[>>++++[<++++>-]<<[->-
+[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<
+<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>]
+<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<<<<++++
+++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
+>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-]>[-]>[-]>[-]<<<<<<<<<<<<<
+<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
+<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]
+<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
+>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
+-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<
+<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>
+>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>
++<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
+>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<
+<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[
+->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<-
+>>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[-
+>>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[
+-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>
+>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<
+[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<
+<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<-
+>>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>
+[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-
+]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-
+<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]>++++<<<<<
+[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<
+<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]
+>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<[->>>>>>>>+<
+<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<
+<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<
+<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<
+<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<
+<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->
+>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>
+>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>
+>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<
+<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>
+[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>
+-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<
+<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>
+>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-
+<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>
+>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<
+<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<[-]<[-]+>>
+[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<
++<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>
+>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<
+<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<
+<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<
+<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
+<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<
+<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>
+>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>
+>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>
+>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>
+>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<
+<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
+>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>-
+>>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+
+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c
+]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<
+<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>
+]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>
+>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<
+->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>
+>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c
+]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>
+>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-
+]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]
+<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+
+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>
+>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<
+<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>
+>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>
+>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]
+>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>
+>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>
+>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<
+<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>
+>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<
+<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>
++<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[
+-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<[->>>>>>>>>>>>>>>>>>>+
+<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-
+<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<+>>>>>>>>]>[-<<<<<<<<+>>>>>>>>]<<<<<<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>[
+>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-<<<<<<<<<<+>>>>
+>>>>>>]>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>+<<<<
+<<<<<<<<<<<]>>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[-<<<<+>>>>]>[-<<<<+>>>>]<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>+<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[-<<<<<<+>>>>>>]>[-<<<<<<+>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>+<<<
+<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<<]>>>>>>
+>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>
++>>]<<<<<]>[-]<]>>[->>>>+<<<<]>[->>>>+<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<
+<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-
+<<<<<<<<<<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<
+<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<<[-
+>>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<
+<<+>>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]
+>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<<<<<<<<<<<[->>>>>>>>>>>+<<<<[->>>>>+
+<<<<+<]>>>>>[-<<<<<+>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>
+>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>
++<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<
+<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>
+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>
+>>>+<<<<<]>[->>>>>+<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<
+]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]
+<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<
+<<]>[->>>>>>+<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[
+-<<<<<<+>>>>>>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[
+<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>
+>>>>+<<<<<<<]<<<<<<<<<<[->>>>>>>>>>+<<<<[->>>>>+<<<<+<]>>>>>[-<<<<<+>>>>
+>]<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<[>>++++[<++++>-]<<[->
+-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<
+<<<]<<<<<<<<<[->>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<<<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<
+[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]<
+<<<<<<<<[->>>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<
+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>
+[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<<
+<[->>>>>>>>>+<<<<<[->>>>>>+<<<<+<<]>>>>>>[-<<<<<<+>>>>>>]<<<<<<<<<<]>>>>
+>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]
+<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<]>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<]>>>
+>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<
+<<<<<<<<[->>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>
+>>]<<<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]
+>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]<<<<<<<
+<[->>>>>>>>+<<<<<<[->>>>>>>+<<<<+<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<<<<<<<<<]
+>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>
+]<<<<<]>[-]<]>>[->>>>>>>>+<<<<<<<<]>[->>>>>>>>+<<<<<<<<]<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<<<<+<<<<<<<<<<<<<]>>>
+>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>]<<<<<<<<[-
+<<<<<<+>>>>>>]<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]
+<]>>[->>>>+<<<<]>[->>>>+<<<<]>>>>[-<<<<<<<+>>>>>>>]<<<<<<<[>>++++[<++++>
+-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>+<<<<<]>[->>>>>+<<<<<]>
+>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>
+>]<<<<<]>[-]<]>>[->>>>>>+<<<<<<]>[->>>>>>+<<<<<<]>>>>>>[-<<<<<<<<<+>>>>>
+>>>>]<<<<<<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[-
+>>>>>>>+<<<<<<<]>[->>>>>>>+<<<<<<<]>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<
+<<<<[>>++++[<++++>-]<<[->-[>+>>]>[+[-<+>]>+>>]<<<<<]>[-]<]>>[->>>>>>>>+<
+<<<<<<<]>[->>>>>>>>+<<<<<<<<]>>>[-]>[-]>>[-<<<<<<<<<<<<<<<<<<<++++++++++
+++++++>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]>>>[-
+<<<<<<<<<<<<<<<<<<<<<<++++++++++++++++>>>>>>>>>>>>>>>>>>>>>>]<[-<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<[-]>[-]>[-]>[-]>[-
+]>[-]>[-]>[-]<<<<<<<<<<<<<<<<[->>>>>>>>>+<<<<<<<<<]>>>>[->>>>>-<<<<<]>>>
+>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-
+<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>
+>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<
+<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>
+>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]<<<<<[-<<<+>>
+>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>
+>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>
+>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]
+>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>
+>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>
+>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]
+>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[
+-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>
+>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<
+<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-
+]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]
+<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>
+>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<
+<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<
+<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[
+-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]
+>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<
+<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<
+<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]
+<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<
+<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[
+-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<
+<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<
+[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[
+-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<
+<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>
+>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>
+[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<
+<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<
+<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>
+>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>
+>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<
+<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[
+->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-
+c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<
+[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>
+>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<
+<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>
+>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<
+<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>
+>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>
+>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<
+<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<
+<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>
 >]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<
 <<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+
->]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->
->>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-
-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>][-]<<<<<<<
-<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>
->>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<
-+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<
-<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[-
->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<
-->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->
-+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<
-[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[
-->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>
->>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<
-+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>
-]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>
-+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<
-[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]
-<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[-
->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[
--]<[-]<[-]<<[-]<[-]+>>[[-]<<->+>]<[->>[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>
->>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>
->[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<
-<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>
->>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>]
-[-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
->>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>+
-<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>]<[->>>[-]<<<<<<<<<<<
-<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<
-<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<
-<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[
--<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
->>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>
->>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>
->>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>
->>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<
-<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<
-<<<<[->>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]
->>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>
->[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>
->>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>
->-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+
-<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<
-+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<
-<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>
->>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>
->>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<
-<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<
-<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<
-<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[
--]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
-[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<
-<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<
-<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>
-c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>
->[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+
-<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<
-<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<
-+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<
-<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>
->>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>
->[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-
-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]
-<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<
-[->>>>>>>>>>>+<<<<<<<[->>>>>>>>+<<<<+<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<
-<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>>>]<<<<<<<<<<<[->>>>>>>>>>>
->+<<<<<<<[->>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<]>>>>>>>>[-<<<<<<<<+>>
->>>>>>]<<<<<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<<<<<<
-[->>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>>>c]<<<<<<<]>>>>>>
->>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<]>>>>>>>>>>>[-<<<<<<<<<<<+>>>>>>>>>
->>]<<<<<<<<<<<[->>>>>>>>>>>>+<<<<<<<<[->>>>>>>>>+<<<<+>+<[>-c]>[-<<+>+<[
->-c]>[-<<+>>>c]>c]<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]<<<<<<<<<<<<<]>
->>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<[-]<<<<<<<<[->>>>>>>>>+<<<<<<<
-<<]>>>>[->>>>>-<<<<<]>>>>>[[-]<+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
->]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<
-+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-]<[-]<[-]<[-]<<<<[-
->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>
-][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<
-<<<<+>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<
-<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<
-<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
-<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>
->>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+
->>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<
-<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<
--<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<
-<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<
-<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<
-<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[-
->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]
->>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+
-<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>
->>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]
-<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<
-<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<
-<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<
-<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>
-c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[
-->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[
--<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<
-<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<
-<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<
-]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[
--]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<
-<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[
-->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>
->>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<
-<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[
-->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<
-<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[-
->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<
-<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<
-[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+
->>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<
-<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>
->]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->
->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<
-<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c
-]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[
-->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<
-[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<
-<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<
-<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<
-<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-
-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-
-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<
-<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>
->>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<
-<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+
->>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>
->>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[
-->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+
-<[->-<]>[-<+>]<<<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<
-<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<
-<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
-[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<
-]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-
-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<
-<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c
-]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+
-<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>
-[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-
-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<
-<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<
-[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+
-<[[-]>->+<<]>>[->>+<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>
->>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+
-<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<
-+>]<<]<[-<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->
->>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-
-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[
--<<<<+>>>>]<<<[-]+<[[-]>-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-
-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[-
->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>
->>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
+>]<<<]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]
+[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<
+<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->
+>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+<[->-<]>[-<+>]<<<<<[-<<<
++>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]
++>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+
+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<
+<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<
+[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>
+]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+
+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<
+<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<
+<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>
+>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<
+]>>>>>>>[-]<[-]<[-]<[-]<[-]<[[-]<<+>>]<[[-]<+>]+<[[-]>->+<<]>>[->>+<<<<[
+->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<
+<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>
+>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<]<[-<[->>>>>>>>+<<<
+<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<
+<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<
+<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<]<<<<<[-<<<<+>>>>]<<<[-]+<[[-]>
+-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>
+>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<
++>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<
-+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+
->>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>
->>>[-<<<<+>>>>]>[-<+>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
+>>>>>>>>>]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<
+<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<
+<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
 >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<
 <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
 >>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
->>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
->>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>
->>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<
-<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<
-<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
->>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
->>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
->>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<
-<+>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+][-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<+<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]+[-<<<<+>>>>]<<<<<<<<<<<<<<<<<
 <<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
 <+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>
 >>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
 >>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<
-<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>
->>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<
-]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-
-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<
-[->>>>>>>>+<<<<<<<<]>>>>[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<
-<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]
->>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<
-<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<
-[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>
-[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+
-<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++
-++[<++++++++>-]<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<+
-+.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++[
-<+++++++>-]<.[-]>++++++++++[<+++++++++++>-]<-.[-]<<<]<[-]<<<<[->>>>>+<+<
-<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[
-->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>
->]>+++++++++++[<++++++>-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+
-++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]
->+++++++[<+++++++>-]<+.[-]>++++++++++[<+++++++++++>-]<-.[-]<<<]<[-]<<<<[
-->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>
->][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-
-<<<<<+>>>>>]>+++++++++++[<++++++>-]<+[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[
--]>+++++[<+++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>+++++++[<++++++
-+>-]<++.[-]>+++++++[<+++++++>-]<++.[-]>++++++++++[<+++++++++++>-]<-.[-]<
-<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>
-[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+
-<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-]<--[-<<<<->>>>]<<<[-]+<[[
--]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>++
-+++++[<+++++++>-]<++.[-]>+++++++[<+++++++>-]<+++.[-]>++++++++++[<+++++++
-++++>-]<-.[-]<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>
->+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]
-<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-]<-[-<<<<->>
->>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++[<+++++++++
-+>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++++[<++++++>-]<-.[-]>+++++++
-+++[<+++++++++++>-]<-.[-]<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][
--]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<
-<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++>-
-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++[<+++++>-]<++.[-]>+++++++++
-[<++++++++++>-]<+.[-]>+++++++[<+++++++>-]<++.[-]>+++++++++[<++++++>-]<.[
--]>++++++++++[<+++++++++++>-]<-.[-]<<<]<<<<<.>>>[-]<[-]<[-]<[-]>+++++[<+
-++++>-]<++.[-]>+++++++++[<++++++++++>-]<+.[-]>++++++[<++++++++>-]<.[-]>+
-+++++++++[<+++++++++++>-]<-.[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<
-[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<
-<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>
->>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][
--]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++++
-<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+
-<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<
-<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>
->>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>
-]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>
->>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>
->-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<
-<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-
-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>
->>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]
->>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]
->[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>
->>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<
-<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>
->>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]<[-]<[-]<[-]<[-]++++
-++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<
-<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>
->>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>
-][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>]>>++++
-++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<+>>>>->>>]<<<<<<<[-
->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>>>>>>+<+<<<<<<<]>>>
->>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<[
--]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<
-<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<
-<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[->>>>>>>>c]<<<<<<<<+
-<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c]>[-<<->>>c]<<-<<<<
-]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[->>>>>>>+<+<<<<<<]>
->>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>->>>>c]>>>>[-<<<<<<
-[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<<<+>>>>]<[-<<<<+>>>
->]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>>>>>[-]<<<<<[->>>>+
->+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<+>>>>]<<<<<[-]>>>>[
--<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>
->>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<
-<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<]
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<]>[-<<<<<[->>>>>>>>+<<<<<<<<]>>>>[-<<
+<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<
+<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<
+]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>+<<<<<<<<]>>>>
+[-<<<<+>>>>]>>>>[-<<<<+>>>>]<<<<<<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>
+[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<
+<<<<]>>>>[-<<<<+>>>>]>[-<+>]<[-]<[-]<[-]<[-]<<<<<<<<<<<<<<<<<<<<<<<<[-]>
+>>>>>>>>>>>>>>>>>>>>]<<<<]<<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<
+[-]<<<<]<[-]<[-]<[-]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->
+>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]
+[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++[<++++++++>-]<+[-<<<<-
+>>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]>+++++++++[<++++++++++
+>-]<+<----------------------.>.<++++++++++++++++++++++++.--.>+++++++++++
++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[-
+>>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>
+][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>+++++++++++[<++++++>-]<[-<<<<
+->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<+>>+++++++++[<++++++
+++++>-]<+<-----------------------.>.<++++++++++++++++++++++++.-.>+++++++
++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<
+<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>
+>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>+++++++++++[<++++++>-]<+[
+-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<++>>+++++++++[<
+++++++++++>-]<+<------------------------.>.<++++++++++++++++++++++++..>+
++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>
+][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<
+<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[<+++++++
+>-]<--[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<++>>++++
++++++[<++++++++++>-]<+<------------------------.>.<+++++++++++++++++++++
++++.+.>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<
+<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]
+>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>++++++++++[
+<+++++++>-]<-[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++++>-]<+
++>>+++++++++[<++++++++++>-]<+<------------------------.>.<++++++++++++++
+++++++++++.++.>++++++++++++++++++.<[-]>[-]<<<<]<[-]<<<<[->>>>>+<+<<<<]>>
+>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>
++<+<<<<]>>>>>[-<<<<<+>>>>>][-]<<<<[->>>>>+<+<<<<]>>>>>[-<<<<<+>>>>>]>+++
++++++++[<+++++++>-]<[-<<<<->>>>]<<<[-]+<[[-]>-<]>[->>>[-]>+++++++[<+++++
+++>-]<++>>+++++++++[<++++++++++>-]<+<------------------------.>.<+++++++
++++++++++++++++++.+++.>++++++++++++++++++.<[-]>[-]<<<<]<<<<<.>>>[-]<[-]<
+[-]<[-]>+++++[<+++++>-]<++>>+++++++++[<++++++++++>-]<+>>++++++++++[<++++
++++++++>-]<-<<.>.<+++++++++++++++++++++.>>.<<[-]>[-]>[-]<<<[-]<[-]<[-]<[
+-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+<+
+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<
+<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>
+>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[-<
+<<<<<<<<+>>>>>>>>>]>>++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[-<<<<<<<
++>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<<<<[->>>
+>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<<<<->>>>
+->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<<<[->>>>
+>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>>>>[-<<<
+<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>>>>>>>[-
+>>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>>>+<[>-c
+]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-]<<<<<<[
+->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<<<<->>>>
+->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]>>>>[-<<
+<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<<[[-]>>>
+>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>>>[-<<<<
++>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<<<<[-]>>
+>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<
+<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<<]<[-]<[-]<[-]<[-]++++++++++.>>>[-]<[-]<[-]<[-]<<<<<<<<[->>>>>>>>>+
+<+<<<<<<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<
+<<<]>>>>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>
+>>>>>>[-<<<<<<<<<+>>>>>>>>>][-]<<<<<<<<[->>>>>>>>>+<+<<<<<<<<]>>>>>>>>>[
+-<<<<<<<<<+>>>>>>>>>]>>++++++++++++<<<[-<<<+>>>>+<]<<<[->>>+<<<]>>>>>>>[
+-<<<<<<<+>>>>->>>]<<<<<<<[->>>>>>>+<<<<<<<]+>>>>[[-]<<<<->>>>>>>>[-]<<<<
+<<<[->>>>>>>>+<+<<<<<<<]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<[->+<<<<[>>>>-<<<<<
+<<<->>>>->>>>c]>>>>[-<<<<<[-]>>>>>>>>>c]<<<<<]>+<<<<<<<<[>>>>>>>>-<<<<<<
+<<[->>>>>>>+<<<<<<<]>>>>[-<<<<+>>>>]>>>[-<<<+>>>]<<<<<<[->>>>>>+<<<<<<]>
+>>>[-<<<<+>>>>]>>[-<<+>>]<<<<<[->>>>>+<<<<<]>>>>[-<<<<+>>>>]>[-<+>]>c]>>
+>>>>>>[->>>>>>>>c]<<<<<<<<+<<<<[>>>>-<<<<<<[-]>>>>[-<<<<+>>>>]<<<<<[->>>
+>>+<[>-c]>[-<<->>>c]<<-<<<<]>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<[-
+]<<<<<<[->>>>>>>+<+<<<<<<]>>>>>>>[-<<<<<<<+>>>>>>>]<[->>+<<<<[>>>>-<<<<<
+<<<->>>>->>>>c]>>>>[-<<<<<<[-]>>>>>>>>>>c]<<<<<<]>>+<<<<[>>>>-<<<<<<<[-]
+>>>>[-<<<<+>>>>]<[-<<<<+>>>>]>>>>c]>>>>[-<<<[-]>>>>>>>c]<c]<<<<<<<<<]<<<
+<[[-]>>>>>>>[-]<<<<<[->>>>+>+<[>-c]>[-<<+>>>c]<<<<<<]<[->>>>+<<<<]>[-]>>
+>>[-<<<<+>>>>]<<<<<[-]>>>>[-<<<<+>>>>]<<<<<]>>>>>>>[-]<[-]<[-]<[-]<<<<<<
+<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>
+>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<+>>>>>>>>]<<<<<<<<<[-]>>>>>>>>[-<<<<<<<<
++>>>>>>>>]<<<<]
 
@@ -0,0 +1,31 @@
+# ベンチマークのテスト
+
+import unittest
+import bench
+
+
+class TestBench(unittest.TestCase):
+
+    def test_bench_program_1(self):
+        result = bench.bench_program("mandelbrot", 8, 4, sim_steps=1000,
+                                     native=False)
+        self.assertEqual(result["sim_ir_steps"], 1000)
+        self.assertLess(result["commands"], result["program_chars"] + 1)
+        self.assertLess(0, result["c_chars"])
+        self.assertNotIn("run_time", result)
+        self.assertNotIn("bf2c_time", result)
+
+    def test_compare_1(self):
+        base = {"results": [{"program": "a", "columns": 2, "rows": 1,
+                             "sim_ir_ips": 100.0, "c_chars": 10}]}
+        cur = {"results": [{"program": "a", "columns": 2, "rows": 1,
+                            "sim_ir_ips": 80.0, "c_chars": 5},
+                           {"program": "b", "columns": 2, "rows": 1,
+                            "sim_ir_ips": 1.0}]}
+        self.assertEqual(bench.compare(base, cur),
+                         ["a 2x1 sim_ir_ips: 100 -> 80 (-20.0%)"])
+        self.assertEqual(bench.compare(base, cur, 0.25), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# Brainf*ck から C への変換(bf2c.py)のテスト
+
+import unittest
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import bf2c
+import bf_core as c
+import bf_io
+from bf_sim import BfSim
+
+
+@unittest.skipIf(shutil.which("gcc") is None, "gcc is not installed")
+class TestBf2c(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work.cleanup)
+
+    def compile(self, source: str, *options: str) -> str:
+        "bf2c.py で変換して gcc でコンパイルし、実行ファイルのパスを返す"
+        bf_path = os.path.join(self.work.name, "prog.bf")
+        with open(bf_path, "w") as bf_file:
+            bf_file.write(source)
+        bf2c.main([*options, bf_path])
+        exe_path = os.path.join(self.work.name, "prog")
+        subprocess.run(["gcc", "-O2", "-o", exe_path,
+                        os.path.join(self.work.name, "prog.c")], check=True)
+        return exe_path
+
+    def assert_same(self, source: str, data: bytes = b"",
+                    cell_size: int = 1, eof: str = bf_io.EOF_MINUS):
+        "BfSim と同じ出力になることを確認する"
+        options = {1: "-1", 2: "-2", 4: "-4"}[cell_size]
+        eof_option = {bf_io.EOF_ZERO: "-z", bf_io.EOF_MINUS: "-m",
+                      bf_io.EOF_NO_EFFECT: "-n"}[eof]
+        exe_path = self.compile(source, options, eof_option)
+        result = subprocess.run([exe_path], input=data,
+                                stdout=subprocess.PIPE, check=True)
+        out = io.BytesIO()
+        sim = BfSim(source, stdin=io.BytesIO(data), stdout=out, engine="ir",
+                    cell_size=cell_size, eof=eof)
+        sim.run(10000000)
+        self.assertEqual(result.stdout, out.getvalue())
+
+    def test_hello_1(self):
+        self.assert_same("++++++++[>++++++++<-]>+.+.>++++++++++.")
+
+    def test_multi_1(self):
+        source = c.program_of(
+            c.init_value(1, 123), c.copy_data(1, 2, 3),
+            c.exec_pos(2, "."), c.exec_pos(1, "[->+>--<<]>.>."))
+        self.assert_same(source)
+
+    def test_clear_1(self):
+        self.assert_same("+>+>+>+>+<<<<[[-]>]<<<<+.>.>.>.>.>.")
+
+    def test_scan_1(self):
+        self.assert_same(">+>+>+>>+<<<<[>]>+.<<[<]>.")
+
+    def test_cell_size_1(self):
+        self.assert_same("-[->+<]>>-.[+<+>]<.", cell_size=2)
+        self.assert_same("->-[+<+>]<+.", cell_size=4)
+
+    def test_input_1(self):
+        for eof in bf_io.EOF_KINDS:
+            self.assert_same("+>+<,.>,.", data=b"a", eof=eof)
+
+    def test_cat_1(self):
+        exe_path = self.compile(",[.,]", "-z", "-I", "-V", "mycat 1.0")
+        in_path = os.path.join(self.work.name, "in.txt")
+        with open(in_path, "wb") as in_file:
+            in_file.write(b"hello\n")
+        result = subprocess.run([exe_path, in_path],
+                                stdout=subprocess.PIPE, check=True)
+        self.assertEqual(result.stdout, b"hello\n")
+        result = subprocess.run([exe_path, "-h"],
+                                stdout=subprocess.PIPE, check=True)
+        self.assertTrue(result.stdout.startswith(b"mycat 1.0\n"))
+        self.assertIn(b"[ <input-file> ]", result.stdout)
+
+    def test_shrink_1(self):
+        # 1文字1文ではなく、まとめた文にする
+        body = bf2c.translate_body("+" * 100 + ">" * 10 + "-" * 3)
+        self.assertEqual(body, ["  *ptr += 100;", "  ptr[10] -= 3;"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+# バッチ実行のテスト
+
+import unittest
+import os
+import bf_batch as b
+
+VALIDATOR = os.path.join(os.path.dirname(__file__), "..",
+                         "my_number_validator.bf")
+
+
+class TestBfBatch(unittest.TestCase):
+
+    def test_run_job_1(self):
+        result = b.run_job((VALIDATOR, "ok", b"123456789018"))
+        self.assertEqual(result["state"], b.STATE_OK)
+        self.assertEqual(result["output"], "true\n")
+        self.assertLess(0, result["steps"])
+
+    def test_run_job_2(self):
+        result = b.run_job((VALIDATOR, "ng", b"123456789017"), steps=100)
+        self.assertEqual(result["state"], b.STATE_STEP_LIMIT)
+        self.assertEqual(result["steps"], 100)
+
+    def test_run_job_3(self):
+        result = b.run_job(("no_such_file.bf", None, b""))
+        self.assertEqual(result["state"], b.STATE_ERROR)
+        self.assertIn("FileNotFoundError", result["error"])
+
+    def test_run_batch_1(self):
+        jobs = b.make_jobs([VALIDATOR], [
+            ("1", b"123456789018"),
+            ("2", b"123456789017"),
+            ("3", b"12345678901"),
+        ])
+        results = list(b.run_batch(jobs, workers=2))
+        self.assertEqual([r["input"] for r in results], ["1", "2", "3"])
+        self.assertEqual([r["output"] for r in results],
+                         ["true\n", "false\n", "false\n"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,41 @@
 # bfコマンドマクロの基本命令のテスト
 
 import unittest
+import random
+import re
 import bf_core as c
 from bf_sim import BfSim
 
 
+def _delete_useless_replace(statement: str) -> str:
+    "文字列の置換を繰り返す、以前の delete_useless()"
+    while True:
+        for (old, new) in (("<>", ""), ("><", ""), ("+-", ""), ("-+", "")):
+            if old in statement:
+                statement = statement.replace(old, new)
+                break
+        else:
+            if "+[-]" in statement or "-[-]" in statement:
+                statement = re.sub(r'[-+]+\[-\]', "[-]", statement)
+            elif "[-][-]" in statement:
+                statement = statement.replace("[-][-]", "[-]")
+            else:
+                return statement
+
+
+def _delete_useless_all_replace(statement: str) -> str:
+    "以前の delete_useless_all()"
+    statement = _delete_useless_replace(statement)
+    while statement:
+        if statement[-1] in "-+><":
+            statement = re.sub(r'[-+><]+$', "", statement)
+        elif statement.endswith("[-]"):
+            statement = re.sub(r'\[-\]$', "", statement)
+        else:
+            return statement
+    return statement
+
+
 class TestBfCore(unittest.TestCase):
 
     def test_move_data_1(self):
@@ -69,6 +100,43 @@ class TestBfCore(unittest.TestCase):
         sim.run(10000)
         self.assertEqual(sim.memory[1], 255)
 
+    def test_init_value_4(self):
+        # 回り込みを使うと短いか同じ長さになり、値は同じになる
+        for value in range(-255, 256):
+            for wrap in (False, True):
+                source = c.init_value(1, value, wrap)
+                sim = BfSim(source)
+                sim.run(10000)
+                self.assertEqual(sim.memory[1], value & 0xff, value)
+                self.assertEqual(sim.memory[2], 0, value)
+            self.assertLessEqual(len(c.init_value(1, value, wrap=True)),
+                                 len(c.init_value(1, value)), value)
+
+    def test_divmod_data_1(self):
+        for value in (0, 1, 15, 16, 17, 200, 255):
+            source = c.divmod_data(1, 16)
+            sim = BfSim(source)
+            sim.memory[1] = value
+            sim.memory[4] = 3
+            sim.run(10000)
+            self.assertEqual(list(sim.memory[1:7]),
+                             [0, 0, value % 16, 3 + value // 16, 0, 0])
+
+    def test_divmod_large_1(self):
+        for cell_size in (1, 2):
+            for value in (0, 1, 15, 16, 17, 200, 255, 256, 4095, 65535):
+                if cell_size == 1 and 256 <= value:
+                    continue
+                source = c.divmod_large(1, 16)
+                sim = BfSim(source, cell_size=cell_size)
+                sim.memory[1] = value
+                sim.memory[9] = 3
+                while not sim.is_stopped():
+                    sim.run(100000)
+                self.assertEqual(
+                    list(sim.memory[1:10]),
+                    [0, 0, value % 16, value // 16, 0, 0, 0, 0, 3])
+
     def test_if_nz_then_1(self):
         source = c.if_nz_then(1, c.inc_pos(3))
         sim = BfSim(source)
@@ -256,6 +324,51 @@ class TestBfCore(unittest.TestCase):
         self.assertEqual(sim.memory[4], 39)
         self.assertEqual(sim.memory[5], 16)
 
+    def test_delete_useless_1(self):
+        # 文字列の置換を繰り返す方法と同じ結果になる
+        rand = random.Random(1)
+        for _ in range(20000):
+            statement = "".join(rand.choice("<>+-[-]x\n")
+                                for _ in range(rand.randrange(30)))
+            expected = _delete_useless_replace(statement)
+            self.assertEqual(c.delete_useless(statement), expected,
+                             statement)
+            self.assertEqual(c._delete_useless_stack(statement), expected,
+                             statement)
+            self.assertEqual(c.delete_useless_all(statement),
+                             _delete_useless_all_replace(statement),
+                             statement)
+
+    def test_fragment_1(self):
+        # 断片で組み立てても、文字列で組み立てた場合と同じ結果になる
+        rand = random.Random(1)
+        for _ in range(2000):
+            (text, fragment) = ("", c.fragment_of())
+            for _ in range(rand.randrange(1, 8)):
+                leaf = "".join(rand.choice("<>+-[-]")
+                               for _ in range(rand.randrange(10)))
+                pos = rand.randrange(-3, 4)
+                kind = rand.randrange(3)
+                if kind == 0:
+                    (text, fragment) = (c.block_of(text, leaf),
+                                        c.block_of(fragment, leaf))
+                elif kind == 1:
+                    (text, fragment) = (c.exec_pos(pos, text + leaf),
+                                        c.exec_pos(pos, fragment + leaf))
+                else:
+                    (text, fragment) = (c.for_loop(pos, leaf, text),
+                                        c.for_loop(pos, leaf, fragment))
+            self.assertIsInstance(fragment, c.Fragment)
+            self.assertEqual(str(fragment), text)
+            self.assertEqual(c.program_of(fragment), c.program_of(text))
+
+    def test_fragment_2(self):
+        # 深い入れ子でも再帰せずに展開できる
+        fragment = c.fragment_of("+")
+        for _ in range(10000):
+            fragment = c.exec_pos(1, fragment)
+        self.assertEqual(str(fragment), ">" * 10000 + "+" + "<" * 10000)
+
 
 if __name__ == '__main__':
     unittest.main()
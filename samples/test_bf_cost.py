@@ -0,0 +1,83 @@
+# 静的なコスト見積もり(bf_cost.py)のテスト
+
+import unittest
+import io
+import random
+import re
+import bf_core as c
+import bf_stack as s
+from bf_cost import Expr, cheapest, estimate
+from bf_sim import BfSim
+
+
+def _steps(code: str, values: dict) -> int:
+    "実行したコマンドの数(コマンド以外の文字は数えない)"
+    code = re.sub(r"[^-+<>\[\].,]", "", code)
+    sim = BfSim(code, size=128, stdout=io.BytesIO())
+    for (pos, value) in values.items():
+        sim.poke(64 + pos, value)
+    sim.pointer = 64
+    steps = 0
+    while not sim.is_stopped():
+        steps += sim.run(100000)
+    return steps
+
+
+class TestBfCost(unittest.TestCase):
+
+    def assert_bounds(self, code: str, inputs: dict, high: int = 255):
+        "実際のステップ数が最良/最悪の範囲に入る"
+        cost = estimate(code, inputs,
+                        {name: (0, high) for name in inputs.values()})
+        rand = random.Random(1)
+        for _ in range(10):
+            values = {pos: rand.randint(0, high) for pos in inputs}
+            steps = _steps(code, values)
+            self.assertLessEqual(cost.best, steps, values)
+            self.assertLessEqual(steps, cost.worst, values)
+        return cost
+
+    def test_expr_1(self):
+        a = Expr.var("a")
+        self.assertEqual(str(a * a - a * 2 + 1), "a*a - 2*a + 1")
+        self.assertEqual((a - a) * 3, 0)
+        self.assertEqual((a * 3 + 1).substitute("a", 2), 7)
+
+    def test_estimate_1(self):
+        # 分岐のないコードは期待値が実際のステップ数になる
+        code = c.copy_data(1, 2, 3)
+        cost = self.assert_bounds(code, {1: "a"})
+        for value in (0, 1, 200):
+            self.assertEqual(cost.expected.evaluate({"a": value}),
+                             _steps(code, {1: value}))
+
+    def test_estimate_2(self):
+        # 乗算は a*b に比例する
+        cost = self.assert_bounds(c.multi_data_tricky(1, 2, 5, 2),
+                                  {1: "a", 2: "b"}, high=15)
+        self.assertIn(("a", "b"), cost.expected.terms)
+
+    def test_estimate_3(self):
+        # 分岐
+        cost = self.assert_bounds(c.if_nz_tricky(1, 2, 2, "+++"), {1: "a"})
+        self.assertEqual((cost.best, cost.worst), (19, 28))
+        self.assertTrue(cost.expected.is_const())
+
+    def test_estimate_4(self):
+        self.assert_bounds(s.add_byte(), {-4: "a", -8: "b"})
+        self.assert_bounds(s.dup(1), {-8: "a", -7: "b", -6: "c", -5: "d"})
+
+    def test_estimate_5(self):
+        with self.assertRaisesRegex(ValueError, "unmatched"):
+            estimate("[-")
+        with self.assertRaisesRegex(ValueError, "unmatched"):
+            estimate("-]")
+
+    def test_cheapest_1(self):
+        codes = [c.init_value(0, 200), c.init_value(0, 200, wrap=True)]
+        self.assertEqual(cheapest(codes, key="size"), codes[1])
+        self.assertEqual(estimate(codes[1]).worst, _steps(codes[1], {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
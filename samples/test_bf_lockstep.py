@@ -0,0 +1,78 @@
+# 複数のメモリの状態で同時に実行するシミュレータのテスト
+
+import unittest
+import io
+import bf_core as c
+import bf_io
+import bf_lockstep
+from bf_sim import BfSim
+
+
+@unittest.skipIf(bf_lockstep.np is None, "numpy is not installed")
+class TestBfLockstep(unittest.TestCase):
+
+    def run_sim(self, source: str, memory: dict, size: int) -> BfSim:
+        sim = BfSim(source, size=size)
+        for (pos, value) in memory.items():
+            sim.poke(pos, value)
+        sim.run(100000)
+        return sim
+
+    def test_copy_data_1(self):
+        source = c.copy_data(1, 2, 3)
+        memories = [{1: value} for value in range(256)]
+        tapes = bf_lockstep.run_lockstep(source, memories, size=8)
+        for (value, tape) in zip(range(256), tapes):
+            self.assertEqual(list(tape[1:4]), [value, value, 0])
+
+    def test_inc_data_tricky_1(self):
+        # 繰り上がりの有無でレーンごとに分岐する
+        source = c.inc_data_tricky(3, 2)
+        memories = [{2: high, 3: low}
+                    for high in (0, 1, 255) for low in (0, 10, 255)]
+        tapes = bf_lockstep.run_lockstep(source, memories, size=8)
+        for (memory, tape) in zip(memories, tapes):
+            expected = self.run_sim(source, memory, 8).memory
+            self.assertEqual(tape, expected)
+
+    def test_loop_1(self):
+        # ループの回数が違うレーンも、最後は同じ状態になる
+        source = ">[->+<.]>>+[<]<."
+        sim = bf_lockstep.BfLockstep(source, 4, size=8)
+        for lane in range(4):
+            sim.memory[lane, 1] = lane * 3
+        sim.run(100000)
+        self.assertTrue(sim.is_stopped())
+        for lane in range(4):
+            expected = BfSim(source, size=8, stdout=io.BytesIO())
+            expected.memory[1] = lane * 3
+            expected.run(100000)
+            self.assertEqual(sim.memory_of(lane), expected.memory)
+            self.assertEqual(int(sim.pointers[lane]), expected.pointer)
+            self.assertEqual(bytes(sim.outputs[lane]),
+                             expected.stdout.getvalue())
+
+    def test_cell_size_1(self):
+        sim = bf_lockstep.BfLockstep("-[->+<]>>-", 2, size=4, cell_size=2)
+        sim.memory[1, 0] = 3
+        sim.run(100000)
+        self.assertEqual(list(sim.memory_of(0)), [0, 0xffff, 0xffff, 0])
+        self.assertEqual(list(sim.memory_of(1)), [0, 2, 0xffff, 0])
+
+    def test_input_1(self):
+        sim = bf_lockstep.BfLockstep(",>,", 3, size=4,
+                                     inputs=[b"ab", b"c", b""],
+                                     eof=bf_io.EOF_ZERO)
+        sim.run(100000)
+        self.assertEqual(sim.memory[:, :2].tolist(),
+                         [[ord("a"), ord("b")], [ord("c"), 0], [0, 0]])
+
+    def test_pointer_1(self):
+        sim = bf_lockstep.BfLockstep("[<]", 2, size=4)
+        sim.memory[1, 0] = 1
+        with self.assertRaisesRegex(ValueError, "lane=1, pointer=-1"):
+            sim.run(100000)
+
+
+if __name__ == '__main__':
+    unittest.main()
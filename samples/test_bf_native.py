@@ -0,0 +1,101 @@
+# C に変換して実行するエンジンのテスト
+
+import unittest
+import io
+import os
+import shutil
+import tempfile
+import bf_core as c
+import bf_io
+import bf_native
+from bf_sim import BfSim
+
+
+@unittest.skipIf(shutil.which(bf_native.CC) is None, "gcc is not installed")
+class TestBfNative(unittest.TestCase):
+
+    def setUp(self):
+        # 共有ライブラリは一時ディレクトリに作る
+        work = tempfile.TemporaryDirectory()
+        self.addCleanup(work.cleanup)
+        self.cache_dir = work.name
+
+    def run_both(self, source: str, memory: dict, cell_size: int = 1,
+                 data: bytes = b"", eof: str = bf_io.EOF_MINUS) -> BfSim:
+        "ir と native で実行し、結果が同じであることを確認する"
+        sims = []
+        for engine in ("ir", "native"):
+            out = io.BytesIO()
+            sim = BfSim(source, size=64, stdin=io.BytesIO(data), stdout=out,
+                        engine=engine, cell_size=cell_size, eof=eof)
+            sim.cache_dir = self.cache_dir
+            for (pos, value) in memory.items():
+                sim.poke(pos, value)
+            while not sim.is_stopped():
+                sim.run(10000)
+            sims.append((sim, out.getvalue()))
+        ((ir_sim, ir_out), (sim, native_out)) = sims
+        self.assertEqual(list(sim.memory), list(ir_sim.memory))
+        self.assertEqual(sim.pointer, ir_sim.pointer)
+        self.assertEqual(native_out, ir_out)
+        return sim
+
+    def test_native_1(self):
+        sim = self.run_both(c.copy_data(1, 2, 3), {1: 7})
+        self.assertEqual(list(sim.memory[1:3]), [7, 7])
+
+    def test_native_2(self):
+        self.run_both(">+>+>+>>+<<<<[>]>+<<[<]>[+>--<]>[-]<-", {})
+
+    def test_native_3(self):
+        self.run_both("++++++++[>++++++++<-]>+.+.\n+.[-]-.", {})
+
+    def test_cell_size_1(self):
+        sim = self.run_both("-[->+<]>>-[+<+>]", {}, cell_size=2)
+        self.assertEqual(sim.memory[1], 0)
+        sim = self.run_both(">-[+<+>]<+.", {}, cell_size=4)
+        self.assertEqual(sim.memory[0], 2)
+
+    def test_input_1(self):
+        for eof in bf_io.EOF_KINDS:
+            self.run_both("+>+>+<<,>,>,", {}, data=b"a", eof=eof)
+
+    def test_pointer_1(self):
+        sim = BfSim("+[>+]", size=16, engine="native")
+        sim.cache_dir = self.cache_dir
+        with self.assertRaisesRegex(ValueError, "pointer=16"):
+            sim.run(10000)
+        sim = BfSim("+[<+>-]", engine="native")
+        sim.cache_dir = self.cache_dir
+        with self.assertRaisesRegex(ValueError, "pointer=-1"):
+            sim.run(10000)
+
+    def test_cache_1(self):
+        sim = BfSim("+++[>+++<-]>+++", engine="native")
+        sim.cache_dir = self.cache_dir
+        sim.run(10000)
+        self.assertEqual(sim.memory[1], 12)
+        key = bf_native.cache_key(sim.source, 1, bf_io.EOF_MINUS)
+        self.assertEqual(os.listdir(self.cache_dir), [f"{key}.so"])
+
+    def test_cache_2(self):
+        # 他から書き込めるディレクトリの共有ライブラリは読み込まない
+        os.chmod(self.cache_dir, 0o777)
+        with self.assertRaises(PermissionError):
+            bf_native.load_function("+-+", cache_dir=self.cache_dir)
+
+    def test_default_cache_dir_1(self):
+        saved = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = self.cache_dir
+        try:
+            self.assertEqual(bf_native.default_cache_dir(),
+                             os.path.join(self.cache_dir, "bf_native"))
+        finally:
+            if saved is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = saved
+
+
+if __name__ == '__main__':
+    unittest.main()
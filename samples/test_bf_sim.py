@@ -0,0 +1,435 @@
+# Brainf*ck シミュレータのテスト
+
+import unittest
+import asyncio
+import io
+import os
+import tempfile
+import bf_core as c
+import bf_io
+import bf_profile
+import bf_pygen
+from bf_sim import BfSim, PAGE_SIZE
+
+
+class _Writer:
+    "asyncio.StreamWriter の代わり"
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+class TestBfSim(unittest.TestCase):
+
+    def test_loop_1(self):
+        sim = BfSim("+++[>++<-]>")
+        while not sim.is_stopped():
+            sim.run(10000)
+        self.assertEqual(sim.memory[0], 0)
+        self.assertEqual(sim.memory[1], 6)
+        self.assertEqual(sim.pointer, 1)
+
+    def test_loop_2(self):
+        sim = BfSim("[>+<]>+")
+        while not sim.is_stopped():
+            sim.run(10000)
+        self.assertEqual(sim.memory[1], 1)
+
+    def test_loop_nest_1(self):
+        sim = BfSim("++[>+++[>+<-]<-]")
+        while not sim.is_stopped():
+            sim.run(10000)
+        self.assertEqual(sim.memory[2], 6)
+
+    def test_linenumber_1(self):
+        sim = BfSim("+\n[-\n]\n+")
+        sim.run(3)
+        self.assertEqual(sim.index, 3)
+        self.assertEqual(sim.linenumber, 2)
+        self.assertEqual(sim.columnnumber, 2)
+        sim.run(4)
+        self.assertEqual(sim.index, 7)
+        self.assertEqual(sim.linenumber, 4)
+        self.assertEqual(sim.columnnumber, 1)
+
+    def test_linenumber_2(self):
+        sim = BfSim("++[\n-]")
+        sim.run(6)
+        self.assertEqual(sim.index, 3)
+        self.assertEqual(sim.linenumber, 1)
+        self.assertEqual(sim.columnnumber, 4)
+
+    def test_position_of_1(self):
+        sim = BfSim("+\n\n+-\n")
+        self.assertEqual(sim.position_of(0), (1, 1))
+        self.assertEqual(sim.position_of(1), (1, 2))
+        self.assertEqual(sim.position_of(2), (2, 1))
+        self.assertEqual(sim.position_of(4), (3, 2))
+        self.assertEqual(sim.position_of(6), (4, 1))
+
+    def test_unmatched_1(self):
+        with self.assertRaisesRegex(ValueError, "line=2, column=2"):
+            BfSim("+\n+[[-]")
+
+    def test_unmatched_2(self):
+        sim = BfSim("+")
+        with self.assertRaisesRegex(ValueError, "line=1, column=4"):
+            sim.set_source("[-]]")
+
+    def run_both(self, source: str, memory: dict,
+                 cell_size: int = 1) -> BfSim:
+        "全てのエンジンで実行し、結果が同じであることを確認する"
+        sims = []
+        for engine in ("step", "ir", "py"):
+            out = io.StringIO()
+            sim = BfSim(source, stdout=out, engine=engine, cell_size=cell_size)
+            for (pos, value) in memory.items():
+                sim.poke(pos, value)
+            while not sim.is_stopped():
+                sim.run(10000)
+            sims.append((sim, out.getvalue()))
+        (step_sim, step_out) = sims[0]
+        for (sim, output) in sims[1:]:
+            self.assertEqual(sim.memory, step_sim.memory)
+            self.assertEqual(sim.pointer, step_sim.pointer)
+            self.assertEqual(sim.index, step_sim.index)
+            self.assertEqual(output, step_out)
+        return sims[1][0]
+
+    def test_ir_multi_1(self):
+        sim = self.run_both(c.copy_data(1, 2, 3), {1: 7})
+        self.assertEqual(sim.memory[1], 7)
+        self.assertEqual(sim.memory[2], 7)
+
+    def test_ir_multi_2(self):
+        sim = self.run_both(">[+>--<]", {1: 250})
+        self.assertEqual(sim.memory[1], 0)
+        self.assertEqual(sim.memory[2], 244)
+
+    def test_ir_clear_1(self):
+        sim = self.run_both(">[-]>[+]>[-]", {1: 5, 2: 3})
+        self.assertEqual(list(sim.memory[1:3]), [0, 0])
+
+    def test_ir_scan_1(self):
+        sim = self.run_both(">+>+>+>>+<<<<[>]>+<<[<]", {})
+        self.assertEqual(sim.pointer, 0)
+        self.assertEqual(sim.memory[5], 2)
+
+    def test_ir_scan_2(self):
+        sim = self.run_both(">>+>>+>>+[<<]", {}, cell_size=2)
+        self.assertEqual(sim.pointer, 0)
+
+    def test_cell_size_1(self):
+        sim = self.run_both("-[->+<]>>-", {}, cell_size=2)
+        self.assertEqual(sim.memory[1], 0xffff)
+        self.assertEqual(sim.memory[2], 0xffff)
+
+    def test_cell_size_2(self):
+        sim = self.run_both(">-[+<+>]<+", {}, cell_size=4)
+        self.assertEqual(sim.memory[0], 2)
+
+    def test_cell_size_3(self):
+        sim = BfSim(",.", stdin=io.BytesIO(b""), stdout=io.BytesIO(),
+                    cell_size=4)
+        sim.run(10000)
+        self.assertEqual(sim.memory[0], 0xffffffff)
+        self.assertEqual(sim.stdout.getvalue(), b"\xff")
+
+    def test_ir_output_1(self):
+        self.run_both("++++++++[>++++++++<-]>+.+.\n+c.", {})
+
+    def test_ir_steps_1(self):
+        sim = BfSim("+++>>[-]<<[-]", engine="ir")
+        self.assertEqual(sim.run(2), 2)
+        self.assertEqual(sim.index, 5)
+        self.assertEqual(sim.pointer, 2)
+        self.assertEqual(sim.run(10), 3)
+        self.assertTrue(sim.is_stopped())
+
+    def test_ir_resume_1(self):
+        sim = BfSim("+++[->++<]", engine="ir")
+        sim.step()
+        sim.run(10000)
+        self.assertEqual(sim.memory[1], 6)
+
+    def test_ir_pointer_1(self):
+        sim = BfSim("+[<+>-]", engine="ir")
+        with self.assertRaisesRegex(ValueError, "pointer=-1"):
+            sim.run(10000)
+
+    def test_grow_1(self):
+        # 確保済みのページを超えたら、メモリを伸ばす
+        source = ">" * (PAGE_SIZE + 10) + "+++[->+<]>"
+        sim = self.run_both(source, {})
+        self.assertEqual(len(sim.memory), 2 * PAGE_SIZE)
+        self.assertEqual(sim.memory[PAGE_SIZE + 11], 3)
+        self.assertEqual(sim.peek(3 * PAGE_SIZE), 0)
+
+    def test_grow_2(self):
+        # 未確保のセルは 0 とみなして検索する
+        sim = self.run_both("[>]+", {pos: 1 for pos in range(PAGE_SIZE)})
+        self.assertEqual(sim.pointer, PAGE_SIZE)
+        self.assertEqual(sim.memory[PAGE_SIZE], 1)
+
+    def test_grow_3(self):
+        for engine in ("step", "ir", "py"):
+            sim = BfSim(">>>>>+", size=5, engine=engine)
+            with self.assertRaisesRegex(ValueError, "pointer=5"):
+                sim.run(10000)
+
+    def test_poke_1(self):
+        sim = BfSim(".", engine="step")
+        sim.poke(PAGE_SIZE + 1, 257)
+        self.assertEqual(len(sim.memory), 2 * PAGE_SIZE)
+        self.assertEqual(sim.peek(PAGE_SIZE + 1), 1)
+        with self.assertRaisesRegex(ValueError, "pointer="):
+            sim.poke(sim.size, 1)
+
+    def test_reset_1(self):
+        sim = BfSim(">" * (2 * PAGE_SIZE) + "+", engine="ir")
+        sim.run(10000)
+        sim.reset()
+        # ポインタは変わらないので、ポインタのあるページまでは確保したまま
+        self.assertEqual(len(sim.memory), 3 * PAGE_SIZE)
+        self.assertEqual(max(sim.memory), 0)
+        self.assertEqual(sim.index, 0)
+        self.assertEqual(sim.pointer, 2 * PAGE_SIZE)
+        sim.set_source("-")
+        sim.run(10000)
+        self.assertEqual(sim.peek(2 * PAGE_SIZE), 255)
+
+    def test_py_nest_1(self):
+        # ネストが深いループは別の関数に分けて変換する
+        depth = bf_pygen.MAX_DEPTH + 4
+        source = "+>" * depth + "<" * depth + "[->" * depth + "]" * depth
+        self.run_both(source, {})
+
+    def test_py_cache_1(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            source = "++[>+++<-]>."
+            code = bf_pygen.load_code(source, cache_dir=cache_dir)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            bf_pygen._cache.clear()
+            self.assertEqual(
+                bf_pygen.load_code(source, cache_dir=cache_dir), code)
+            self.assertIs(bf_pygen.load_code(source), bf_pygen._cache[
+                bf_pygen.cache_key(source)])
+
+    def test_py_cache_2(self):
+        # 他から書き込めるディレクトリのキャッシュは読み込まない
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.chmod(cache_dir, 0o777)
+            with self.assertRaises(PermissionError):
+                bf_pygen.load_code("+-+-", cache_dir=cache_dir)
+
+    def test_py_resume_1(self):
+        # 途中から実行する場合は ir エンジンで続きを実行する
+        sim = BfSim("+++[->++<]", engine="py")
+        sim.step()
+        self.assertEqual(sim.run(10000), 3)
+        self.assertEqual(sim.memory[1], 6)
+
+    def test_breakpoint_1(self):
+        for engine in ("step", "ir", "py"):
+            sim = BfSim("+++[>+<-]>.", engine=engine, stdout=io.StringIO())
+            sim.breakpoints.add(10)
+            sim.run(10000)
+            self.assertEqual(sim.index, 10)
+            self.assertEqual(sim.stop_reason, "breakpoint")
+            self.assertEqual(sim.memory[1], 3)
+            sim.run(10000)
+            self.assertTrue(sim.is_stopped())
+            self.assertIsNone(sim.stop_reason)
+
+    def test_breakpoint_2(self):
+        # まとめて実行する命令([-] や [->+<])の途中でも止まる
+        for engine in ("step", "ir", "py"):
+            sim = BfSim("+++>[-]<[->+<]", engine=engine)
+            sim.breakpoints.update((2, 10))
+            stops = []
+            while not sim.is_stopped():
+                sim.run(10000)
+                if sim.stop_reason is not None:
+                    stops.append(sim.index)
+            self.assertEqual(stops, [2, 10, 10, 10], engine)
+
+    def test_watchpoint_1(self):
+        # step は1文字ずつ、ir は [->>+<<] をまとめて実行する
+        for (engine, value) in (("step", 2), ("ir", 4), ("py", 4)):
+            sim = BfSim("+++>++>+<<[->>+<<]", engine=engine)
+            sim.watchpoints.add(2)
+            sim.run(10000)
+            self.assertEqual(sim.stop_reason, "watchpoint")
+            self.assertEqual(sim.memory[2], 1)
+            sim.run(10000)
+            self.assertEqual(sim.stop_reason, "watchpoint")
+            self.assertEqual(sim.memory[2], value)
+
+    def test_pointer_range_1(self):
+        sim = BfSim("+[>+]", engine="ir")
+        sim.pointer_range = (0, 5)
+        sim.run(10000)
+        self.assertEqual(sim.stop_reason, "pointer")
+        self.assertEqual(sim.pointer, 5)
+
+    def test_profiler_1(self):
+        sim = BfSim("+++[>++[>+<-]<-]\n>>[-]", engine="ir")
+        sim.profiler = bf_profile.BfProfiler()
+        while not sim.is_stopped():
+            sim.run(10)
+        (outer, inner, clear) = sim.profiler.hot_loops()
+        self.assertEqual((outer.index, outer.entries, outer.iterations),
+                         (3, 1, 3))
+        self.assertEqual((inner.index, inner.entries, inner.iterations),
+                         (7, 3, 6))
+        self.assertEqual(inner.steps, 3 * (1 + 2 * 5))
+        self.assertEqual(outer.steps, 1 + 3 * 6 + inner.steps)
+        self.assertEqual(sim.profiler.steps, 3 + outer.steps + 2 + clear.steps)
+        self.assertEqual((clear.iterations, clear.steps), (6, 6 * 2 + 1))
+        report = sim.profiler.report(sim)
+        self.assertIn("2:3", report)
+        self.assertIn("1:4", report)
+
+    def test_checkpoint_1(self):
+        source = ",[>+++[>++<-]<.-]" + c.copy_data(1, 4, 5)
+        expected = BfSim(source, stdin=io.BytesIO(b"\x05"),
+                         stdout=io.BytesIO(), cell_size=2)
+        expected.run(10000)
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "sim.ckpt")
+            sim = BfSim(source, stdin=io.BytesIO(b"\x05"),
+                        stdout=io.BytesIO(), cell_size=2, engine="ir")
+            sim.run(7)
+            sim.save_checkpoint(path)
+            (index, pointer) = (sim.index, sim.pointer)
+            sim.run(3)
+            resumed = BfSim(source, stdin=io.BytesIO(b"\x05"),
+                            stdout=sim.stdout, cell_size=2, engine="ir")
+            resumed.load_checkpoint(path)
+            self.assertEqual(resumed.index, index)
+            self.assertEqual(resumed.pointer, pointer)
+            while not resumed.is_stopped():
+                resumed.run(10000)
+        self.assertEqual(resumed.memory, expected.memory)
+        self.assertEqual(resumed.pointer, expected.pointer)
+        self.assertEqual(resumed.stdout.getvalue(),
+                         expected.stdout.getvalue())
+
+    def test_checkpoint_2(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "sim.ckpt")
+            BfSim("+++").save_checkpoint(path)
+            with self.assertRaisesRegex(ValueError, "source code"):
+                BfSim("++-").load_checkpoint(path)
+            with self.assertRaisesRegex(ValueError, "cell_size"):
+                BfSim("+++", cell_size=4).load_checkpoint(path)
+
+    def test_get_char_1(self):
+        sim = BfSim(",>,>,", stdin=io.BytesIO(b"ab"), eof=bf_io.EOF_MINUS)
+        sim.run(10000)
+        self.assertEqual(list(sim.memory[0:3]), [ord("a"), ord("b"), 255])
+
+    def test_get_char_2(self):
+        sim = BfSim(",>,>,", stdin=io.StringIO("ab"), eof=bf_io.EOF_ZERO)
+        sim.memory[2] = 7
+        sim.run(10000)
+        self.assertEqual(list(sim.memory[0:3]), [ord("a"), ord("b"), 0])
+
+    def test_get_char_3(self):
+        sim = BfSim(",>,>,", stdin=io.BytesIO(b"ab"),
+                    eof=bf_io.EOF_NO_EFFECT)
+        sim.memory[2] = 7
+        sim.run(10000)
+        self.assertEqual(list(sim.memory[0:3]), [ord("a"), ord("b"), 7])
+
+    def test_put_char_1(self):
+        out = io.BytesIO()
+        sim = BfSim("-.", stdout=out)
+        sim.run(10000)
+        self.assertEqual(out.getvalue(), b"\xff")
+
+    def test_flush_1(self):
+        out = io.StringIO()
+        sim = BfSim("+.+.++++++++.+.", stdout=out, flush=bf_io.FLUSH_NEWLINE)
+        sim._run(3)
+        self.assertEqual(out.getvalue(), "")
+        sim._run(10)
+        self.assertEqual(out.getvalue(), "\x01\x02\n")
+        sim.run(10000)
+        self.assertEqual(out.getvalue(), "\x01\x02\n\x0b")
+
+    def test_flush_2(self):
+        out = io.StringIO()
+        sim = BfSim("+.+.+.", stdout=out, flush=2)
+        sim._run(4)
+        self.assertEqual(out.getvalue(), "\x01\x02")
+
+    def test_run_async_1(self):
+        async def session(engine: str) -> bytes:
+            reader = asyncio.StreamReader()
+            writer = _Writer()
+            sim = BfSim(",[.,]", engine=engine, eof=bf_io.EOF_ZERO)
+            task = asyncio.ensure_future(sim.run_async(reader, writer))
+            reader.feed_data(b"ab")
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # 入力待ちの間も、それまでの出力は書き込まれている
+            self.assertFalse(task.done())
+            self.assertEqual(writer.data, b"ab")
+            reader.feed_data(b"c")
+            reader.feed_eof()
+            await task
+            return bytes(writer.data)
+
+        for engine in ("step", "ir", "py"):
+            self.assertEqual(asyncio.run(session(engine)), b"abc")
+
+    def test_run_async_2(self):
+        # 入力待ちのシミュレータがあっても、他のシミュレータは動く
+        async def sessions():
+            reader = asyncio.StreamReader()
+            waiting = BfSim(",.", engine="ir")
+            task = asyncio.ensure_future(waiting.run_async(reader, _Writer()))
+            out = io.BytesIO()
+            sim = BfSim("+++[>+++<-]>.", stdout=out, engine="ir")
+            await sim.run_async(yield_steps=1)
+            self.assertEqual(out.getvalue(), b"\x09")
+            self.assertFalse(task.done())
+            reader.feed_eof()
+            await task
+
+        asyncio.run(sessions())
+
+    def test_run_async_3(self):
+        # 出力だけを非同期にした場合も、py / native を使わずに途中で他に譲る
+        async def session(engine: str) -> int:
+            count = 0
+            finished = False
+
+            async def counter():
+                nonlocal count
+                while not finished:
+                    count += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(counter())
+            writer = _Writer()
+            sim = BfSim("++++++++[>++++++++[>+.<-]<-]", engine=engine)
+            await sim.run_async(writer=writer, yield_steps=10)
+            finished = True
+            await task
+            self.assertEqual(len(writer.data), 64)
+            return count
+
+        for engine in ("ir", "py", "native"):
+            self.assertLess(10, asyncio.run(session(engine)), engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -423,6 +423,29 @@ class TestMandelbrot(unittest.TestCase):
         self.assertAlmostEqual(self.getFloat(sim, 8), 0.0)
         self.assertEqual(sim.pointer, 4)
 
+    def test_multi_decimal_2(self):
+        # 4bit単位の筆算も同じ結果になる
+        for (a, b) in [(2.0, -4.25), (0.0, 3.5), (-1.5, -1.5), (0.5, 1 / 256),
+                       (0.75, -0.3), (31.0, 17.0), (-16.5, 1.0)]:
+            results = []
+            for method in s.MULTI_METHODS:
+                source = c.block_of(
+                    s.push_decimal(a),
+                    s.push_decimal(b),
+                    s.multi_decimal(method)
+                )
+                sim = BfSim(source, size=256)
+                while not sim.is_stopped():
+                    sim.run(1000000)
+                self.assertEqual(sim.pointer, 4)
+                self.assertEqual(list(sim.memory[4:]), [0] * 252)
+                results.append(self.getFloat(sim, 0))
+            self.assertEqual(results[0], results[1], (a, b))
+
+    def test_multi_decimal_3(self):
+        with self.assertRaisesRegex(ValueError, "unknown method"):
+            s.multi_decimal("karatsuba")
+
     def test_if_lt_decimal_1(self):
         source = c.block_of(
             s.push_decimal(2.0),
@@ -584,6 +607,134 @@ class TestMandelbrot(unittest.TestCase):
         self.assertAlmostEqual(self.getFloat(sim, 4), 0.0)
         self.assertEqual(sim.pointer, 0)
 
+    def test_put_str_1(self):
+        for message in ["", "A", "Hello, World!\n", "\x1b[31m", "\x1b[0m",
+                        "0123456789", "zzzz"]:
+            out = io.StringIO()
+            sim = BfSim(s.put_str(message), stdout=out)
+            while not sim.is_stopped():
+                sim.run(10000)
+            self.assertEqual(out.getvalue(), message)
+            # 使ったセルはクリアされている
+            self.assertEqual(list(sim.memory[:16]), [0] * 16)
+            self.assertEqual(sim.pointer, 0)
+
+    def test_put_str_2(self):
+        # 前の文字からの差分を使うので、1文字ずつ作るより短い
+        message = "0123456789"
+        single = "".join(c.init_value(0, ord(ch)) + ".[-]" for ch in message)
+        self.assertLess(len(s.put_str(message)), len(single) // 4)
+
+    def test_macro_cache_1(self):
+        cache = s.MacroCache()
+        self.assertEqual(cache.get(("a",), lambda: "+"), "+")
+        self.assertEqual(cache.get(("a",), lambda: "-"), "+")
+        self.assertEqual(cache.info(), s.CacheInfo(1, 1, 1, 1))
+        cache.enabled = False
+        self.assertEqual(cache.get(("a",), lambda: "-"), "-")
+        cache.clear()
+        self.assertEqual(cache.info(), s.CacheInfo(0, 0, 0, 0))
+
+    def test_macro_cache_2(self):
+        # 文字数の上限を超えたら古いものから捨てる
+        cache = s.MacroCache(max_chars=4)
+        cache.get(("a",), lambda: "++")
+        cache.get(("b",), lambda: "--")
+        cache.get(("a",), lambda: "")
+        cache.get(("c",), lambda: ">>")
+        cache.get(("d",), lambda: "<<<<<")
+        self.assertEqual(cache.info(), s.CacheInfo(1, 4, 2, 4))
+        self.assertEqual(cache.get(("a",), lambda: ""), "++")
+        self.assertEqual(cache.get(("b",), lambda: ""), "")
+
+    def test_macro_cache_3(self):
+        # キャッシュの有無で結果は変わらない
+        s.macro_cache.enabled = False
+        self.addCleanup(setattr, s.macro_cache, "enabled", True)
+        expected = [s.add_decimal(), s.dup(3), s.push_decimal(-1.5)]
+        s.macro_cache.enabled = True
+        for _ in range(2):
+            self.assertEqual(
+                [s.add_decimal(), s.dup(3), s.push_decimal(-1.5)], expected)
+
+    def test_macro_cache_4(self):
+        # キーワード引数や既定値を渡しても、同じエントリを使う
+        expected = s.multi_decimal()
+        misses = s.macro_cache.info().misses
+        self.assertEqual(s.multi_decimal(s.MULTI_ADD), expected)
+        self.assertEqual(s.multi_decimal(method=s.MULTI_ADD), expected)
+        self.assertEqual(s.macro_cache.info().misses, misses)
+        self.assertNotEqual(s.multi_decimal(method=s.MULTI_NIBBLE), expected)
+
+    def getWide(self, sim: BfSim, pos: int) -> float:
+        "PROFILE_WIDE の固定小数点小数 {0, 絶対値 x 256, 0, 符号}"
+        self.assertEqual(sim.memory[pos + s.IDX_DMY], 0)
+        self.assertEqual(sim.memory[pos + s.IDX_DEC], 0)
+        abs_value = sim.memory[pos + s.IDX_INT] / 256.0
+        sign = sim.memory[pos + s.IDX_SGN]
+        self.assertIn(sign, (0, 1))
+        return -abs_value if sign else abs_value
+
+    def test_profile_1(self):
+        with self.assertRaisesRegex(ValueError, "unknown profile"):
+            s.set_profile("nibble")
+        with s.use_profile(s.PROFILE_WIDE):
+            self.assertEqual(s.get_profile(), s.PROFILE_WIDE)
+            wide = s.push_decimal(1.5)
+        self.assertEqual(s.get_profile(), s.PROFILE_BYTE)
+        # キャッシュはプロファイルごと
+        self.assertNotEqual(s.push_decimal(1.5), wide)
+
+    def test_profile_2(self):
+        # 2byte/4byteのセルで、1byteのセルと同じ結果になる
+        pairs = [(2.0, -4.25), (0.0, 3.5), (-1.5, -1.5), (0.5, 1 / 256),
+                 (0.75, -0.3), (-1.25, 1.25), (1.0, 0.0), (-0.0625, 3.0),
+                 # 乗算で整数部が 256 以上になる(回り込む)
+                 (-94.453125, -121.26171875), (112.25, 4.79),
+                 (75.33, -50.89)]
+        operations = [s.add_decimal, s.sub_decimal, s.multi_decimal]
+        for (a, b) in pairs:
+            for operation in operations:
+                source = c.block_of(
+                    s.push_decimal(a), s.push_decimal(b), operation())
+                sim = BfSim(source, size=256)
+                while not sim.is_stopped():
+                    sim.run(1000000)
+                expected = self.getFloat(sim, 0)
+                for cell_size in (2, 4):
+                    with s.use_profile(s.PROFILE_WIDE):
+                        source = c.block_of(
+                            s.push_decimal(a), s.push_decimal(b), operation())
+                    sim = BfSim(source, size=256, cell_size=cell_size,
+                                engine="ir")
+                    while not sim.is_stopped():
+                        sim.run(1000000)
+                    self.assertEqual(sim.pointer, 4)
+                    self.assertEqual(list(sim.memory[4:]), [0] * 252)
+                    self.assertEqual(self.getWide(sim, 0), expected,
+                                     (a, b, operation.__name__, cell_size))
+
+    def test_profile_3(self):
+        # 比較と、回り込みを使わない1byte整数/文字列
+        with s.use_profile(s.PROFILE_WIDE):
+            source = c.block_of(
+                s.push_byte(200),
+                s.push_decimal(-0.5),
+                s.push_decimal(0.25),
+                s.if_lt_decimal(s.put_str("\x1b[31mlt"), s.put_str("ge")),
+                s.push_decimal(1.5),
+                s.push_decimal(1.5),
+                s.if_gt_decimal(s.put_str("gt"), s.put_str("le"))
+            )
+        out = io.StringIO()
+        sim = BfSim(source, stdout=out, cell_size=4, engine="ir")
+        while not sim.is_stopped():
+            sim.run(1000000)
+        self.assertEqual(out.getvalue(), "\x1b[31mltle")
+        self.assertEqual(self.getByte(sim, 0), 200)
+        self.assertEqual(list(sim.memory[4:64]), [0] * 60)
+        self.assertEqual(sim.pointer, 4)
+
 
 if __name__ == '__main__':
     unittest.main()